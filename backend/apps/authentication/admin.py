@@ -34,6 +34,10 @@ class UserAdmin(BaseUserAdmin):
     
     readonly_fields = ('created_at', 'updated_at', 'last_login_at')
     # Note: roles use through model (UserRole), so filter_horizontal is not applicable
+    
+    def get_queryset(self, request):
+        """Prefetch roles so the is_admin column does not query per row."""
+        return super().get_queryset(request).prefetch_related('roles')
 
 
 @admin.register(Role)
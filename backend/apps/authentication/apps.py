@@ -8,5 +8,4 @@ class AuthenticationConfig(AppConfig):
     
     def ready(self):
         """Import signals when app is ready"""
-        # import apps.authentication.signals  # Uncomment when signals are created
-        pass
+        import apps.authentication.signals  # noqa: F401
@@ -0,0 +1,25 @@
+"""
+Authentication classes.
+
+US-02: Login
+"""
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class QueryParamJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication from the `access_token` query parameter.
+    
+    Only for endpoints consumed by browser EventSource, which cannot send an
+    Authorization header. The token ends up in access logs, so keep access
+    tokens short-lived and do not enable this class globally.
+    """
+    
+    def authenticate(self, request):
+        raw_token = request.query_params.get('access_token')
+        if not raw_token:
+            return None
+        
+        validated_token = self.get_validated_token(raw_token)
+        return self.get_user(validated_token), validated_token
@@ -0,0 +1,43 @@
+"""
+Management command to rebuild the user_metrics table from scratch.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.authentication.services import UserMetricsService
+
+
+class Command(BaseCommand):
+    help = 'Recompute UserMetrics for every user (or the given users) from resources, versions and votes'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            action='append',
+            dest='user_ids',
+            metavar='USER_ID',
+            help='Only rebuild this user (repeatable)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Users per aggregate/upsert batch (default: 1000)',
+        )
+    
+    def handle(self, *args, **options):
+        """Recompute metrics in batches and upsert them."""
+        started = time.monotonic()
+        
+        with transaction.atomic():
+            written = UserMetricsService.rebuild(
+                user_ids=options['user_ids'],
+                batch_size=options['batch_size']
+            )
+        
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Rebuilt metrics for {written} user(s) in {elapsed:.1f}s')
+        )
@@ -0,0 +1,38 @@
+"""
+Management command to refresh the contributor leaderboard (user_rankings).
+
+Meant to run periodically (e.g. every 10 minutes from cron):
+    python manage.py refresh_leaderboard
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from apps.authentication.services import LeaderboardService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the contributor rankings served by GET /api/users/leaderboard/'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--window',
+            action='append',
+            dest='windows',
+            choices=LeaderboardService.WINDOWS,
+            help='Only refresh this window (repeatable, default: all windows)',
+        )
+    
+    def handle(self, *args, **options):
+        """Rewrite the ranking table and report the rows per leaderboard."""
+        started = time.monotonic()
+        
+        written = LeaderboardService.refresh(windows=options['windows'])
+        
+        for (metric, window), count in written.items():
+            self.stdout.write(f'→ {metric}/{window}: {count} ranked user(s)')
+        
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Leaderboard refreshed in {elapsed:.1f}s')
+        )
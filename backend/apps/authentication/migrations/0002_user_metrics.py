@@ -0,0 +1,40 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authentication", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserMetrics",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="metrics",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("total_resources", models.IntegerField(default=0, verbose_name="total resources")),
+                ("validated_resources", models.IntegerField(default=0, verbose_name="validated resources")),
+                ("total_votes", models.IntegerField(default=0, verbose_name="total votes")),
+                ("total_reuses", models.IntegerField(default=0, verbose_name="total reuses")),
+                ("total_impact", models.IntegerField(default=0, verbose_name="total impact")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="updated at")),
+            ],
+            options={
+                "verbose_name": "user metrics",
+                "verbose_name_plural": "user metrics",
+                "db_table": "user_metrics",
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:40
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authentication", "0002_user_metrics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserRanking",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[("impact", "Impact"), ("votes", "Votes"), ("reuses", "Reuses")],
+                        max_length=10,
+                        verbose_name="metric",
+                    ),
+                ),
+                (
+                    "window",
+                    models.CharField(
+                        choices=[("30d", "Last 30 days"), ("all", "All time")], max_length=5, verbose_name="window"
+                    ),
+                ),
+                ("score", models.IntegerField(verbose_name="score")),
+                ("rank", models.IntegerField(verbose_name="rank")),
+                ("computed_at", models.DateTimeField(verbose_name="computed at")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rankings",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "user ranking",
+                "verbose_name_plural": "user rankings",
+                "db_table": "user_rankings",
+                "ordering": ["metric", "window", "rank"],
+                "indexes": [models.Index(fields=["metric", "window", "rank"], name="ranking_top_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="userranking",
+            constraint=models.UniqueConstraint(fields=("metric", "window", "user"), name="unique_ranking_per_user"),
+        ),
+    ]
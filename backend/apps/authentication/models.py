@@ -11,6 +11,7 @@ from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, Permis
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from apps.authentication.roles import get_role_names
 
 
 class UserManager(BaseUserManager):
@@ -82,9 +83,27 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name_plural = _('users')
         ordering = ['-created_at']
     
+    # Fields shown wherever the user is embedded as a resource `owner` (UserSerializer)
+    OWNER_PAYLOAD_FIELDS = frozenset({'email', 'name', 'is_active', 'email_verified_at', 'is_superuser'})
+    
     def __str__(self):
         return self.email
     
+    def save(self, *args, **kwargs):
+        """Override save to drop cached resource payloads embedding this user when public fields change."""
+        update_fields = kwargs.get('update_fields')
+        changes_payload = not self._state.adding and (
+            update_fields is None or not self.OWNER_PAYLOAD_FIELDS.isdisjoint(update_fields)
+        )
+        if changes_payload and update_fields is not None:
+            # updated_at feeds the resource HTTP validators (ETag / Last-Modified)
+            kwargs['update_fields'] = {*update_fields, 'updated_at'}
+        super().save(*args, **kwargs)
+        
+        if changes_payload:
+            from apps.resources.cache import invalidate_owner_resources
+            invalidate_owner_resources(self.pk)
+    
     @property
     def is_email_verified(self):
         """Check if email is verified."""
@@ -92,12 +111,21 @@ class User(AbstractBaseUser, PermissionsMixin):
     
     @property
     def is_admin(self):
-        """Check if user has Admin role."""
-        return self.roles.filter(name='Admin').exists() or self.is_superuser
+        """Check if user has Admin role (prefetched roles or role cache, see roles.py)."""
+        return self.is_superuser or 'Admin' in get_role_names(self)
     
     def has_role(self, role_name):
-        """Check if user has a specific role."""
-        return self.roles.filter(name=role_name).exists()
+        """Check if user has a specific role (prefetched roles or role cache, see roles.py)."""
+        return role_name in get_role_names(self)
+    
+    def has_admin_access(self):
+        """
+        Check admin rights for a permission decision.
+        
+        Always reads user_roles: the role cache behind is_admin may lag a
+        revocation for up to ROLE_CACHE_TIMEOUT, which is fine for display only.
+        """
+        return self.is_superuser or self.roles.filter(name='Admin').exists()
 
 
 class Role(models.Model):
@@ -142,3 +170,101 @@ class UserRole(models.Model):
     
     def __str__(self):
         return f'{self.user.email} - {self.role.name}'
+
+
+class UserMetrics(models.Model):
+    """
+    Contribution counters shown on profile pages.
+    
+    Maintained incrementally by the write paths (resource create/soft-delete,
+    validate, fork, vote toggle) through UserMetricsService.apply(), and
+    rebuilt from scratch with `manage.py rebuild_user_metrics`.
+    
+    total_impact = validated_resources * 10 + total_votes + total_reuses * 5
+    """
+    
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='metrics'
+    )
+    total_resources = models.IntegerField(_('total resources'), default=0)
+    validated_resources = models.IntegerField(_('validated resources'), default=0)
+    total_votes = models.IntegerField(_('total votes'), default=0)
+    total_reuses = models.IntegerField(_('total reuses'), default=0)
+    total_impact = models.IntegerField(_('total impact'), default=0)
+    
+    updated_at = models.DateTimeField(_('updated at'), auto_now=True)
+    
+    class Meta:
+        db_table = 'user_metrics'
+        verbose_name = _('user metrics')
+        verbose_name_plural = _('user metrics')
+    
+    def __str__(self):
+        return f'{self.user_id} (impact {self.total_impact})'
+    
+    def as_dict(self):
+        """Metrics as returned by the profile endpoint."""
+        return {
+            'total_resources': self.total_resources,
+            'validated_resources': self.validated_resources,
+            'total_votes': self.total_votes,
+            'total_reuses': self.total_reuses,
+            'total_impact': self.total_impact,
+        }
+
+
+class UserRanking(models.Model):
+    """
+    Precomputed contributor leaderboard entry.
+    
+    One row per (metric, window, user) with a positive score, rewritten by
+    `manage.py refresh_leaderboard`. Ranks are stored so that both top-K
+    (metric, window, rank) and "rank of user X" (metric, window, user) are
+    index lookups.
+    """
+    
+    METRIC_IMPACT = 'impact'
+    METRIC_VOTES = 'votes'
+    METRIC_REUSES = 'reuses'
+    METRIC_CHOICES = [
+        (METRIC_IMPACT, _('Impact')),
+        (METRIC_VOTES, _('Votes')),
+        (METRIC_REUSES, _('Reuses')),
+    ]
+    
+    WINDOW_30D = '30d'
+    WINDOW_ALL = 'all'
+    WINDOW_CHOICES = [
+        (WINDOW_30D, _('Last 30 days')),
+        (WINDOW_ALL, _('All time')),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    metric = models.CharField(_('metric'), max_length=10, choices=METRIC_CHOICES)
+    window = models.CharField(_('window'), max_length=5, choices=WINDOW_CHOICES)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='rankings'
+    )
+    score = models.IntegerField(_('score'))
+    rank = models.IntegerField(_('rank'))
+    computed_at = models.DateTimeField(_('computed at'))
+    
+    class Meta:
+        db_table = 'user_rankings'
+        verbose_name = _('user ranking')
+        verbose_name_plural = _('user rankings')
+        ordering = ['metric', 'window', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['metric', 'window', 'user'], name='unique_ranking_per_user'),
+        ]
+        indexes = [
+            models.Index(fields=['metric', 'window', 'rank'], name='ranking_top_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.metric}/{self.window} #{self.rank}: {self.user_id} ({self.score})'
@@ -0,0 +1,88 @@
+"""
+Role resolution for users (RBAC, see ADR-003).
+
+User.is_admin and User.has_role() read role names from, in order:
+1. the instance's prefetched roles (prefetch_related('roles') / 'owner__roles'),
+2. names already resolved for this instance,
+3. the default cache (ROLE_CACHE_TIMEOUT seconds), filled with one query.
+
+Role assignments and role changes invalidate the cache (see signals.py). The
+cache is shared by every process in production (Redis) but per-process with
+locmem, and prefetched or memoized names can be stale too, so these values
+are for serialization only: permission decisions use User.has_admin_access(),
+which always reads user_roles.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+KEY_PREFIX = 'auth:roles'
+GENERATION_KEY = f'{KEY_PREFIX}:generation'
+
+# Per-instance memo attribute (dropped when the user's roles change)
+INSTANCE_ATTR = '_role_names'
+
+
+def get_role_timeout():
+    """Seconds resolved role names are kept in the cache."""
+    return getattr(settings, 'ROLE_CACHE_TIMEOUT', 60)
+
+
+def _generation():
+    return cache.get_or_set(GENERATION_KEY, lambda: uuid.uuid4().hex, timeout=None)
+
+
+def _user_key(user_id):
+    return f'{KEY_PREFIX}:{_generation()}:{user_id}'
+
+
+def get_role_names(user):
+    """
+    Return the names of the roles assigned to a user.
+    
+    Args:
+        user (User): Saved user instance
+    
+    Returns:
+        frozenset: Role names (e.g. {'Admin', 'User'})
+    """
+    prefetched = getattr(user, '_prefetched_objects_cache', {}).get('roles')
+    if prefetched is not None:
+        return frozenset(role.name for role in prefetched)
+    
+    names = user.__dict__.get(INSTANCE_ATTR)
+    if names is None:
+        key = _user_key(user.pk)
+        names = cache.get(key)
+        if names is None:
+            names = frozenset(user.roles.values_list('name', flat=True))
+            cache.set(key, names, timeout=get_role_timeout())
+        setattr(user, INSTANCE_ATTR, names)
+    
+    return names
+
+
+def forget_instance_roles(user):
+    """Drop the role names memoized on a user instance."""
+    user.__dict__.pop(INSTANCE_ATTR, None)
+
+
+def invalidate_user_roles(*user_ids):
+    """
+    Drop cached role names of the given users.
+    
+    Deletes immediately and again after commit, so readers that cached
+    pre-commit data in between are invalidated too.
+    """
+    keys = [_user_key(user_id) for user_id in user_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_all_roles():
+    """Drop every cached role set (a role was renamed or deleted)."""
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+    transaction.on_commit(lambda: cache.set(GENERATION_KEY, uuid.uuid4().hex, timeout=None))
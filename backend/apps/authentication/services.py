@@ -8,13 +8,14 @@ US-02: Login
 """
 
 import secrets
+from datetime import timedelta
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
 from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
+from django.db.models import Count, F, Sum
 from rest_framework_simplejwt.tokens import RefreshToken
-from apps.authentication.models import Role, UserRole
+from apps.authentication.models import Role, UserMetrics, UserRanking, UserRole
 
 User = get_user_model()
 
@@ -70,7 +71,7 @@ class AuthService:
     @staticmethod
     def send_verification_email(user, verification_token):
         """
-        Send email verification link to user.
+        Queue the email verification link for the user (see apps/outbox).
         
         Args:
             user (User): User instance
@@ -96,13 +97,9 @@ BioAI Hub
 Centro de Ciencias Genómicas (CCG), UNAM
         """.strip()
         
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        # Sent by the outbox worker after commit: SMTP latency or outages never fail the request
+        from apps.outbox.services import OutboxService
+        OutboxService.enqueue_email(subject, message, [user.email])
     
     @staticmethod
     @transaction.atomic
@@ -184,3 +181,378 @@ Centro de Ciencias Genómicas (CCG), UNAM
             'access': str(refresh.access_token),
             'refresh': str(refresh),
         }
+
+
+class UserMetricsService:
+    """
+    Service layer for per-user contribution metrics (UserMetrics).
+    
+    Write paths report deltas with apply(); rows missing for a user are
+    (re)computed from the source tables on first use.
+    """
+    
+    VALIDATED_WEIGHT = 10
+    VOTE_WEIGHT = 1
+    REUSE_WEIGHT = 5
+    
+    @staticmethod
+    def impact(validated=0, votes=0, reuses=0):
+        """Impact formula shared by profiles and rankings."""
+        return (
+            validated * UserMetricsService.VALIDATED_WEIGHT
+            + votes * UserMetricsService.VOTE_WEIGHT
+            + reuses * UserMetricsService.REUSE_WEIGHT
+        )
+    
+    @staticmethod
+    def apply(user_id, resources=0, validated=0, votes=0, reuses=0):
+        """
+        Add deltas to a user's metrics with a single UPDATE.
+        
+        Args:
+            user_id (UUID): User whose metrics change
+            resources (int): Change in live resources
+            validated (int): Change in validated resources
+            votes (int): Change in votes received
+            reuses (int): Change in forks received
+        """
+        updated = UserMetrics.objects.filter(user_id=user_id).update(
+            total_resources=F('total_resources') + resources,
+            validated_resources=F('validated_resources') + validated,
+            total_votes=F('total_votes') + votes,
+            total_reuses=F('total_reuses') + reuses,
+            total_impact=F('total_impact') + UserMetricsService.impact(validated, votes, reuses),
+            updated_at=timezone.now(),
+        )
+        
+        if not updated:
+            # No row yet: compute from scratch (already includes this change)
+            UserMetricsService.rebuild(user_ids=[user_id])
+    
+    @staticmethod
+    def compute(user_ids):
+        """
+        Compute metrics from the source tables.
+        
+        Args:
+            user_ids (list): Users to compute
+        
+        Returns:
+            dict: {user_id: {'total_resources', 'validated_resources',
+                'total_votes', 'total_reuses'}} for users with live resources
+        """
+        from apps.interactions.models import Vote
+        from apps.resources.models import Resource
+        
+        live = Resource.objects.filter(owner_id__in=user_ids, deleted_at__isnull=True)
+        metrics = {}
+        
+        def row(user_id):
+            return metrics.setdefault(user_id, {
+                'total_resources': 0,
+                'validated_resources': 0,
+                'total_votes': 0,
+                'total_reuses': 0,
+            })
+        
+        for owner_id, total, reuses in live.values('owner_id').annotate(
+            total=Count('id'),
+            reuses=Sum('forks_count')
+        ).values_list('owner_id', 'total', 'reuses'):
+            row(owner_id).update(total_resources=total, total_reuses=reuses or 0)
+        
+        for owner_id, validated in live.filter(
+            latest_version__status='Validated'
+        ).values('owner_id').annotate(validated=Count('id')).values_list('owner_id', 'validated'):
+            row(owner_id)['validated_resources'] = validated
+        
+        for owner_id, votes in Vote.objects.filter(
+            resource__owner_id__in=user_ids,
+            resource__deleted_at__isnull=True
+        ).values('resource__owner_id').annotate(votes=Count('id')).values_list('resource__owner_id', 'votes'):
+            row(owner_id)['total_votes'] = votes
+        
+        return metrics
+    
+    @staticmethod
+    def rebuild(user_ids=None, batch_size=1000):
+        """
+        Recompute and upsert metrics rows.
+        
+        Args:
+            user_ids (list, optional): Users to rebuild (default: every user)
+            batch_size (int): Users per compute/upsert batch
+        
+        Returns:
+            int: Number of rows written
+        """
+        if user_ids is None:
+            user_ids = User.objects.order_by('id').values_list('id', flat=True).iterator(chunk_size=batch_size)
+        
+        written = 0
+        batch = []
+        for user_id in user_ids:
+            batch.append(user_id)
+            if len(batch) >= batch_size:
+                written += UserMetricsService._upsert(batch)
+                batch = []
+        if batch:
+            written += UserMetricsService._upsert(batch)
+        
+        return written
+    
+    @staticmethod
+    def _upsert(user_ids):
+        computed = UserMetricsService.compute(user_ids)
+        rows = []
+        for user_id in user_ids:
+            values = computed.get(user_id, {})
+            metrics = UserMetrics(user_id=user_id, **values)
+            metrics.total_impact = UserMetricsService.impact(
+                metrics.validated_resources,
+                metrics.total_votes,
+                metrics.total_reuses
+            )
+            rows.append(metrics)
+        
+        UserMetrics.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=[
+                'total_resources',
+                'validated_resources',
+                'total_votes',
+                'total_reuses',
+                'total_impact',
+                'updated_at',
+            ],
+        )
+        return len(rows)
+    
+    @staticmethod
+    def get_for_user(user):
+        """
+        Return a user's metrics row, computing it if it does not exist yet.
+        
+        Args:
+            user (User): User (ideally fetched with select_related('metrics'))
+        
+        Returns:
+            UserMetrics: Metrics row
+        """
+        try:
+            return user.metrics
+        except UserMetrics.DoesNotExist:
+            UserMetricsService.rebuild(user_ids=[user.id])
+            return UserMetrics.objects.get(user_id=user.id)
+
+
+class LeaderboardService:
+    """
+    Service layer for the contributor leaderboard (UserRanking).
+    
+    Scores use the same formula as UserMetricsService.impact(). The ranking
+    table is rewritten by refresh() (`manage.py refresh_leaderboard`, run
+    periodically); reads never aggregate votes or forks.
+    """
+    
+    METRICS = (UserRanking.METRIC_IMPACT, UserRanking.METRIC_VOTES, UserRanking.METRIC_REUSES)
+    WINDOWS = (UserRanking.WINDOW_30D, UserRanking.WINDOW_ALL)
+    WINDOW_DAYS = {UserRanking.WINDOW_30D: 30}
+    
+    @staticmethod
+    def validate(metric, window):
+        """
+        Check a (metric, window) pair.
+        
+        Raises:
+            ValueError: If the metric or the window is unknown
+        """
+        if metric not in LeaderboardService.METRICS:
+            raise ValueError(f'Unknown metric: {metric}')
+        if window not in LeaderboardService.WINDOWS:
+            raise ValueError(f'Unknown window: {window}')
+    
+    @staticmethod
+    def compute_scores(window, now=None):
+        """
+        Compute every metric of a window from the source tables.
+        
+        'all' reads the UserMetrics counters; bounded windows count votes,
+        forks and validations that happened inside the window.
+        
+        Args:
+            window (str): '30d' or 'all'
+            now (datetime, optional): End of the window (default: now)
+        
+        Returns:
+            dict: {user_id: {'impact': int, 'votes': int, 'reuses': int}}
+            for active users with at least one non-zero metric
+        """
+        from apps.interactions.models import Vote
+        from apps.resources.models import Resource
+        
+        if window == UserRanking.WINDOW_ALL:
+            rows = UserMetrics.objects.filter(user__is_active=True, total_impact__gt=0).values_list(
+                'user_id', 'total_impact', 'total_votes', 'total_reuses'
+            )
+            return {
+                user_id: {'impact': impact, 'votes': votes, 'reuses': reuses}
+                for user_id, impact, votes, reuses in rows
+            }
+        
+        since = (now or timezone.now()) - timedelta(days=LeaderboardService.WINDOW_DAYS[window])
+        counts = {}
+        
+        def add(rows, key):
+            for user_id, value in rows:
+                counts.setdefault(user_id, {'validated': 0, 'votes': 0, 'reuses': 0})[key] = value
+        
+        add(Vote.objects.filter(
+            created_at__gte=since,
+            resource__deleted_at__isnull=True,
+            resource__owner__is_active=True
+        ).values('resource__owner_id').annotate(total=Count('id')).values_list('resource__owner_id', 'total'), 'votes')
+        
+        add(Resource.objects.filter(
+            created_at__gte=since,
+            derived_from_resource__isnull=False,
+            derived_from_resource__deleted_at__isnull=True,
+            derived_from_resource__owner__is_active=True
+        ).values('derived_from_resource__owner_id').annotate(total=Count('id')).values_list(
+            'derived_from_resource__owner_id', 'total'
+        ), 'reuses')
+        
+        add(Resource.objects.filter(
+            deleted_at__isnull=True,
+            owner__is_active=True,
+            latest_version__status='Validated',
+            latest_version__validated_at__gte=since
+        ).values('owner_id').annotate(total=Count('id')).values_list('owner_id', 'total'), 'validated')
+        
+        return {
+            user_id: {
+                'impact': UserMetricsService.impact(value['validated'], value['votes'], value['reuses']),
+                'votes': value['votes'],
+                'reuses': value['reuses'],
+            }
+            for user_id, value in counts.items()
+        }
+    
+    @staticmethod
+    def refresh(windows=None, now=None):
+        """
+        Rewrite the ranking table.
+        
+        Each window is replaced inside one transaction, so readers see either
+        the previous or the new ranking, never a partial one.
+        
+        Args:
+            windows (list, optional): Windows to refresh (default: all)
+            now (datetime, optional): Reference time (default: now)
+        
+        Returns:
+            dict: {(metric, window): number of ranked users}
+        """
+        now = now or timezone.now()
+        written = {}
+        
+        for window in windows or LeaderboardService.WINDOWS:
+            scores = LeaderboardService.compute_scores(window, now=now)
+            
+            with transaction.atomic():
+                UserRanking.objects.filter(window=window).delete()
+                
+                for metric in LeaderboardService.METRICS:
+                    ordered = sorted(
+                        ((value[metric], user_id) for user_id, value in scores.items() if value[metric] > 0),
+                        key=lambda item: (-item[0], str(item[1]))
+                    )
+                    
+                    rows = []
+                    previous_score = None
+                    rank = 0
+                    for position, (score, user_id) in enumerate(ordered, start=1):
+                        if score != previous_score:
+                            # Competition ranking: ties share a rank (1, 2, 2, 4)
+                            rank = position
+                            previous_score = score
+                        rows.append(UserRanking(
+                            metric=metric,
+                            window=window,
+                            user_id=user_id,
+                            score=score,
+                            rank=rank,
+                            computed_at=now
+                        ))
+                    
+                    UserRanking.objects.bulk_create(rows, batch_size=1000)
+                    written[(metric, window)] = len(rows)
+        
+        return written
+    
+    @staticmethod
+    def get_top(metric, window, limit=10):
+        """
+        Return the first `limit` entries of a leaderboard.
+        
+        Args:
+            metric (str): 'impact', 'votes' or 'reuses'
+            window (str): '30d' or 'all'
+            limit (int): Number of entries
+        
+        Returns:
+            list: [{'rank', 'score', 'user': {'id', 'name'}}] ordered by rank
+        
+        Raises:
+            ValueError: If the metric or the window is unknown
+        """
+        LeaderboardService.validate(metric, window)
+        
+        rows = UserRanking.objects.filter(
+            metric=metric,
+            window=window
+        ).order_by('rank', 'user_id').values_list('rank', 'score', 'user_id', 'user__name')[:limit]
+        
+        return [
+            {'rank': rank, 'score': score, 'user': {'id': str(user_id), 'name': name}}
+            for rank, score, user_id, name in rows
+        ]
+    
+    @staticmethod
+    def get_rank(user_id, metric, window):
+        """
+        Return a user's position in a leaderboard.
+        
+        Args:
+            user_id (UUID): User to look up
+            metric (str): 'impact', 'votes' or 'reuses'
+            window (str): '30d' or 'all'
+        
+        Returns:
+            dict: {'rank', 'score'}; rank is None for users without a score
+        
+        Raises:
+            ValueError: If the metric or the window is unknown
+        """
+        LeaderboardService.validate(metric, window)
+        
+        row = UserRanking.objects.filter(
+            metric=metric,
+            window=window,
+            user_id=user_id
+        ).values_list('rank', 'score').first()
+        
+        if row is None:
+            return {'rank': None, 'score': 0}
+        return {'rank': row[0], 'score': row[1]}
+    
+    @staticmethod
+    def get_computed_at(metric, window):
+        """Time of the last refresh of a leaderboard (None if never refreshed)."""
+        return UserRanking.objects.filter(
+            metric=metric,
+            window=window,
+            rank=1
+        ).values_list('computed_at', flat=True).first()
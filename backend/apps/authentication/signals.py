@@ -0,0 +1,63 @@
+"""
+Signal handlers for the authentication app.
+
+Keep the role cache (apps/authentication/roles.py) in sync with role
+assignments and role definitions. Roles are also embedded in resource
+payloads (owner.roles, owner.is_admin), so role changes touch the users'
+updated_at (HTTP validators) and drop their cached resource payloads.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.authentication.models import Role, User, UserRole
+from apps.authentication.roles import forget_instance_roles, invalidate_all_roles, invalidate_user_roles
+
+
+def touch_users(*user_ids):
+    """Bump updated_at and drop cached resource payloads of users whose roles changed."""
+    from apps.resources.cache import invalidate_owner_resources
+    
+    if not user_ids:
+        return
+    User.objects.filter(pk__in=user_ids).update(updated_at=timezone.now())
+    invalidate_owner_resources(*user_ids)
+
+
+@receiver(m2m_changed, sender=User.roles.through)
+def user_roles_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """user.roles.add()/remove()/clear() and role.users.add()/remove()/clear()."""
+    if reverse and action == 'pre_clear':
+        # role.users.clear() does not report which users were affected
+        touch_users(*instance.users.values_list('pk', flat=True))
+    if not action.startswith('post_'):
+        return
+    
+    if not reverse:
+        forget_instance_roles(instance)
+        invalidate_user_roles(instance.pk)
+        touch_users(instance.pk)
+    elif pk_set:
+        invalidate_user_roles(*pk_set)
+        touch_users(*pk_set)
+    else:
+        invalidate_all_roles()
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def user_role_saved_or_deleted(sender, instance, **kwargs):
+    """UserRole.objects.create() / userrole.delete()."""
+    invalidate_user_roles(instance.user_id)
+    touch_users(instance.user_id)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def role_saved_or_deleted(sender, instance, created=False, **kwargs):
+    """Renaming or deleting a role changes the names cached for all its users."""
+    if not created:
+        invalidate_all_roles()
+        # Deletions cascade to UserRole rows, whose own signal touches the users
+        touch_users(*instance.user_roles.values_list('user_id', flat=True))
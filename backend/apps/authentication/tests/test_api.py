@@ -12,6 +12,7 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core import mail
 from apps.authentication.models import Role
+from apps.outbox.services import OutboxService
 
 User = get_user_model()
 
@@ -63,7 +64,9 @@ class TestRegisterAPI:
         assert user.email_verified_at is None
         assert user.verification_token is not None
         
-        # Check email was sent
+        # Check email was queued, then sent by the outbox worker
+        assert len(mail.outbox) == 0
+        OutboxService.process_pending()
         assert len(mail.outbox) == 1
         assert mail.outbox[0].to == [data['email']]
     
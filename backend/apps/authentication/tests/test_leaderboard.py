@@ -0,0 +1,189 @@
+"""
+Tests for the contributor leaderboard (UserRanking / LeaderboardService).
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.authentication.models import Role, UserRanking
+from apps.authentication.services import LeaderboardService
+from apps.interactions.models import Vote
+from apps.interactions.services import VoteService
+from apps.resources.services import ResourceService
+
+User = get_user_model()
+
+RESOURCE_DATA = {
+    'title': 'Leaderboard Prompt',
+    'description': 'A prompt',
+    'type': 'Prompt',
+    'content': 'Content',
+}
+
+
+@pytest.fixture
+def api_client():
+    """Create API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def admin():
+    """Create an admin."""
+    admin_role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+    admin = User.objects.create_user('admin@example.com', 'Admin User', 'pass123')
+    admin.roles.add(admin_role)
+    return admin
+
+
+@pytest.fixture
+def contributors(admin):
+    """
+    Create three contributors:
+    
+    - alice: validated resource with 2 votes  -> impact 12, votes 2
+    - bob: resource with 1 vote and 1 fork    -> impact 6, votes 1, reuses 1
+    - carol: resource with 1 vote and 1 fork  -> impact 6 (tied with bob)
+    """
+    alice = User.objects.create_user('alice@example.com', 'Alice', 'pass123')
+    bob = User.objects.create_user('bob@example.com', 'Bob', 'pass123')
+    carol = User.objects.create_user('carol@example.com', 'Carol', 'pass123')
+    voters = [User.objects.create_user(f'voter{i}@example.com', f'Voter {i}', 'pass123') for i in range(2)]
+    
+    validated = ResourceService.create_resource(alice, RESOURCE_DATA)
+    ResourceService.validate_resource(admin, validated.id)
+    for voter in voters:
+        VoteService.toggle_vote(voter, validated.id)
+    
+    for owner in (bob, carol):
+        resource = ResourceService.create_resource(owner, RESOURCE_DATA)
+        VoteService.toggle_vote(voters[0], resource.id)
+        ResourceService.fork_resource(admin, resource.id)
+    
+    return alice, bob, carol
+
+
+@pytest.mark.django_db
+class TestLeaderboardService:
+    """Tests for ranking computation and refresh."""
+    
+    def test_refresh_ranks_with_shared_ties(self, contributors):
+        """Test impact ranking uses the profile formula and competition ranking."""
+        alice, bob, carol = contributors
+        
+        LeaderboardService.refresh()
+        top = LeaderboardService.get_top('impact', 'all')
+        
+        assert [(entry['rank'], entry['score']) for entry in top] == [(1, 12), (2, 6), (2, 6)]
+        assert top[0]['user'] == {'id': str(alice.id), 'name': 'Alice'}
+        assert {entry['user']['id'] for entry in top[1:]} == {str(bob.id), str(carol.id)}
+    
+    def test_rank_of_user(self, contributors):
+        """Test single-user lookups, including users without a score."""
+        alice, bob, _ = contributors
+        LeaderboardService.refresh()
+        
+        assert LeaderboardService.get_rank(bob.id, 'votes', 'all') == {'rank': 2, 'score': 1}
+        assert LeaderboardService.get_rank(alice.id, 'reuses', 'all') == {'rank': None, 'score': 0}
+    
+    def test_window_only_counts_recent_activity(self, contributors):
+        """Test the 30d window ignores votes older than 30 days."""
+        alice, bob, _ = contributors
+        Vote.objects.filter(resource__owner=alice).update(created_at=timezone.now() - timedelta(days=40))
+        
+        LeaderboardService.refresh()
+        
+        assert LeaderboardService.get_rank(alice.id, 'votes', '30d') == {'rank': None, 'score': 0}
+        assert LeaderboardService.get_rank(alice.id, 'impact', '30d') == {'rank': 1, 'score': 10}
+        assert LeaderboardService.get_rank(bob.id, 'votes', '30d') == {'rank': 1, 'score': 1}
+        assert LeaderboardService.get_rank(alice.id, 'votes', 'all')['score'] == 2
+    
+    def test_refresh_replaces_previous_ranking(self, contributors):
+        """Test stale rows disappear on refresh."""
+        _, bob, _ = contributors
+        LeaderboardService.refresh()
+        bob.is_active = False
+        bob.save()
+        
+        LeaderboardService.refresh()
+        
+        assert not UserRanking.objects.filter(user=bob).exists()
+        assert [entry['rank'] for entry in LeaderboardService.get_top('impact', 'all')] == [1, 2]
+    
+    def test_unknown_metric(self):
+        """Test invalid parameters raise ValueError."""
+        with pytest.raises(ValueError, match='Unknown metric'):
+            LeaderboardService.get_top('downloads', 'all')
+        with pytest.raises(ValueError, match='Unknown window'):
+            LeaderboardService.get_rank(None, 'impact', '7d')
+    
+    def test_refresh_command(self, contributors):
+        """Test the command refreshes the requested window only."""
+        out = StringIO()
+        
+        call_command('refresh_leaderboard', '--window', '30d', stdout=out)
+        
+        assert UserRanking.objects.filter(window='30d').exists()
+        assert not UserRanking.objects.filter(window='all').exists()
+        assert 'impact/30d: 3 ranked user(s)' in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestLeaderboardAPI:
+    """Tests for GET /api/users/leaderboard/."""
+    
+    def test_top_and_user_position(self, api_client, contributors, django_assert_max_num_queries):
+        """Test the endpoint serves the precomputed table with index lookups only."""
+        alice, bob, _ = contributors
+        LeaderboardService.refresh()
+        
+        with django_assert_max_num_queries(3):
+            response = api_client.get(f'/api/users/leaderboard/?metric=votes&limit=1&user={bob.id}')
+        
+        assert response.status_code == 200
+        assert response.data['metric'] == 'votes'
+        assert response.data['window'] == 'all'
+        assert response.data['results'] == [{'rank': 1, 'score': 2, 'user': {'id': str(alice.id), 'name': 'Alice'}}]
+        assert response.data['user'] == {'id': str(bob.id), 'rank': 2, 'score': 1}
+    
+    def test_authenticated_user_position(self, api_client, contributors):
+        """Test the authenticated user's position is included by default."""
+        alice, _, _ = contributors
+        LeaderboardService.refresh()
+        api_client.force_authenticate(user=alice)
+        
+        response = api_client.get('/api/users/leaderboard/')
+        
+        assert response.data['user']['rank'] == 1
+    
+    def test_not_modified_until_refresh(self, api_client, contributors):
+        """Test conditional GET returns 304 until the ranking is refreshed."""
+        LeaderboardService.refresh()
+        etag = api_client.get('/api/users/leaderboard/')['ETag']
+        
+        assert api_client.get('/api/users/leaderboard/', HTTP_IF_NONE_MATCH=etag).status_code == 304
+        
+        LeaderboardService.refresh(now=timezone.now() + timedelta(minutes=10))
+        
+        assert api_client.get('/api/users/leaderboard/', HTTP_IF_NONE_MATCH=etag).status_code == 200
+    
+    def test_invalid_parameters(self, api_client):
+        """Test unknown metrics and malformed user ids are rejected."""
+        response = api_client.get('/api/users/leaderboard/?metric=downloads')
+        
+        assert response.status_code == 400
+        assert response.data['error_code'] == 'INVALID_LEADERBOARD'
+        assert api_client.get('/api/users/leaderboard/?user=nope').data['error_code'] == 'INVALID_USER'
+    
+    def test_empty_before_first_refresh(self, api_client):
+        """Test the endpoint works before the table has been populated."""
+        response = api_client.get('/api/users/leaderboard/?window=30d')
+        
+        assert response.status_code == 200
+        assert response.data['results'] == []
+        assert response.data['computed_at'] is None
@@ -0,0 +1,169 @@
+"""
+Tests for incrementally maintained user metrics (UserMetrics).
+"""
+
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.authentication.models import Role, UserMetrics
+from apps.authentication.services import UserMetricsService
+from apps.interactions.services import VoteService
+from apps.resources.models import Resource
+from apps.resources.services import ResourceService
+
+User = get_user_model()
+
+RESOURCE_DATA = {
+    'title': 'Metrics Prompt',
+    'description': 'A prompt',
+    'type': 'Prompt',
+    'content': 'Content',
+}
+
+
+@pytest.fixture
+def owner():
+    """Create a resource owner."""
+    return User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+
+
+@pytest.fixture
+def other():
+    """Create a second user (voter / forker)."""
+    return User.objects.create_user('other@example.com', 'Other User', 'pass123')
+
+
+@pytest.fixture
+def admin():
+    """Create an admin."""
+    admin_role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+    admin = User.objects.create_user('admin@example.com', 'Admin User', 'pass123')
+    admin.roles.add(admin_role)
+    return admin
+
+
+def _metrics(user):
+    return UserMetrics.objects.get(user=user).as_dict()
+
+
+def _computed(user):
+    """Metrics recomputed from the source tables."""
+    values = UserMetricsService.compute([user.id]).get(user.id, {})
+    values.setdefault('total_resources', 0)
+    values.setdefault('validated_resources', 0)
+    values.setdefault('total_votes', 0)
+    values.setdefault('total_reuses', 0)
+    values['total_impact'] = UserMetricsService.impact(
+        values['validated_resources'], values['total_votes'], values['total_reuses']
+    )
+    return values
+
+
+@pytest.mark.django_db
+class TestUserMetricsService:
+    """Tests for incremental updates from the write paths."""
+    
+    def test_write_paths_keep_metrics_in_sync(self, owner, other, admin):
+        """Test create, validate, vote, fork and soft-delete update the stored row."""
+        resource = ResourceService.create_resource(owner, RESOURCE_DATA)
+        second = ResourceService.create_resource(owner, RESOURCE_DATA)
+        ResourceService.validate_resource(admin, resource.id)
+        VoteService.toggle_vote(other, resource.id)
+        VoteService.toggle_vote(admin, resource.id)
+        VoteService.toggle_vote(admin, resource.id)  # unvote
+        ResourceService.fork_resource(other, resource.id)
+        
+        assert _metrics(owner) == {
+            'total_resources': 2,
+            'validated_resources': 1,
+            'total_votes': 1,
+            'total_reuses': 1,
+            'total_impact': 10 + 1 + 5,
+        }
+        assert _metrics(other)['total_resources'] == 1
+        
+        ResourceService.soft_delete_resource(owner, resource.id)
+        ResourceService.soft_delete_resource(admin, second.id)
+        
+        assert _metrics(owner) == _computed(owner)
+        assert _metrics(owner)['total_resources'] == 0
+        assert _metrics(owner)['total_impact'] == 0
+    
+    def test_missing_row_is_computed_from_history(self, owner, other):
+        """Test a delta on a user without a row computes the full row instead."""
+        resource = ResourceService.create_resource(owner, RESOURCE_DATA)
+        UserMetrics.objects.all().delete()
+        
+        VoteService.toggle_vote(other, resource.id)
+        
+        assert _metrics(owner) == _computed(owner)
+        assert _metrics(owner)['total_votes'] == 1
+    
+    def test_soft_delete_requires_owner_or_admin(self, owner, other):
+        """Test other users cannot delete a resource."""
+        resource = ResourceService.create_resource(owner, RESOURCE_DATA)
+        
+        with pytest.raises(ValueError, match='Only the owner'):
+            ResourceService.soft_delete_resource(other, resource.id)
+    
+    def test_direct_soft_delete_and_restore(self, owner, other):
+        """Test deleted_at set or cleared outside the service (admin, scripts) keeps metrics exact."""
+        resource = ResourceService.create_resource(owner, RESOURCE_DATA)
+        VoteService.toggle_vote(other, resource.id)
+        resource = Resource.objects.get(pk=resource.pk)
+        
+        resource.deleted_at = timezone.now()
+        resource.save()
+        assert _metrics(owner) == _computed(owner)
+        assert _metrics(owner)['total_resources'] == 0
+        
+        # Saving again while deleted does not subtract twice
+        resource.save()
+        assert _metrics(owner)['total_resources'] == 0
+        
+        resource.deleted_at = None
+        resource.save(update_fields=['deleted_at'])
+        assert _metrics(owner) == _computed(owner)
+        assert _metrics(owner)['total_votes'] == 1
+    
+    def test_rebuild_command(self, owner, other):
+        """Test the command recomputes drifted rows and creates missing ones."""
+        resource = ResourceService.create_resource(owner, RESOURCE_DATA)
+        VoteService.toggle_vote(other, resource.id)
+        UserMetrics.objects.filter(user=owner).update(total_votes=99, total_impact=99)
+        UserMetrics.objects.filter(user=other).delete()
+        out = StringIO()
+        
+        call_command('rebuild_user_metrics', '--batch-size', '1', stdout=out)
+        
+        assert _metrics(owner) == _computed(owner)
+        assert _metrics(other) == _computed(other)
+        assert 'Rebuilt metrics for' in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestProfileMetricsAPI:
+    """Tests for GET /api/users/{id}/ metrics."""
+    
+    def test_profile_reads_metrics_row(self, owner, other, django_assert_max_num_queries):
+        """Test the profile returns stored metrics in at most two queries (user + roles)."""
+        resource = ResourceService.create_resource(owner, RESOURCE_DATA)
+        VoteService.toggle_vote(other, resource.id)
+        client = APIClient()
+        
+        with django_assert_max_num_queries(2):
+            response = client.get(f'/api/users/{owner.id}/')
+        
+        assert response.status_code == 200
+        assert response.data['metrics'] == _computed(owner)
+    
+    def test_profile_without_row(self, owner):
+        """Test a user without a metrics row gets zeros (row created on first view)."""
+        response = APIClient().get(f'/api/users/{owner.id}/')
+        
+        assert response.data['metrics']['total_impact'] == 0
+        assert UserMetrics.objects.filter(user=owner).exists()
@@ -0,0 +1,93 @@
+"""
+N+1 guards for user profile endpoints (see assert_constant_queries in conftest.py).
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from apps.authentication.models import Role
+from apps.authentication.services import LeaderboardService, UserMetricsService
+from apps.interactions.models import Vote
+from apps.resources.models import Resource, ResourceVersion
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    """Create API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    """Create a profile owner with the Admin role."""
+    admin_role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+    user = User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+    user.roles.add(admin_role)
+    return user
+
+
+def seed_user_resources(user):
+    """Return a seeder creating resources of `user`, alternating status, each with a vote and a fork."""
+    created = []
+    
+    def seed(count):
+        for _ in range(count):
+            index = len(created)
+            resource = Resource.objects.create(owner=user, source_type='Internal', forks_count=1)
+            ResourceVersion.objects.create(
+                resource=resource,
+                version_number='1.0.0',
+                title=f'Resource {index}',
+                description='Test',
+                type='Prompt',
+                content='Content',
+                status='Validated' if index % 2 else 'Sandbox',
+                is_latest=True
+            )
+            voter = User.objects.create_user(f'voter{index}@example.com', f'Voter {index}', 'pass123')
+            Vote.objects.create(user=voter, resource=resource)
+            created.append(resource)
+    
+    return seed
+
+
+@pytest.mark.django_db
+class TestUserQueryCounts:
+    """Query counts of user endpoints must not grow with the number of rows."""
+    
+    def test_profile(self, assert_constant_queries, api_client, user):
+        """GET /api/users/{id}/"""
+        assert_constant_queries(
+            seed=seed_user_resources(user),
+            request=lambda: api_client.get(f'/api/users/{user.id}/'),
+        )
+    
+    def test_resources(self, assert_constant_queries, api_client, user):
+        """GET /api/users/{id}/resources/"""
+        assert_constant_queries(
+            seed=seed_user_resources(user),
+            request=lambda: api_client.get(f'/api/users/{user.id}/resources/?page_size=100'),
+        )
+    
+    def test_resources_by_status(self, assert_constant_queries, api_client, user):
+        """GET /api/users/{id}/resources/?status=..."""
+        assert_constant_queries(
+            seed=seed_user_resources(user),
+            request=lambda: api_client.get(f'/api/users/{user.id}/resources/?status=Sandbox&page_size=100'),
+        )
+    
+    def test_leaderboard(self, assert_constant_queries, api_client, user):
+        """GET /api/users/leaderboard/"""
+        seed_resources = seed_user_resources(user)
+        
+        def seed(count):
+            seed_resources(count)
+            UserMetricsService.rebuild()
+            LeaderboardService.refresh()
+        
+        assert_constant_queries(
+            seed=seed,
+            request=lambda: api_client.get(f'/api/users/leaderboard/?limit=100&user={user.id}'),
+        )
@@ -0,0 +1,174 @@
+"""
+Tests for cached role resolution (User.is_admin / User.has_role).
+
+ADR-003: RBAC
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from apps.authentication import roles
+from apps.authentication.models import Role, UserRole
+from apps.resources.models import Resource, ResourceVersion
+from apps.resources.serializers import ResourceListSerializer
+from apps.resources.services import ResourceService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def admin_role():
+    """Create the Admin role."""
+    role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+    return role
+
+
+@pytest.fixture
+def user():
+    """Create a test user."""
+    return User.objects.create_user('user@example.com', 'Test User', 'pass123')
+
+
+def _fresh(user):
+    return User.objects.get(pk=user.pk)
+
+
+def _fresh_from_memory(user):
+    """Same user, new instance, without touching the database."""
+    return User(pk=user.pk, is_superuser=user.is_superuser)
+
+
+def _create_resources(count, admin_role):
+    """Create `count` resources, each with its own owner (every other owner is an admin)."""
+    for index in range(count):
+        owner = User.objects.create_user(f'owner{index}@example.com', f'Owner {index}', 'pass123')
+        if index % 2 == 0:
+            owner.roles.add(admin_role)
+        resource = Resource.objects.create(owner=owner, source_type='Internal')
+        ResourceVersion.objects.create(
+            resource=resource,
+            version_number='1.0.0',
+            title=f'Resource {index}',
+            description='Test',
+            type='Prompt',
+            content='Content',
+            is_latest=True
+        )
+
+
+@pytest.mark.django_db
+class TestRoleResolution:
+    """Tests for role lookups without per-call queries."""
+    
+    def test_prefetched_roles_need_no_query(self, user, admin_role, django_assert_num_queries):
+        """Test is_admin/has_role are answered from prefetch_related('roles')."""
+        user.roles.add(admin_role)
+        user = User.objects.prefetch_related('roles').get(pk=user.pk)
+        
+        with django_assert_num_queries(0):
+            assert user.is_admin is True
+            assert user.has_role('Admin') is True
+            assert user.has_role('User') is False
+    
+    def test_roles_are_resolved_once(self, user, admin_role, django_assert_num_queries):
+        """Test the first lookup queries once and later lookups hit the cache."""
+        user.roles.add(admin_role)
+        user = _fresh(user)
+        
+        with django_assert_num_queries(1):
+            assert user.is_admin is True
+            assert user.has_role('Admin') is True
+        
+        with django_assert_num_queries(0):
+            assert _fresh_from_memory(user).is_admin is True
+    
+    def test_superuser_is_admin_without_roles(self, django_assert_num_queries):
+        """Test superusers are admins without a role lookup."""
+        superuser = User.objects.create_superuser('root@example.com', 'Root', 'pass123')
+        
+        with django_assert_num_queries(0):
+            assert superuser.is_admin is True
+    
+    def test_add_and_remove_invalidate(self, user, admin_role):
+        """Test roles.add()/remove() are visible on the same and on new instances."""
+        assert user.is_admin is False
+        
+        user.roles.add(admin_role)
+        assert user.is_admin is True
+        assert _fresh(user).is_admin is True
+        
+        user.roles.remove(admin_role)
+        assert user.is_admin is False
+        assert _fresh(user).is_admin is False
+    
+    def test_reverse_add_and_user_role_rows_invalidate(self, user, admin_role):
+        """Test role.users.add() and direct UserRole writes invalidate the cache."""
+        assert user.is_admin is False
+        
+        admin_role.users.add(user)
+        assert _fresh(user).is_admin is True
+        
+        UserRole.objects.filter(user=user).delete()
+        assert _fresh(user).is_admin is False
+        
+        UserRole.objects.create(user=user, role=admin_role)
+        assert _fresh(user).is_admin is True
+    
+    def test_role_rename_invalidates(self, user, admin_role):
+        """Test renaming a role changes the names of its users."""
+        user.roles.add(admin_role)
+        assert _fresh(user).has_role('Admin') is True
+        
+        admin_role.name = 'Curator'
+        admin_role.save()
+        
+        assert _fresh(user).has_role('Admin') is False
+        assert _fresh(user).has_role('Curator') is True
+    
+    def test_permission_checks_ignore_stale_cache(self, user, admin_role):
+        """Test a revoked admin loses access even while another process still caches the role."""
+        user.roles.add(admin_role)
+        assert _fresh(user).is_admin is True
+        
+        user.roles.remove(admin_role)
+        # What a worker with its own (locmem) cache would still hold
+        cache.set(roles._user_key(user.pk), frozenset({'Admin'}))
+        stale = _fresh(user)
+        
+        assert stale.is_admin is True
+        assert stale.has_admin_access() is False
+        with pytest.raises(ValueError, match='Only administrators'):
+            ResourceService.validate_resource(stale, '00000000-0000-0000-0000-000000000000')
+
+
+@pytest.mark.django_db
+class TestListQueryCount:
+    """Regression tests: listing cost must not grow with the page size."""
+    
+    def _count_queries(self, func):
+        with CaptureQueriesContext(connection) as context:
+            func()
+        return len(context.captured_queries)
+    
+    def test_list_endpoint_is_constant(self, admin_role):
+        """Test GET /api/resources/ issues the same number of queries for 1 and 20 rows."""
+        _create_resources(20, admin_role)
+        client = APIClient()
+        
+        one = self._count_queries(lambda: client.get('/api/resources/?page_size=1'))
+        twenty = self._count_queries(lambda: client.get('/api/resources/?page_size=20'))
+        
+        assert one == twenty
+    
+    def test_list_serializer_is_constant(self, admin_role):
+        """Test ResourceListSerializer reads is_admin from the owner__roles prefetch."""
+        _create_resources(20, admin_role)
+        queryset = ResourceService._build_list_queryset().order_by('-created_at')
+        
+        one = self._count_queries(lambda: ResourceListSerializer(list(queryset[:1]), many=True).data)
+        twenty = self._count_queries(lambda: ResourceListSerializer(list(queryset[:20]), many=True).data)
+        
+        assert one == twenty == 2
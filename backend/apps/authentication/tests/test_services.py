@@ -12,6 +12,7 @@ from django.utils import timezone
 from datetime import timedelta
 from apps.authentication.services import AuthService
 from apps.authentication.models import Role
+from apps.outbox.services import OutboxService
 
 User = get_user_model()
 
@@ -52,7 +53,9 @@ class TestAuthServiceRegister:
         # Check role assignment
         assert user.has_role('User') is True
         
-        # Check email was sent
+        # Check email was queued, then sent by the outbox worker
+        assert len(mail.outbox) == 0
+        OutboxService.process_pending()
         assert len(mail.outbox) == 1
         assert mail.outbox[0].to == [email]
         assert 'Verifica tu email' in mail.outbox[0].subject
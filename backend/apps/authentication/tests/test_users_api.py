@@ -0,0 +1,103 @@
+"""
+API tests for user profile endpoints.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.resources.models import Resource, ResourceVersion
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    """Create API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    """Create the profile owner."""
+    return User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+
+
+def _create_resource(owner, title, resource_status='Sandbox', deleted=False):
+    resource = Resource.objects.create(
+        owner=owner,
+        source_type='Internal',
+        deleted_at=timezone.now() if deleted else None
+    )
+    ResourceVersion.objects.create(
+        resource=resource,
+        version_number='1.0.0',
+        title=title,
+        description='Test',
+        type='Prompt',
+        content='Content',
+        status=resource_status,
+        is_latest=True
+    )
+    return resource
+
+
+@pytest.mark.django_db
+class TestUserResourcesAPI:
+    """Tests for GET /api/users/{id}/resources/"""
+    
+    def test_lists_only_own_live_resources(self, api_client, user):
+        """Test other users' and soft-deleted resources are excluded."""
+        other = User.objects.create_user('other@example.com', 'Other User', 'pass123')
+        _create_resource(user, 'Mine')
+        _create_resource(user, 'Deleted', deleted=True)
+        _create_resource(other, 'Theirs')
+        
+        response = api_client.get(f'/api/users/{user.id}/resources/')
+        
+        assert response.status_code == 200
+        assert response.data['count'] == 1
+        assert [row['latest_version']['title'] for row in response.data['results']] == ['Mine']
+    
+    def test_status_filter_and_pagination(self, api_client, user):
+        """Test the status filter applies to the latest version and pages are counted after filtering."""
+        for index in range(5):
+            _create_resource(user, f'Validated {index}', resource_status='Validated')
+        _create_resource(user, 'Sandbox')
+        
+        first = api_client.get(f'/api/users/{user.id}/resources/?status=Validated&page_size=2')
+        last = api_client.get(f'/api/users/{user.id}/resources/?status=Validated&page_size=2&page=3')
+        
+        assert first.data['count'] == 5
+        assert len(first.data['results']) == 2
+        assert first.data['results'][0]['latest_version']['title'] == 'Validated 4'
+        assert [row['latest_version']['title'] for row in last.data['results']] == ['Validated 0']
+        assert all(row['latest_version']['status'] == 'Validated' for row in first.data['results'])
+    
+    def test_page_and_page_size_are_clamped(self, api_client, user):
+        """Test page < 1 and page_size < 1 fall back to the first page of one item."""
+        _create_resource(user, 'Older')
+        _create_resource(user, 'Newer')
+        
+        for query in ('page=0', 'page=-1', 'page_size=0&page=-3'):
+            response = api_client.get(f'/api/users/{user.id}/resources/?{query}')
+            
+            assert response.status_code == 200
+            assert response.data['page'] == 1
+            assert response.data['results'][0]['latest_version']['title'] == 'Newer'
+        assert len(response.data['results']) == 1
+        assert response.data['page_size'] == 1
+    
+    def test_non_integer_pagination(self, api_client, user):
+        """Test a 400 for non-integer page or page_size."""
+        for query in ('page=abc', 'page_size=1.5'):
+            response = api_client.get(f'/api/users/{user.id}/resources/?{query}')
+            
+            assert response.status_code == 400
+            assert response.data['error_code'] == 'INVALID_PAGINATION'
+    
+    def test_unknown_user(self, api_client):
+        """Test a 404 for unknown users."""
+        response = api_client.get('/api/users/00000000-0000-0000-0000-000000000000/resources/')
+        
+        assert response.status_code == 404
@@ -6,6 +6,9 @@ from apps.authentication import views_users
 app_name = 'users'
 
 urlpatterns = [
+    # Contributor leaderboard
+    path('leaderboard/', views_users.LeaderboardView.as_view(), name='leaderboard'),
+    
     # User profile
     path('<uuid:user_id>/', views_users.UserDetailView.as_view(), name='user-detail'),
     path('<uuid:user_id>/resources/', views_users.UserResourcesView.as_view(), name='user-resources'),
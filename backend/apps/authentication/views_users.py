@@ -1,17 +1,20 @@
 """User profile views"""
 
+import uuid
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Sum
+
+from config.conditional import build_etag, not_modified, set_validators
 
 from apps.authentication.models import User
 from apps.authentication.serializers import UserSerializer
-from apps.resources.models import Resource, ResourceVersion
-from apps.resources.serializers import ResourceListSerializer
-from apps.interactions.models import Vote
+from apps.authentication.services import LeaderboardService, UserMetricsService
+from apps.interactions.services import VoteService
+from apps.resources.services import ResourceService
 
 
 class UserDetailView(APIView):
@@ -20,57 +23,108 @@ class UserDetailView(APIView):
     
     - Public endpoint (no auth required)
     - Returns user basic info + metrics
+    - Metrics are read from the incrementally maintained UserMetrics row
+      (one joined lookup instead of aggregates over the user's history)
     - Used for profile pages
+    - Supports conditional GET (ETag / Last-Modified -> 304 Not Modified)
     """
     permission_classes = [AllowAny]
     
     def get(self, request, user_id):
-        user = get_object_or_404(User, id=user_id, is_active=True)
+        user = get_object_or_404(
+            User.objects.select_related('metrics').prefetch_related('roles'),
+            id=user_id,
+            is_active=True
+        )
+        metrics = UserMetricsService.get_for_user(user)
         
-        # Get user metrics
-        resources = Resource.objects.filter(owner=user, deleted_at__isnull=True)
+        # Validators: every metrics change bumps metrics.updated_at
+        last_modified = max(user.updated_at, metrics.updated_at)
+        etag = build_etag(
+            user.id,
+            sorted(role.id for role in user.roles.all()),
+            user.updated_at.isoformat(),
+            metrics.updated_at.isoformat(),
+            metrics.total_impact,
+        )
+        unchanged = not_modified(request, etag, last_modified)
+        if unchanged is not None:
+            return unchanged
         
-        total_resources = resources.count()
+        # Serialize user data
+        serializer = UserSerializer(user)
+        user_data = serializer.data
         
-        # Count validated resources by checking latest versions
-        validated_resources = ResourceVersion.objects.filter(
-            resource__owner=user,
-            resource__deleted_at__isnull=True,
-            is_latest=True,
-            status='Validated'
-        ).count()
+        # Add metrics
+        # Impact = validated_resources * 10 + total_votes + total_reuses * 5
+        user_data['metrics'] = metrics.as_dict()
         
-        # Total votes received across all user's resources
-        # Use Vote model to count votes
-        total_votes = Vote.objects.filter(
-            resource__owner=user,
-            resource__deleted_at__isnull=True
-        ).count()
+        response = Response(user_data, status=status.HTTP_200_OK)
+        return set_validators(response, etag, last_modified)
+
+
+class LeaderboardView(APIView):
+    """
+    Contributor leaderboard
+    
+    - Public endpoint
+    - ?metric=impact|votes|reuses (default: impact)
+    - ?window=30d|all (default: all)
+    - ?limit= number of entries (default: 10, max: 100)
+    - ?user=<id> also returns that user's position (default: the
+      authenticated user, if any)
+    - Served from the precomputed UserRanking table (refreshed by
+      `manage.py refresh_leaderboard`): index lookups only
+    - Supports conditional GET (ETag / Last-Modified -> 304 Not Modified)
+    """
+    permission_classes = [AllowAny]
+    
+    def get(self, request):
+        metric = request.query_params.get('metric', 'impact')
+        window = request.query_params.get('window', 'all')
+        try:
+            LeaderboardService.validate(metric, window)
+        except ValueError as e:
+            return Response(
+                {'error': str(e), 'error_code': 'INVALID_LEADERBOARD'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Total reuses (forks) received
-        # Use forks_count denormalized field
-        total_reuses = resources.aggregate(
-            total=Sum('forks_count')
-        )['total'] or 0
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 10)), 100))
+        except ValueError:
+            limit = 10
         
-        # Calculate impact (simple formula for MVP)
-        # Impact = validated_resources * 10 + total_votes + total_reuses * 5
-        total_impact = (validated_resources * 10) + total_votes + (total_reuses * 5)
+        user_id = request.query_params.get('user')
+        if user_id:
+            try:
+                user_id = uuid.UUID(user_id)
+            except ValueError:
+                return Response(
+                    {'error': f'Invalid user id: {user_id}', 'error_code': 'INVALID_USER'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        elif request.user.is_authenticated:
+            user_id = request.user.id
         
-        # Serialize user data
-        serializer = UserSerializer(user)
-        user_data = serializer.data
+        # Validators: the ranking only changes when it is refreshed
+        computed_at = LeaderboardService.get_computed_at(metric, window)
+        etag = build_etag(metric, window, limit, user_id, computed_at.isoformat() if computed_at else None)
+        unchanged = not_modified(request, etag, computed_at)
+        if unchanged is not None:
+            return unchanged
         
-        # Add metrics
-        user_data['metrics'] = {
-            'total_resources': total_resources,
-            'validated_resources': validated_resources,
-            'total_votes': total_votes,
-            'total_reuses': total_reuses,
-            'total_impact': total_impact,
+        data = {
+            'metric': metric,
+            'window': window,
+            'computed_at': computed_at,
+            'results': LeaderboardService.get_top(metric, window, limit=limit),
         }
+        if user_id:
+            data['user'] = {'id': str(user_id), **LeaderboardService.get_rank(user_id, metric, window)}
         
-        return Response(user_data, status=status.HTTP_200_OK)
+        response = Response(data, status=status.HTTP_200_OK)
+        return set_validators(response, etag, computed_at)
 
 
 class UserResourcesView(APIView):
@@ -78,53 +132,42 @@ class UserResourcesView(APIView):
     Get user's published resources
     
     - Public endpoint
-    - Returns paginated list of resources
-    - Can filter by status
+    - Returns paginated list of resources (newest first)
+    - Can filter by status (of the latest version)
+    - Filtering and pagination run in the database through
+      ResourceService.list_resources, so the query count is constant
     """
     permission_classes = [AllowAny]
     
     def get(self, request, user_id):
         user = get_object_or_404(User, id=user_id, is_active=True)
         
-        # Get query params
-        resource_status = request.query_params.get('status', None)
-        page = int(request.query_params.get('page', 1))
-        page_size = int(request.query_params.get('page_size', 12))
-        
-        # Base queryset
-        # Note: can't use select_related with 'latest_version' as it's a property, not a FK
-        resources = Resource.objects.filter(
-            owner=user,
-            deleted_at__isnull=True
-        ).prefetch_related('versions').order_by('-created_at')
+        # Get query params (page >= 1, 1 <= page_size <= 100)
+        try:
+            page = max(1, int(request.query_params.get('page', 1)))
+            page_size = max(1, min(int(request.query_params.get('page_size', 12)), 100))
+        except ValueError:
+            return Response(
+                {'error': 'page and page_size must be integers', 'error_code': 'INVALID_PAGINATION'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Filter by status if provided
-        # Note: can't filter by latest_version__status directly, need to do it in Python
-        if resource_status:
-            # Get all resources and filter in Python
-            all_resources = list(resources)
-            resources_filtered = [
-                r for r in all_resources 
-                if r.latest_version and r.latest_version.status == resource_status
-            ]
-            total_count = len(resources_filtered)
-            # Pagination
-            start = (page - 1) * page_size
-            end = start + page_size
-            resources = resources_filtered[start:end]
-        else:
-            # Pagination
-            total_count = resources.count()
-            start = (page - 1) * page_size
-            end = start + page_size
-            resources = resources[start:end]
+        filters = {'owner': user.id}
+        if request.query_params.get('status'):
+            filters['status'] = request.query_params.get('status')
         
-        # Serialize
-        serializer = ResourceListSerializer(resources, many=True)
+        result = ResourceService.list_resources(
+            filters=filters,
+            ordering='-created_at',
+            page=page,
+            page_size=page_size,
+            as_rows=True,
+        )
+        VoteService.mark_user_votes(request.user, result['results'])
         
         return Response({
-            'count': total_count,
+            'count': result['count'],
             'page': page,
             'page_size': page_size,
-            'results': serializer.data
+            'results': result['results']
         }, status=status.HTTP_200_OK)
@@ -8,5 +8,4 @@ class InteractionsConfig(AppConfig):
     
     def ready(self):
         """Import signals when app is ready"""
-        # import apps.interactions.signals  # Uncomment when signals are created
-        pass
+        import apps.interactions.signals  # noqa: F401
@@ -0,0 +1,78 @@
+"""
+Management command to compare notification fan-out paths.
+
+Creates throwaway recipients, notifies them once through the per-row
+NotificationService.create_notification() loop and once through
+create_notifications_bulk(), reports rows/second for each and rolls
+everything back.
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.interactions.models import Notification
+from apps.interactions.services import NotificationService
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark notification fan-out: one INSERT per recipient vs batched bulk_create'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--recipients',
+            type=int,
+            default=2000,
+            help='Number of throwaway recipients (default: 2000)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per INSERT for the bulk path (default: 1000)',
+        )
+    
+    def handle(self, *args, **options):
+        """Time both paths inside a transaction that is rolled back."""
+        count = options['recipients']
+        if count <= 0:
+            self.stdout.write(self.style.WARNING('→ Nothing to benchmark'))
+            return
+        
+        with transaction.atomic():
+            User.objects.bulk_create(
+                [User(email=f'benchmark-{index}@example.invalid', name=f'Benchmark {index}') for index in range(count)],
+                batch_size=options['batch_size']
+            )
+            recipients = User.objects.filter(email__endswith='@example.invalid')
+            self.stdout.write(f'→ {count} recipient(s), batch size {options["batch_size"]}')
+            
+            def per_row():
+                for user in recipients.iterator():
+                    NotificationService.create_notification(user, 'validation_requested', 'Benchmark')
+            
+            def bulk():
+                NotificationService.create_notifications_bulk(
+                    recipients, 'validation_requested', 'Benchmark', batch_size=options['batch_size']
+                )
+            
+            before = self._rows_per_second(per_row, count)
+            Notification.objects.filter(user__in=recipients).delete()
+            after = self._rows_per_second(bulk, count)
+            
+            transaction.set_rollback(True)
+        
+        self.stdout.write(f'  create_notification() loop: {before:,.0f} rows/s')
+        self.stdout.write(f'  create_notifications_bulk(): {after:,.0f} rows/s')
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Bulk fan-out is {after / before:.1f}x faster (changes rolled back)')
+        )
+    
+    @staticmethod
+    def _rows_per_second(func, rows):
+        start = time.perf_counter()
+        func()
+        return rows / (time.perf_counter() - start)
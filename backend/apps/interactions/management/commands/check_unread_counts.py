@@ -0,0 +1,85 @@
+"""
+Management command to check the unread-notification counters (NotificationCounter).
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.interactions.models import NotificationCounter
+from apps.interactions.services import count_unread_by_user
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Compare unread-notification counters with the notifications table and fix drift'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report drifted counters, do not fix them',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Users checked per round trip (default: 1000)',
+        )
+    
+    def handle(self, *args, **options):
+        """Recount unread notifications for every counter and repair mismatches."""
+        batch_size = options['batch_size']
+        user_ids = User.objects.order_by('id').values_list('id', flat=True).iterator(chunk_size=batch_size)
+        
+        checked = 0
+        drifted = 0
+        batch = []
+        for user_id in user_ids:
+            batch.append(user_id)
+            if len(batch) >= batch_size:
+                batch_checked, batch_drifted = self._check_batch(batch, options['dry_run'])
+                checked += batch_checked
+                drifted += batch_drifted
+                batch = []
+        if batch:
+            batch_checked, batch_drifted = self._check_batch(batch, options['dry_run'])
+            checked += batch_checked
+            drifted += batch_drifted
+        
+        self.stdout.write(f'→ {checked} counter(s) checked')
+        if drifted == 0:
+            self.stdout.write(self.style.SUCCESS('\n✓ All unread counters are consistent'))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'\n→ {drifted} counter(s) drifted (dry run)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'\n✓ Repaired {drifted} counter(s)'))
+    
+    def _check_batch(self, user_ids, dry_run):
+        """Check the users that have a counter; return (checked, drifted)."""
+        stored = dict(
+            NotificationCounter.objects.filter(user_id__in=user_ids).values_list('user_id', 'unread_count')
+        )
+        if not stored:
+            return 0, 0
+        
+        actual = count_unread_by_user(stored)
+        drifted = [user_id for user_id, count in stored.items() if count != actual.get(user_id, 0)]
+        for user_id in drifted:
+            self.stdout.write(self.style.WARNING(
+                f'→ {user_id}: stored {stored[user_id]}, actual {actual.get(user_id, 0)}'
+            ))
+        
+        if drifted and not dry_run:
+            self._repair(drifted)
+        
+        return len(stored), len(drifted)
+    
+    def _repair(self, user_ids):
+        """Recount with the counters locked, so concurrent writes queue behind the repair."""
+        with transaction.atomic():
+            counters = list(NotificationCounter.objects.select_for_update().filter(user_id__in=user_ids))
+            actual = count_unread_by_user(user_ids)
+            for counter in counters:
+                counter.unread_count = actual.get(counter.user_id, 0)
+            NotificationCounter.objects.bulk_update(counters, ['unread_count'])
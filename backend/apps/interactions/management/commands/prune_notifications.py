@@ -0,0 +1,73 @@
+"""
+Management command to prune read notifications from the live table.
+
+Meant to run periodically (e.g. nightly from cron):
+
+    python manage.py prune_notifications
+    python manage.py prune_notifications --older-than-days 30 --max-per-user 500 --delete
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from apps.interactions import retention
+
+
+class Command(BaseCommand):
+    help = 'Archive (or delete) old read notifications and enforce per-user caps, in batches'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            default=None,
+            help='Prune read notifications older than this (default: NOTIFICATION_RETENTION_DAYS, 0 = skip)',
+        )
+        parser.add_argument(
+            '--max-per-user',
+            type=int,
+            default=None,
+            help='Keep at most this many notifications per user (default: NOTIFICATION_MAX_PER_USER, 0 = no cap)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per transaction (default: 1000)',
+        )
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='Delete pruned rows instead of moving them to notifications_archive',
+        )
+    
+    def handle(self, *args, **options):
+        """Run the age-based and the per-user pruning passes."""
+        days = options['older_than_days']
+        if days is None:
+            days = retention.get_retention_days()
+        max_per_user = options['max_per_user']
+        if max_per_user is None:
+            max_per_user = retention.get_max_per_user()
+        archive = not options['delete']
+        batch_size = options['batch_size']
+        
+        total = 0
+        if days > 0:
+            self.stdout.write(f'→ Read notifications older than {days} day(s)')
+            total += self._timed(lambda: retention.prune_expired(days, archive=archive, batch_size=batch_size))
+        if max_per_user > 0:
+            self.stdout.write(f'→ Read notifications beyond {max_per_user} per user')
+            total += self._timed(lambda: retention.prune_over_cap(max_per_user, archive=archive, batch_size=batch_size))
+        
+        verb = 'Archived' if archive else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(f'\n✓ {verb} {total} notification(s)'))
+    
+    def _timed(self, func):
+        """Run one pass and report its throughput."""
+        start = time.perf_counter()
+        rows = func()
+        elapsed = time.perf_counter() - start
+        rate = rows / elapsed if elapsed > 0 else 0
+        self.stdout.write(f'  {rows} row(s) in {elapsed:.2f}s ({rate:,.0f} rows/s)')
+        return rows
@@ -0,0 +1,43 @@
+"""
+Management command to repair drift in Resource.votes_count.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F
+from django.utils import timezone
+from apps.resources.models import Resource
+
+
+class Command(BaseCommand):
+    help = 'Recount votes per resource and fix Resource.votes_count where it drifted'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report drifted resources, do not update them',
+        )
+    
+    def handle(self, *args, **options):
+        """Compare stored counters with COUNT(votes) and repair mismatches."""
+        drifted = Resource.objects.annotate(
+            actual_votes=Count('votes')
+        ).exclude(
+            votes_count=F('actual_votes')
+        ).values_list('id', 'votes_count', 'actual_votes')
+        
+        fixed_count = 0
+        for resource_id, stored, actual in drifted.iterator():
+            self.stdout.write(
+                self.style.WARNING(f'→ {resource_id}: stored {stored}, actual {actual}')
+            )
+            if not options['dry_run']:
+                Resource.objects.filter(id=resource_id).update(votes_count=actual, updated_at=timezone.now())
+            fixed_count += 1
+        
+        if fixed_count == 0:
+            self.stdout.write(self.style.SUCCESS('\n✓ All vote counters are consistent'))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'\n→ {fixed_count} resource(s) drifted (dry run)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'\n✓ Repaired {fixed_count} resource(s)'))
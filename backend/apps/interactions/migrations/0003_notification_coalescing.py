@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("interactions", "0002_notification"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="actor_sample",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text='Most recent distinct actors of the merged events ({"id", "name"}, newest first)',
+                verbose_name="actor sample",
+            ),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="event_count",
+            field=models.PositiveIntegerField(
+                default=1, help_text="Number of events merged into this notification", verbose_name="event count"
+            ),
+        ),
+    ]
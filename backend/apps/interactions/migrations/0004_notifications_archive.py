@@ -0,0 +1,56 @@
+# Generated by Django 5.0.1 on 2026-10-18 15:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("interactions", "0003_notification_coalescing"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedNotification",
+            fields=[
+                ("id", models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("resource_validated", "Resource Validated"),
+                            ("resource_forked", "Resource Forked"),
+                            ("validation_requested", "Validation Requested"),
+                        ],
+                        max_length=50,
+                        verbose_name="type",
+                    ),
+                ),
+                ("message", models.TextField(verbose_name="message")),
+                ("resource_id", models.UUIDField(blank=True, null=True, verbose_name="resource id")),
+                ("actor_id", models.UUIDField(blank=True, null=True, verbose_name="actor id")),
+                ("event_count", models.PositiveIntegerField(default=1, verbose_name="event count")),
+                ("read_at", models.DateTimeField(blank=True, null=True, verbose_name="read at")),
+                ("created_at", models.DateTimeField(verbose_name="created at")),
+                ("archived_at", models.DateTimeField(auto_now_add=True, verbose_name="archived at")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_notifications",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "archived notification",
+                "verbose_name_plural": "archived notifications",
+                "db_table": "notifications_archive",
+                "ordering": ["-created_at"],
+                "indexes": [models.Index(fields=["user", "-created_at"], name="notificatio_user_id_081e9f_idx")],
+            },
+        ),
+    ]
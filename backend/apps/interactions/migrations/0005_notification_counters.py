@@ -0,0 +1,56 @@
+# Generated by Django 5.0.1 on 2026-10-18 15:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    """Create a counter for every user with unread notifications."""
+    Notification = apps.get_model("interactions", "Notification")
+    NotificationCounter = apps.get_model("interactions", "NotificationCounter")
+
+    unread = (
+        Notification.objects.filter(read_at__isnull=True)
+        .values("user_id")
+        .annotate(unread=Count("id"))
+        .values_list("user_id", "unread")
+    )
+    NotificationCounter.objects.bulk_create(
+        (NotificationCounter(user_id=user_id, unread_count=count) for user_id, count in unread.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authentication", "0003_user_rankings"),
+        ("interactions", "0004_notifications_archive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationCounter",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="notification_counter",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+                ("unread_count", models.IntegerField(default=0, verbose_name="unread count")),
+            ],
+            options={
+                "verbose_name": "notification counter",
+                "verbose_name_plural": "notification counters",
+                "db_table": "notification_counters",
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,5 @@
 """
-Interaction models: Vote and Notification.
+Interaction models: Vote, Notification, ArchivedNotification and NotificationCounter.
 
 Based on:
 - /docs/data/DATA_MODEL.md (sections 3.6, 3.7)
@@ -65,6 +65,9 @@ class Notification(models.Model):
     - Resource forked (owner)
     - Validation requested (admin)
     
+    High-frequency events (e.g. forks of a popular resource) can be coalesced:
+    see NotificationService.create_notification(coalesce=True).
+    
     US-18: Notificaciones In-App
     """
     
@@ -117,6 +120,20 @@ class Notification(models.Model):
         help_text=_('User who triggered this notification (e.g., who forked the resource)')
     )
     
+    # Coalescing: repeated events of the same type/resource merge into one unread row
+    event_count = models.PositiveIntegerField(
+        _('event count'),
+        default=1,
+        help_text=_('Number of events merged into this notification')
+    )
+    
+    actor_sample = models.JSONField(
+        _('actor sample'),
+        default=list,
+        blank=True,
+        help_text=_('Most recent distinct actors of the merged events ({"id", "name"}, newest first)')
+    )
+    
     # Read status
     read_at = models.DateTimeField(
         _('read at'),
@@ -145,3 +162,75 @@ class Notification(models.Model):
     def is_read(self):
         """Check if notification has been read."""
         return self.read_at is not None
+
+
+class ArchivedNotification(models.Model):
+    """
+    Read notification moved out of the live table by `manage.py prune_notifications`.
+    
+    Compact copy: related resource and actor are kept as plain ids (no
+    foreign keys, no actor sample) so archived rows never block deletes and
+    the live (user, read_at) index only covers current notifications.
+    
+    US-18: Notificaciones In-App
+    """
+    
+    id = models.UUIDField(primary_key=True, editable=False)
+    
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='archived_notifications',
+        verbose_name=_('user')
+    )
+    
+    type = models.CharField(_('type'), max_length=50, choices=Notification.TYPE_CHOICES)
+    message = models.TextField(_('message'))
+    resource_id = models.UUIDField(_('resource id'), null=True, blank=True)
+    actor_id = models.UUIDField(_('actor id'), null=True, blank=True)
+    event_count = models.PositiveIntegerField(_('event count'), default=1)
+    read_at = models.DateTimeField(_('read at'), null=True, blank=True)
+    created_at = models.DateTimeField(_('created at'))
+    archived_at = models.DateTimeField(_('archived at'), auto_now_add=True)
+    
+    class Meta:
+        db_table = 'notifications_archive'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+        verbose_name = _('archived notification')
+        verbose_name_plural = _('archived notifications')
+    
+    def __str__(self):
+        return f"{self.user_id}: {self.type} ({self.created_at})"
+
+
+class NotificationCounter(models.Model):
+    """
+    Denormalized count of a user's unread notifications (the badge on every page).
+    
+    Updated with F() expressions in the same transaction as the notification
+    writes (see NotificationService), so every worker process reads the same
+    exact value. A missing row is recounted from the notifications table on
+    first use; `manage.py check_unread_counts` compares and repairs rows.
+    
+    US-18: Notificaciones In-App
+    """
+    
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='notification_counter',
+        verbose_name=_('user')
+    )
+    unread_count = models.IntegerField(_('unread count'), default=0)
+    
+    class Meta:
+        db_table = 'notification_counters'
+        verbose_name = _('notification counter')
+        verbose_name_plural = _('notification counters')
+    
+    def __str__(self):
+        return f"{self.user_id}: {self.unread_count} unread"
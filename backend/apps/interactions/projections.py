@@ -0,0 +1,37 @@
+"""
+Fast-path notification rows for GET /api/notifications/.
+
+Produces the same items as NotificationSerializer from a single
+values_list() query (resource title read through the latest_version pointer).
+
+US-18: Notificaciones In-App
+"""
+
+from config.projections import Projection, format_datetime, format_uuid
+
+NOTIFICATION = Projection([
+    ('id', 'id', format_uuid),
+    ('type', 'type', None),
+    ('message', 'message', None),
+    ('resource_id', 'resource_id', format_uuid),
+    ('resource_title', 'resource__latest_version__title', None),
+    ('actor_name', 'actor__name', None),
+    ('event_count', 'event_count', None),
+    ('actor_sample', 'actor_sample', None),
+    ('is_read', 'read_at', lambda value: value is not None),
+    ('read_at', 'read_at', format_datetime),
+    ('created_at', 'created_at', format_datetime),
+])
+
+
+def fetch_notifications(queryset):
+    """
+    Evaluate a notification queryset as ready-to-render dicts.
+    
+    Args:
+        queryset (QuerySet): Notification queryset (ordering is kept)
+    
+    Returns:
+        list: Dicts shaped like NotificationSerializer(...).data
+    """
+    return [NOTIFICATION.build(row) for row in queryset.values_list(*NOTIFICATION.lookups)]
@@ -0,0 +1,155 @@
+"""
+Retention for the notifications table.
+
+Read notifications older than NOTIFICATION_RETENTION_DAYS, and read
+notifications beyond a user's NOTIFICATION_MAX_PER_USER newest rows, are
+moved to notifications_archive (or deleted). Candidates are found with a
+keyset scan (`id > last ORDER BY id LIMIT batch_size`) and each batch is
+copied and deleted in its own short transaction, so no lock is held for
+longer than one batch however much there is to prune.
+
+Unread notifications are never pruned, which keeps the cached unread
+counters exact.
+
+US-18: Notificaciones In-App
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.interactions.models import ArchivedNotification, Notification
+
+User = get_user_model()
+
+# Columns copied to notifications_archive
+ARCHIVE_FIELDS = (
+    'id', 'user_id', 'type', 'message', 'resource_id', 'actor_id', 'event_count', 'read_at', 'created_at',
+)
+
+
+def get_retention_days():
+    """Days read notifications stay in the live table (0 disables age-based pruning)."""
+    return getattr(settings, 'NOTIFICATION_RETENTION_DAYS', 90)
+
+
+def get_max_per_user():
+    """Notifications kept per user before older read ones are pruned (0 disables the cap)."""
+    return getattr(settings, 'NOTIFICATION_MAX_PER_USER', 0)
+
+
+def prune_expired(days, archive=True, batch_size=1000, now=None):
+    """
+    Prune read notifications created more than `days` days ago.
+    
+    Args:
+        days (int): Age threshold
+        archive (bool): Copy rows to notifications_archive before deleting them
+        batch_size (int): Rows per transaction
+        now (datetime, optional): Reference time (default: now)
+    
+    Returns:
+        int: Number of notifications pruned
+    """
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+    candidates = Notification.objects.filter(created_at__lt=cutoff, read_at__isnull=False)
+    return _prune(candidates, archive, batch_size)
+
+
+def prune_over_cap(max_per_user, archive=True, batch_size=1000):
+    """
+    Prune read notifications beyond each user's `max_per_user` newest ones.
+    
+    Users are scanned in id batches; only those over the cap are touched,
+    through the (user, -created_at) index.
+    
+    Args:
+        max_per_user (int): Notifications kept per user (unread ones always stay)
+        archive (bool): Copy rows to notifications_archive before deleting them
+        batch_size (int): Users per count query and rows per transaction
+    
+    Returns:
+        int: Number of notifications pruned
+    """
+    pruned = 0
+    for user_id in _users_over_cap(max_per_user, batch_size):
+        notifications = Notification.objects.filter(user_id=user_id)
+        newest_first = notifications.order_by('-created_at', '-id').values_list('created_at', 'id')
+        boundary = list(newest_first[max_per_user - 1:max_per_user])
+        if not boundary:
+            continue
+        created_at, notification_id = boundary[0]
+        
+        # Everything after the boundary in feed order (-created_at, -id)
+        candidates = notifications.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=notification_id),
+            read_at__isnull=False
+        )
+        pruned += _prune(candidates, archive, batch_size)
+    
+    return pruned
+
+
+def _users_over_cap(max_per_user, batch_size):
+    """Yield ids of users with more than `max_per_user` notifications."""
+    user_ids = User.objects.order_by('id').values_list('id', flat=True).iterator(chunk_size=batch_size)
+    
+    batch = []
+    for user_id in user_ids:
+        batch.append(user_id)
+        if len(batch) >= batch_size:
+            yield from _over_cap(batch, max_per_user)
+            batch = []
+    if batch:
+        yield from _over_cap(batch, max_per_user)
+
+
+def _over_cap(user_ids, max_per_user):
+    return list(
+        Notification.objects.filter(user_id__in=user_ids).values('user_id').annotate(
+            total=Count('id')
+        ).filter(total__gt=max_per_user).values_list('user_id', flat=True)
+    )
+
+
+def _prune(candidates, archive, batch_size):
+    """Archive/delete the rows of `candidates` in keyset-ordered batches."""
+    pruned = 0
+    last_id = None
+    while True:
+        page = candidates.order_by('id')
+        if last_id is not None:
+            page = page.filter(id__gt=last_id)
+        ids = list(page.values_list('id', flat=True)[:batch_size])
+        if not ids:
+            break
+        
+        pruned += _prune_batch(candidates, ids, archive)
+        last_id = ids[-1]
+        if len(ids) < batch_size:
+            break
+    
+    return pruned
+
+
+def _prune_batch(candidates, ids, archive):
+    with transaction.atomic():
+        # Re-check the conditions under the row locks; rows locked by a writer are left for the next run
+        rows = list(
+            candidates.filter(id__in=ids).select_for_update(skip_locked=True).values_list(*ARCHIVE_FIELDS)
+        )
+        if not rows:
+            return 0
+        
+        if archive:
+            ArchivedNotification.objects.bulk_create(
+                [ArchivedNotification(**dict(zip(ARCHIVE_FIELDS, row))) for row in rows],
+                ignore_conflicts=True
+            )
+        Notification.objects.filter(id__in=[row[0] for row in rows]).delete()
+    
+    return len(rows)
@@ -49,6 +49,8 @@ class NotificationSerializer(serializers.ModelSerializer):
             'resource_id',
             'resource_title',
             'actor_name',
+            'event_count',
+            'actor_sample',
             'is_read',
             'read_at',
             'created_at'
@@ -7,11 +7,154 @@ US-16: Votar Recurso
 US-18: Notificaciones In-App
 """
 
-from django.db import transaction, IntegrityError
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, QuerySet
 from django.utils import timezone
-from apps.interactions.models import Vote, Notification
+from config.cursors import decode_cursor, encode_cursor
+from config.pubsub import get_broker
+from apps.interactions.models import Vote, Notification, NotificationCounter
+from apps.interactions.projections import fetch_notifications
+from apps.resources import trending
+from apps.resources.cache import invalidate_resource
 from apps.resources.models import Resource
 
+User = get_user_model()
+
+
+def get_user_votes_timeout():
+    """Seconds a user's cached vote set is kept (0 disables the cache)."""
+    return getattr(settings, 'USER_VOTES_CACHE_TIMEOUT', 0)
+
+
+def _user_votes_key(user_id):
+    return f'interactions:voted:{user_id}'
+
+
+def invalidate_user_votes(user_id):
+    """Drop a user's cached vote set now and again after commit."""
+    cache.delete(_user_votes_key(user_id))
+    transaction.on_commit(lambda: cache.delete(_user_votes_key(user_id)))
+
+
+def count_unread_by_user(user_ids):
+    """Count unread notifications in the notifications table; returns {user_id: count} (users with any)."""
+    return dict(
+        Notification.objects.filter(
+            user_id__in=list(user_ids),
+            read_at__isnull=True
+        ).values('user_id').annotate(unread=Count('id')).values_list('user_id', 'unread')
+    )
+
+
+def adjust_unread_counts(user_ids, delta, create_missing=True):
+    """
+    Add `delta` to users' unread counters, in the current transaction.
+    
+    A user listed several times gets the delta once per occurrence. Users
+    without a counter row get one recounted from the notifications table,
+    which already includes this transaction's change.
+    
+    Args:
+        user_ids (list): Recipients of the change
+        delta (int): Change per occurrence
+        create_missing (bool): Create missing counters (False when the change
+            is not in the table yet, e.g. before a delete)
+    """
+    by_occurrences = defaultdict(list)
+    for user_id, occurrences in Counter(user_ids).items():
+        by_occurrences[occurrences].append(user_id)
+    
+    missing = []
+    for occurrences, ids in by_occurrences.items():
+        updated = NotificationCounter.objects.filter(user_id__in=ids).update(
+            unread_count=F('unread_count') + delta * occurrences
+        )
+        if updated < len(ids):
+            missing += ids
+    if missing and create_missing:
+        create_unread_counters(missing)
+
+
+def create_unread_counters(user_ids):
+    """
+    Create the counters missing for `user_ids` from the notifications table.
+    
+    Returns:
+        dict: {user_id: unread count} for the counters created
+    """
+    existing = set(NotificationCounter.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+    missing = [user_id for user_id in user_ids if user_id not in existing]
+    counts = count_unread_by_user(missing)
+    created = {user_id: counts.get(user_id, 0) for user_id in missing}
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id, unread_count=count) for user_id, count in created.items()],
+        ignore_conflicts=True
+    )
+    return created
+
+
+def get_coalesce_window_hours():
+    """Hours during which repeated events merge into one unread notification."""
+    return getattr(settings, 'NOTIFICATION_COALESCE_WINDOW_HOURS', 24)
+
+
+# Distinct actors kept on a coalesced notification
+ACTOR_SAMPLE_SIZE = 3
+
+
+def _actor_sample(sample, actor):
+    """Put `actor` first in an actor sample (deduplicated, capped at ACTOR_SAMPLE_SIZE)."""
+    if actor is None:
+        return sample
+    entry = {'id': str(actor.pk), 'name': actor.name}
+    return ([entry] + [item for item in sample if item['id'] != entry['id']])[:ACTOR_SAMPLE_SIZE]
+
+
+def notification_channel(user_id):
+    """Pub/sub channel carrying a user's notification stream events."""
+    return f'notifications:{user_id}'
+
+
+def publish_notification_event(user_ids, event, build_data):
+    """
+    Push an event to the users' notification streams once the transaction commits.
+    
+    Args:
+        user_ids (iterable): Recipients
+        event (str): Stream event name ('notification', 'unread', 'read')
+        build_data (callable): Returns the JSON payload (called after commit)
+    """
+    channels = [notification_channel(user_id) for user_id in user_ids]
+    
+    def publish():
+        get_broker().publish_many(channels, {'event': event, 'data': build_data()})
+    
+    # robust: a broker failure must not break the request that committed
+    transaction.on_commit(publish, robust=True)
+
+
+def _db_value(model, field_name, value):
+    """Adapt a Python value to a raw SQL parameter for model.field_name."""
+    return model._meta.get_field(field_name).get_db_prep_value(value, connection)
+
+
+def _python_value(model, field_name, value):
+    """Convert a raw SQL result column (e.g. from RETURNING) for model.field_name."""
+    field = model._meta.get_field(field_name)
+    value = (field.target_field if field.is_relation else field).to_python(value)
+    if getattr(value, 'tzinfo', False) is None:
+        # SQLite stores naive UTC
+        value = value.replace(tzinfo=dt_timezone.utc)
+    return value
+
 
 class VoteService:
     """Service layer for vote operations."""
@@ -25,6 +168,13 @@ class VoteService:
         If user has already voted: remove vote (unvote)
         If user hasn't voted: add vote
         
+        Runs as at most three statements (PostgreSQL, SQLite >= 3.35):
+        DELETE ... RETURNING removes an existing vote; otherwise
+        INSERT ... ON CONFLICT DO NOTHING adds one; then a single UPDATE ...
+        RETURNING adjusts votes_count/trending_score and returns the new count
+        (no COUNT(*)). A concurrent duplicate click whose insert loses the
+        race is reported as 'voted' instead of failing.
+        
         Args:
             user (User): The user voting
             resource_id (UUID): The resource ID
@@ -38,29 +188,84 @@ class VoteService:
         Raises:
             ValueError: If resource doesn't exist or is soft-deleted
         """
-        try:
-            resource = Resource.objects.get(id=resource_id, deleted_at__isnull=True)
-        except Resource.DoesNotExist:
+        now = timezone.now()
+        user_value = _db_value(Vote, 'user', user.id)
+        resource_value = _db_value(Vote, 'resource', resource_id)
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'DELETE FROM votes WHERE user_id = %s AND resource_id = %s RETURNING created_at',
+                [user_value, resource_value],
+            )
+            deleted = cursor.fetchone()
+            
+            if deleted:
+                # Unvote
+                action = 'unvoted'
+                delta = -1
+                voted_at = _python_value(Vote, 'created_at', deleted[0])
+            else:
+                # Vote (the unique (user, resource) index settles concurrent clicks)
+                cursor.execute(
+                    """
+                    INSERT INTO votes (id, user_id, resource_id, created_at)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (user_id, resource_id) DO NOTHING
+                    RETURNING id
+                    """,
+                    [
+                        _db_value(Vote, 'id', uuid.uuid4()),
+                        user_value,
+                        resource_value,
+                        _db_value(Vote, 'created_at', now),
+                    ],
+                )
+                action = 'voted'
+                delta = 1 if cursor.fetchone() else 0
+                voted_at = now
+            
+            # Denormalized counter and trending score in one atomic UPDATE (no
+            # read-modify-write); updated_at moves too so HTTP validators see the change.
+            # The score delta is computed for the current epoch and rescaled to the
+            # row's own trending_epoch (trending.lag_factor() in SQL), so it stays
+            # exact if a rebase runs concurrently.
+            epoch = trending.current_epoch(now)
+            cursor.execute(
+                """
+                UPDATE resources
+                SET votes_count = votes_count + %(delta)s,
+                    trending_score = trending_score + %(score)s * POWER(2, CASE
+                        WHEN (%(epoch)s - trending_epoch) / %(half_life)s > %(max_lag)s THEN %(max_lag)s
+                        ELSE (%(epoch)s - trending_epoch) / %(half_life)s
+                    END),
+                    updated_at = %(now)s
+                WHERE id = %(id)s AND deleted_at IS NULL
+                RETURNING votes_count, owner_id
+                """,
+                {
+                    'delta': delta,
+                    'score': trending.event_score(delta * trending.VOTE_WEIGHT, voted_at, epoch),
+                    'epoch': epoch,
+                    'half_life': float(trending.get_half_life_seconds()),
+                    'max_lag': trending.MAX_LAG_HALF_LIVES,
+                    'now': _db_value(Resource, 'updated_at', now),
+                    'id': _db_value(Resource, 'id', resource_id),
+                },
+            )
+            updated = cursor.fetchone()
+        
+        if updated is None:
+            # Rolls back the vote change above
             raise ValueError('Resource not found or has been deleted')
+        votes_count, owner_id = updated
         
-        # Check if user already voted
-        existing_vote = Vote.objects.filter(user=user, resource=resource).first()
-        
-        if existing_vote:
-            # Unvote
-            existing_vote.delete()
-            action = 'unvoted'
-        else:
-            # Vote
-            try:
-                Vote.objects.create(user=user, resource=resource)
-                action = 'voted'
-            except IntegrityError:
-                # Race condition: vote was created between check and create
-                raise ValueError('Vote already exists')
+        invalidate_resource(resource_id)
+        invalidate_user_votes(user.id)
+        transaction.on_commit(trending.ensure_current_epoch, robust=True)
         
-        # Get updated count
-        votes_count = resource.votes.count()
+        if delta:
+            from apps.authentication.services import UserMetricsService
+            UserMetricsService.apply(_python_value(Resource, 'owner', owner_id), votes=delta)
         
         return {
             'action': action,
@@ -83,6 +288,61 @@ class VoteService:
             .values_list('resource_id', flat=True)
         )
     
+    @staticmethod
+    def get_voted_resource_ids(user, resource_ids):
+        """
+        Return which of the given resources a user has voted for.
+        
+        One `resource_id IN (...)` query scoped to the page being rendered.
+        With USER_VOTES_CACHE_TIMEOUT > 0 the user's whole vote set is cached
+        instead (one query per timeout, dropped on every toggle), which saves
+        the query on every page for users who browse and vote a lot.
+        
+        Args:
+            user (User): The user (anonymous users have no votes)
+            resource_ids (iterable): Resource UUIDs (or their string form)
+        
+        Returns:
+            set: UUIDs of the resources the user has voted for
+        """
+        resource_ids = {uuid.UUID(str(resource_id)) for resource_id in resource_ids}
+        if not resource_ids or not user.is_authenticated:
+            return set()
+        
+        timeout = get_user_votes_timeout()
+        if timeout:
+            voted = cache.get(_user_votes_key(user.id))
+            if voted is None:
+                voted = frozenset(Vote.objects.filter(user=user).values_list('resource_id', flat=True))
+                cache.set(_user_votes_key(user.id), voted, timeout)
+            return set(voted & resource_ids)
+        
+        return set(
+            Vote.objects.filter(user=user, resource_id__in=resource_ids)
+            .values_list('resource_id', flat=True)
+        )
+    
+    @staticmethod
+    def mark_user_votes(user, rows):
+        """
+        Set `user_has_voted` on serialized resource rows, in place.
+        
+        Rows without the key (sparse fieldsets) are left untouched.
+        
+        Args:
+            user (User): The requesting user
+            rows (list): Resource dicts with an 'id' (list/detail payloads)
+        
+        Returns:
+            list: The same rows
+        """
+        rows = [row for row in rows if 'user_has_voted' in row]
+        voted_ids = VoteService.get_voted_resource_ids(user, [row['id'] for row in rows])
+        voted = {str(resource_id) for resource_id in voted_ids}
+        for row in rows:
+            row['user_has_voted'] = row['id'] in voted
+        return rows
+    
     @staticmethod
     def has_user_voted(user, resource_id):
         """
@@ -103,30 +363,171 @@ class NotificationService:
     
     @staticmethod
     @transaction.atomic
-    def create_notification(user, notification_type, message, resource=None, actor=None):
+    def create_notification(user, notification_type, message, resource=None, actor=None,
+                            coalesce=False, merged_message=None):
         """
         Create a notification for a user.
         
+        With coalesce=True, an event of the same type and resource as an
+        unread notification of the user created within
+        NOTIFICATION_COALESCE_WINDOW_HOURS is merged into it: event_count is
+        incremented, the actor joins actor_sample (up to ACTOR_SAMPLE_SIZE
+        distinct actors, newest first) and the row moves to the top of the
+        feed. One row per burst instead of one per event, and the unread
+        count does not grow.
+        
         Args:
             user (User): The recipient of the notification
             notification_type (str): Type of notification (resource_validated, resource_forked, etc.)
             message (str): Human-readable message
             resource (Resource, optional): Related resource
             actor (User, optional): User who triggered the notification
+            coalesce (bool): Merge into a recent unread notification of the same type/resource
+            merged_message (callable, optional): Receives the merged event_count and
+                returns the message of a merged row (default: `message`)
         
         Returns:
-            Notification: The created notification
+            Notification: The created (or merged) notification
         
         US-18: Notificaciones In-App
         """
-        notification = Notification.objects.create(
+        notification = None
+        if coalesce:
+            notification = NotificationService._merge_event(
+                user, notification_type, message, resource, actor, merged_message
+            )
+        
+        merged = notification is not None
+        if not merged:
+            notification = Notification.objects.create(
+                user=user,
+                type=notification_type,
+                message=message,
+                resource=resource,
+                actor=actor,
+                actor_sample=_actor_sample([], actor)
+            )
+            adjust_unread_counts([user.pk], 1)
+        
+        publish_notification_event(
+            [user.pk],
+            'notification',
+            lambda: {
+                'notification': fetch_notifications(Notification.objects.filter(pk=notification.pk))[0],
+                'unread_delta': 0 if merged else 1,
+            }
+        )
+        return notification
+    
+    @staticmethod
+    def _merge_event(user, notification_type, message, resource, actor, merged_message):
+        """Fold an event into the user's latest matching unread notification, if any."""
+        now = timezone.now()
+        notification = Notification.objects.select_for_update().filter(
             user=user,
             type=notification_type,
-            message=message,
+            resource=resource,
+            read_at__isnull=True,
+            created_at__gte=now - timedelta(hours=get_coalesce_window_hours())
+        ).order_by('-created_at').first()
+        if notification is None:
+            return None
+        
+        notification.event_count += 1
+        notification.actor = actor
+        notification.actor_sample = _actor_sample(notification.actor_sample, actor)
+        notification.message = merged_message(notification.event_count) if merged_message else message
+        notification.created_at = now
+        notification.save(update_fields=['event_count', 'actor', 'actor_sample', 'message', 'created_at'])
+        return notification
+    
+    @staticmethod
+    @transaction.atomic
+    def create_notifications_bulk(recipients, notification_type, message, resource=None, actor=None,
+                                  batch_size=1000):
+        """
+        Create the same notification for many users with batched INSERTs.
+        
+        Recipients are consumed lazily, `batch_size` at a time (a QuerySet is
+        streamed as ids with iterator()), so memory stays flat no matter how
+        many users are notified. All rows are created in one transaction.
+        
+        Args:
+            recipients (iterable): Users, user ids or a User QuerySet
+            notification_type (str): Type of notification (validation_requested, etc.)
+            message (str): Human-readable message
+            resource (Resource, optional): Related resource
+            actor (User, optional): User who triggered the notification (never notified)
+            batch_size (int): Rows per INSERT
+        
+        Returns:
+            int: Number of notifications created
+        
+        US-18: Notificaciones In-App
+        """
+        if isinstance(recipients, QuerySet):
+            recipients = recipients.values_list('pk', flat=True).iterator(chunk_size=batch_size)
+        
+        resource_id = resource.pk if resource is not None else None
+        actor_id = actor.pk if actor is not None else None
+        actor_sample = _actor_sample([], actor)
+        user_ids = (getattr(recipient, 'pk', recipient) for recipient in recipients)
+        user_ids = (user_id for user_id in user_ids if user_id != actor_id)
+        
+        created = 0
+        while True:
+            batch = [
+                Notification(
+                    user_id=user_id,
+                    type=notification_type,
+                    message=message,
+                    resource_id=resource_id,
+                    actor_id=actor_id,
+                    actor_sample=actor_sample
+                )
+                for user_id in islice(user_ids, batch_size)
+            ]
+            if not batch:
+                break
+            Notification.objects.bulk_create(batch, batch_size=batch_size)
+            created += len(batch)
+            adjust_unread_counts([notification.user_id for notification in batch], 1)
+            # Count bump only: one stream message per batch instead of a payload per recipient
+            publish_notification_event(
+                [notification.user_id for notification in batch],
+                'unread',
+                lambda: {'unread_delta': 1}
+            )
+        
+        return created
+    
+    @staticmethod
+    def notify_admins(notification_type, message, resource=None, actor=None):
+        """
+        Notify every active administrator (superusers and users with the Admin role).
+        
+        Args:
+            notification_type (str): Type of notification (e.g. validation_requested)
+            message (str): Human-readable message
+            resource (Resource, optional): Related resource
+            actor (User, optional): User who triggered the notification (never notified)
+        
+        Returns:
+            int: Number of notifications created
+        
+        US-18: Notificaciones In-App
+        """
+        admins = User.objects.filter(
+            Q(is_superuser=True) | Q(roles__name='Admin'),
+            is_active=True
+        ).distinct()
+        return NotificationService.create_notifications_bulk(
+            admins,
+            notification_type,
+            message,
             resource=resource,
             actor=actor
         )
-        return notification
     
     @staticmethod
     def get_user_notifications(user, unread_only=False):
@@ -142,13 +543,88 @@ class NotificationService:
         
         US-18: Notificaciones In-App
         """
-        notifications = Notification.objects.filter(user=user).select_related('resource', 'actor')
+        notifications = Notification.objects.filter(user=user).select_related('resource__latest_version', 'actor')
         
         if unread_only:
             notifications = notifications.filter(read_at__isnull=True)
         
         return notifications
     
+    @staticmethod
+    def get_feed(user, unread_only=False, cursor=None, since=None, page_size=20):
+        """
+        Get one page of a user's notifications, newest first.
+        
+        Keyset pagination over the (user, -created_at) index: each page is a
+        `created_at < last seen` range scan, so cost and payload size are
+        bounded by page_size however many notifications the user has.
+        
+        Args:
+            user (User): The user
+            unread_only (bool): If True, return only unread notifications
+            cursor (str, optional): Opaque cursor from a previous 'next'
+            since (datetime, optional): Only notifications created after this
+                (incremental polling)
+            page_size (int): Items per page
+        
+        Returns:
+            dict: {
+                'results': Notification dicts (NotificationSerializer shape),
+                'next': Cursor for the next (older) page or None,
+                'has_next': Boolean
+            }
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        
+        US-18: Notificaciones In-App
+        """
+        notifications = NotificationService.get_user_notifications(user, unread_only=unread_only)
+        
+        if since is not None:
+            notifications = notifications.filter(created_at__gt=since)
+        
+        if cursor:
+            try:
+                payload = decode_cursor(cursor)
+                created_at = datetime.fromisoformat(payload['v'])
+                notification_id = uuid.UUID(payload['id'])
+            except (ValueError, KeyError, TypeError):
+                raise ValueError('Invalid cursor')
+            notifications = notifications.filter(
+                Q(created_at__lt=created_at)
+                | Q(created_at=created_at, id__lt=notification_id)
+            )
+        
+        # Fetch one extra row to know whether there is another page
+        rows = fetch_notifications(notifications.order_by('-created_at', '-id')[:page_size + 1])
+        has_next = len(rows) > page_size
+        results = rows[:page_size]
+        
+        return {
+            'results': results,
+            'next': encode_cursor({'v': results[-1]['created_at'], 'id': results[-1]['id']}) if has_next else None,
+            'has_next': has_next,
+        }
+    
+    @staticmethod
+    def get_counts(user):
+        """
+        Get total and unread notification counts in a single query.
+        
+        Args:
+            user (User): The user
+        
+        Returns:
+            dict: {'count': int, 'unread_count': int}
+        
+        US-18: Notificaciones In-App
+        """
+        return Notification.objects.filter(user=user).aggregate(
+            count=Count('id'),
+            unread_count=Count('id', filter=Q(read_at__isnull=True))
+        )
+    
     @staticmethod
     @transaction.atomic
     def mark_as_read(notification_id, user):
@@ -172,10 +648,22 @@ class NotificationService:
         except Notification.DoesNotExist:
             raise ValueError('Notification not found or access denied')
         
-        if notification.read_at is None:
-            notification.read_at = timezone.now()
-            notification.save(update_fields=['read_at'])
-        
+        if notification.read_at is not None:
+            return notification
+        
+        # Conditional UPDATE: of two concurrent requests only one decrements the counter
+        now = timezone.now()
+        if not Notification.objects.filter(pk=notification.pk, read_at__isnull=True).update(read_at=now):
+            notification.refresh_from_db(fields=['read_at'])
+            return notification
+        
+        notification.read_at = now
+        adjust_unread_counts([user.pk], -1)
+        publish_notification_event(
+            [user.pk],
+            'read',
+            lambda: {'notification_id': str(notification.pk), 'unread_delta': -1}
+        )
         return notification
     
     @staticmethod
@@ -197,6 +685,16 @@ class NotificationService:
             read_at__isnull=True
         ).update(read_at=timezone.now())
         
+        if count:
+            # Minus the rows actually updated (not a reset to 0), so notifications
+            # created concurrently stay counted
+            adjust_unread_counts([user.pk], -count)
+            publish_notification_event(
+                [user.pk],
+                'read',
+                lambda: {'notification_id': None, 'unread_delta': -count}
+            )
+        
         return count
     
     @staticmethod
@@ -204,6 +702,12 @@ class NotificationService:
         """
         Get count of unread notifications for a user.
         
+        Read from the user's NotificationCounter row (the badge is on every
+        page), which the write paths keep exact in their own transaction:
+        +1 per new (not merged) notification, -1 on mark_as_read, minus the
+        updated rows on mark_all_as_read. A missing row is recounted once.
+        `manage.py check_unread_counts` compares counters with the table.
+        
         Args:
             user (User): The user
         
@@ -212,4 +716,25 @@ class NotificationService:
         
         US-18: Notificaciones In-App
         """
-        return Notification.objects.filter(user=user, read_at__isnull=True).count()
+        count = NotificationCounter.objects.filter(user_id=user.pk).values_list('unread_count', flat=True).first()
+        if count is None:
+            count = create_unread_counters([user.pk]).get(user.pk)
+            if count is None:
+                # Created concurrently between the two queries
+                return NotificationService.get_unread_count(user)
+        return count
+    
+    @staticmethod
+    def count_unread(user_id):
+        """
+        Count a user's unread notifications in the notifications table (bypasses the counter).
+        
+        Args:
+            user_id (UUID): The user ID
+        
+        Returns:
+            int: Count of unread notifications
+        
+        US-18: Notificaciones In-App
+        """
+        return Notification.objects.filter(user_id=user_id, read_at__isnull=True).count()
@@ -0,0 +1,23 @@
+"""
+Signal handlers for the interactions app.
+
+Keep the unread-notification counters (NotificationCounter) in sync when
+notifications disappear through a CASCADE instead of NotificationService.
+"""
+
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from apps.interactions.models import Notification
+from apps.interactions.services import adjust_unread_counts
+from apps.resources.models import Resource
+
+
+@receiver(pre_delete, sender=Resource)
+def resource_deleted(sender, instance, **kwargs):
+    """Hard-deleting a resource cascades to its notifications: discount the unread ones."""
+    user_ids = list(
+        Notification.objects.filter(resource=instance, read_at__isnull=True).values_list('user_id', flat=True)
+    )
+    if user_ids:
+        adjust_unread_counts(user_ids, -1, create_missing=False)
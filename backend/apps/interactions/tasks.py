@@ -0,0 +1,25 @@
+"""
+Outbox handlers for notifications.
+
+US-18: Notificaciones In-App
+"""
+
+from django.contrib.auth import get_user_model
+from apps.interactions.services import NotificationService
+from apps.outbox.services import handler
+from apps.resources.models import Resource
+
+User = get_user_model()
+
+
+@handler('notifications.notify_admins')
+def notify_admins(payload):
+    """Fan a notification out to every administrator (batched inserts)."""
+    resource_id = payload.get('resource_id')
+    actor_id = payload.get('actor_id')
+    NotificationService.notify_admins(
+        payload['type'],
+        payload['message'],
+        resource=Resource.objects.filter(pk=resource_id).first() if resource_id else None,
+        actor=User.objects.filter(pk=actor_id).first() if actor_id else None
+    )
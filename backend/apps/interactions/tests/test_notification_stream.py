@@ -0,0 +1,291 @@
+"""
+Tests for the notification SSE stream and the pub/sub broker.
+
+US-18: Notificaciones In-App
+"""
+
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from config.pubsub import InMemoryBroker, PostgresBroker
+from apps.authentication.services import AuthService
+from apps.interactions.models import Notification
+from apps.interactions.services import NotificationService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    """Create a test user."""
+    user = User.objects.create_user('stream@example.com', 'Stream User', 'pass123')
+    user.email_verified_at = timezone.now()
+    user.save()
+    return user
+
+
+@pytest.fixture
+def other_user():
+    """Create another user."""
+    return User.objects.create_user('other@example.com', 'Other User', 'pass123')
+
+
+@pytest.fixture
+def access_token(user):
+    """Access token for the test user."""
+    return AuthService.login(user.email, 'pass123')['access']
+
+
+@pytest.fixture
+def open_stream(access_token):
+    """Open the stream; yields a function returning (response, chunk iterator)."""
+    responses = []
+    
+    def _open(**params):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = client.get('/api/notifications/stream/', params, HTTP_ACCEPT='text/event-stream')
+        responses.append(response)
+        return response, iter(response.streaming_content)
+    
+    yield _open
+    for response in responses:
+        response.close()
+
+
+def parse_event(chunk):
+    """Decode one SSE chunk into (event, data)."""
+    fields = dict(line.split(': ', 1) for line in chunk.decode('utf-8').strip().split('\n'))
+    return fields['event'], json.loads(fields['data'])
+
+
+class TestInMemoryBroker:
+    """Tests for InMemoryBroker."""
+    
+    def test_delivers_to_channel_subscribers_only(self):
+        """Test messages reach the subscribers of their channel."""
+        broker = InMemoryBroker()
+        with broker.subscribe('a') as first, broker.subscribe('a') as second, broker.subscribe('b') as other:
+            broker.publish('a', {'n': 1})
+            
+            assert first.get(timeout=0) == {'n': 1}
+            assert second.get(timeout=0) == {'n': 1}
+            assert other.get(timeout=0) is None
+    
+    def test_closed_subscription_stops_receiving(self):
+        """Test unsubscribing removes the subscriber."""
+        broker = InMemoryBroker()
+        subscription = broker.subscribe('a')
+        subscription.close()
+        
+        broker.publish('a', {'n': 1})
+        
+        assert subscription.get(timeout=0) is None
+        assert broker._subscriptions == {}
+    
+    def test_slow_subscriber_overflows(self, settings):
+        """Test a full queue drops the backlog and flags the subscriber."""
+        settings.PUBSUB_QUEUE_SIZE = 2
+        broker = InMemoryBroker()
+        with broker.subscribe('a') as subscription:
+            for n in range(3):
+                broker.publish('a', {'n': n})
+            
+            assert subscription.overflowed is True
+            assert subscription.get(timeout=0) is None
+    
+    def test_rejects_unserializable_messages(self):
+        """Test messages must be JSON-serializable (like the Postgres backend)."""
+        with pytest.raises(TypeError):
+            InMemoryBroker().publish('a', {'when': object()})
+
+
+class TestPostgresBrokerPayloads:
+    """Tests for PostgresBroker NOTIFY payload splitting."""
+    
+    def test_channels_split_under_payload_limit(self, monkeypatch):
+        """Test long channel lists are spread over several NOTIFYs."""
+        broker = PostgresBroker()
+        sent = []
+        
+        class Cursor:
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                return False
+            
+            def execute(self, sql, params):
+                sent.append(params[1])
+        
+        class Connection:
+            def cursor(self):
+                return Cursor()
+        
+        monkeypatch.setattr('config.pubsub.connections', {'default': Connection()})
+        channels = [f'notifications:{n:036d}' for n in range(500)]
+        
+        broker.publish_many(channels, {'event': 'unread', 'data': {'unread_delta': 1}})
+        
+        assert len(sent) > 1
+        assert all(len(payload) <= PostgresBroker.MAX_PAYLOAD for payload in sent)
+        decoded = [json.loads(payload) for payload in sent]
+        assert [channel for payload in decoded for channel in payload['c']] == channels
+        assert all(payload['m'] == {'event': 'unread', 'data': {'unread_delta': 1}} for payload in decoded)
+
+
+@pytest.mark.django_db
+class TestNotificationStreamAPI:
+    """Tests for GET /api/notifications/stream/."""
+    
+    def test_requires_authentication(self):
+        """Test anonymous clients are rejected."""
+        response = APIClient().get('/api/notifications/stream/', HTTP_ACCEPT='text/event-stream')
+        
+        assert response.status_code == 401
+    
+    def test_starts_with_unread_count(self, open_stream, user):
+        """Test the first event is the current unread count."""
+        NotificationService.create_notification(user, 'resource_forked', 'Forked')
+        
+        response, chunks = open_stream()
+        first = next(chunks)
+        
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'text/event-stream'
+        assert response['Cache-Control'] == 'no-cache'
+        assert first.startswith(b'retry: ')
+        assert parse_event(first.split(b'\n', 1)[1]) == ('unread_count', {'unread_count': 1})
+    
+    def test_access_token_query_param(self, access_token):
+        """Test EventSource clients can authenticate with ?access_token=."""
+        response = APIClient().get(
+            '/api/notifications/stream/',
+            {'access_token': access_token},
+            HTTP_ACCEPT='text/event-stream'
+        )
+        
+        assert response.status_code == 200
+        response.close()
+    
+    def test_pushes_new_notification(self, open_stream, user, django_capture_on_commit_callbacks):
+        """Test a created notification is pushed after commit."""
+        response, chunks = open_stream()
+        next(chunks)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            notification = NotificationService.create_notification(user, 'resource_forked', 'Forked')
+        
+        event, data = parse_event(next(chunks))
+        assert event == 'notification'
+        assert data['unread_delta'] == 1
+        assert data['notification']['id'] == str(notification.id)
+        assert data['notification']['message'] == 'Forked'
+        assert data['notification']['is_read'] is False
+    
+    def test_not_pushed_before_commit(self, open_stream, user, settings):
+        """Test nothing is pushed while the transaction is open."""
+        settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS = 0
+        response, chunks = open_stream()
+        next(chunks)
+        
+        NotificationService.create_notification(user, 'resource_forked', 'Forked')
+        
+        assert next(chunks) == b': ping\n\n'
+    
+    def test_other_users_events_not_pushed(self, open_stream, other_user, settings,
+                                           django_capture_on_commit_callbacks):
+        """Test a stream only carries its own user's events."""
+        settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS = 0
+        response, chunks = open_stream()
+        next(chunks)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.create_notification(other_user, 'resource_forked', 'Forked')
+        
+        assert next(chunks) == b': ping\n\n'
+    
+    def test_pushes_read_deltas(self, open_stream, user, django_capture_on_commit_callbacks):
+        """Test mark_as_read and mark_all_as_read push negative deltas."""
+        first = NotificationService.create_notification(user, 'resource_forked', 'One')
+        for message in ('Two', 'Three'):
+            NotificationService.create_notification(user, 'resource_forked', message)
+        response, chunks = open_stream()
+        next(chunks)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.mark_as_read(first.id, user)
+            NotificationService.mark_as_read(first.id, user)  # already read: no event
+            NotificationService.mark_all_as_read(user)
+            NotificationService.mark_all_as_read(user)  # nothing left: no event
+        
+        assert parse_event(next(chunks)) == ('read', {'notification_id': str(first.id), 'unread_delta': -1})
+        assert parse_event(next(chunks)) == ('read', {'notification_id': None, 'unread_delta': -2})
+    
+    def test_bulk_notifications_push_unread_delta(self, open_stream, user, other_user,
+                                                  django_capture_on_commit_callbacks):
+        """Test fan-out pushes a count bump to each recipient."""
+        response, chunks = open_stream()
+        next(chunks)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.create_notifications_bulk([user, other_user], 'validation_requested', 'Review')
+        
+        assert parse_event(next(chunks)) == ('unread', {'unread_delta': 1})
+    
+    def test_heartbeat(self, open_stream, settings):
+        """Test an idle stream sends heartbeat comments."""
+        settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS = 0
+        response, chunks = open_stream()
+        next(chunks)
+        
+        assert next(chunks) == b': ping\n\n'
+    
+    def test_stream_ends_after_max_duration(self, open_stream, settings):
+        """Test the stream closes once NOTIFICATION_STREAM_MAX_SECONDS elapse."""
+        settings.NOTIFICATION_STREAM_MAX_SECONDS = 0
+        response, chunks = open_stream()
+        
+        assert len(list(chunks)) == 1
+    
+    def test_streams_capped_per_process(self, open_stream, settings):
+        """Test streams past NOTIFICATION_STREAM_MAX_PER_PROCESS get a retry hint instead."""
+        settings.NOTIFICATION_STREAM_MAX_PER_PROCESS = 1
+        first, first_chunks = open_stream()
+        next(first_chunks)
+        
+        response, chunks = open_stream()
+        
+        assert response.status_code == 200
+        assert list(chunks) == [b'retry: 15000\nevent: busy\ndata: {}\n\n']
+        
+        # Closing the open stream frees its slot
+        first.close()
+        response, chunks = open_stream()
+        assert parse_event(next(chunks))[0] == 'unread_count'
+    
+    def test_finished_stream_frees_its_slot(self, open_stream, settings):
+        """Test a stream that ran its course releases its slot."""
+        settings.NOTIFICATION_STREAM_MAX_PER_PROCESS = 1
+        settings.NOTIFICATION_STREAM_MAX_SECONDS = 0
+        for _ in range(2):
+            response, chunks = open_stream()
+            assert parse_event(next(chunks))[0] == 'unread_count'
+            assert list(chunks) == []
+    
+    def test_overflow_resyncs_unread_count(self, open_stream, user, settings,
+                                           django_capture_on_commit_callbacks):
+        """Test a client that falls behind gets a fresh count instead of the backlog."""
+        settings.PUBSUB_QUEUE_SIZE = 2
+        response, chunks = open_stream()
+        next(chunks)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            for n in range(3):
+                NotificationService.create_notification(user, 'resource_forked', f'Forked {n}')
+        
+        assert parse_event(next(chunks)) == ('unread_count', {'unread_count': 3})
+        assert Notification.objects.filter(user=user).count() == 3
@@ -4,10 +4,17 @@ Tests for notification services.
 US-18: Notificaciones In-App
 """
 
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
-from apps.interactions.models import Notification
+from apps.interactions.models import Notification, NotificationCounter
+from apps.interactions.projections import fetch_notifications
+from apps.interactions.serializers import NotificationSerializer
 from apps.interactions.services import NotificationService
 from apps.resources.models import Resource, ResourceVersion
 
@@ -142,3 +149,291 @@ class TestNotificationService:
         
         unread_count = NotificationService.get_unread_count(user)
         assert unread_count == 2
+
+
+@pytest.mark.django_db
+class TestNotificationProjection:
+    """Tests for fetch_notifications() parity with NotificationSerializer"""
+    
+    def test_rows_match_serializer(self, user, resource, actor):
+        """Test projected rows equal the DRF serializer output."""
+        NotificationService.create_notification(user, 'resource_forked', 'Forked', resource=resource, actor=actor)
+        read = NotificationService.create_notification(user, 'resource_validated', 'Validated')
+        NotificationService.mark_as_read(read.id, user)
+        
+        notifications = NotificationService.get_user_notifications(user)
+        expected = NotificationSerializer(notifications, many=True).data
+        
+        assert json.dumps(fetch_notifications(notifications)) == json.dumps(expected)
+
+
+@pytest.mark.django_db
+class TestBulkNotifications:
+    """Tests for NotificationService.create_notifications_bulk / notify_admins."""
+    
+    def test_batched_inserts(self, resource, actor, django_assert_max_num_queries):
+        """Test 25 recipients are inserted in ceil(25 / 10) INSERTs, streamed from a QuerySet."""
+        for index in range(25):
+            User.objects.create_user(f'bulk{index}@example.com', f'Bulk {index}', 'pass123')
+        recipients = User.objects.filter(email__startswith='bulk')
+        NotificationCounter.objects.bulk_create([NotificationCounter(user=recipient) for recipient in recipients])
+        
+        # 1 recipient query + 3 x (INSERT + counter UPDATE) (+ savepoint statements)
+        with django_assert_max_num_queries(9) as captured:
+            created = NotificationService.create_notifications_bulk(
+                recipients, 'validation_requested', 'Please review', resource=resource, actor=actor, batch_size=10
+            )
+        
+        inserts = [query for query in captured.captured_queries if query['sql'].startswith('INSERT')]
+        assert created == 25
+        assert len(inserts) == 3
+        notification = Notification.objects.filter(user__email='bulk0@example.com').get()
+        assert (notification.type, notification.resource_id, notification.actor_id) == (
+            'validation_requested', resource.id, actor.id
+        )
+        assert notification.created_at is not None
+        assert NotificationCounter.objects.filter(unread_count=1).count() == 25
+    
+    def test_accepts_generators_and_skips_actor(self, user, actor):
+        """Test any iterable of users or ids works and the actor is never notified."""
+        recipients = (recipient for recipient in [user, actor.id])
+        
+        created = NotificationService.create_notifications_bulk(
+            recipients, 'validation_requested', 'Announcement', actor=actor, batch_size=1
+        )
+        
+        assert created == 1
+        assert list(Notification.objects.values_list('user_id', flat=True)) == [user.id]
+    
+    def test_notify_admins(self, user, actor, resource):
+        """Test notify_admins reaches superusers and Admin-role users once each."""
+        from apps.authentication.models import Role
+        admin_role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+        user.roles.add(admin_role)
+        superuser = User.objects.create_superuser('root@example.com', 'Root', 'pass123')
+        superuser.roles.add(admin_role)
+        
+        created = NotificationService.notify_admins(
+            'validation_requested', 'Validation requested', resource=resource, actor=actor
+        )
+        
+        assert created == 2
+        assert set(Notification.objects.values_list('user_id', flat=True)) == {user.id, superuser.id}
+    
+    def test_benchmark_command(self):
+        """Test the benchmark runs and leaves no rows behind."""
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        
+        call_command('benchmark_notifications', '--recipients', '20', '--batch-size', '5', stdout=out)
+        
+        assert 'rows/s' in out.getvalue()
+        assert not User.objects.filter(email__endswith='@example.invalid').exists()
+        assert not Notification.objects.exists()
+
+
+@pytest.mark.django_db
+class TestUnreadCounter:
+    """Tests for the per-user unread counter (NotificationCounter)."""
+    
+    def _create(self, user, message='Hello'):
+        return NotificationService.create_notification(
+            user=user,
+            notification_type='resource_forked',
+            message=message
+        )
+    
+    def _stored(self, user):
+        return NotificationCounter.objects.get(user=user).unread_count
+    
+    def test_read_without_counting(self, user, django_assert_num_queries):
+        """Test the badge is one primary-key lookup."""
+        self._create(user)
+        
+        with django_assert_num_queries(1):
+            assert NotificationService.get_unread_count(user) == 1
+    
+    def test_missing_counter_is_recounted(self, user):
+        """Test a user without a counter row gets one from the table."""
+        Notification.objects.create(user=user, type='resource_forked', message='Hello')
+        assert not NotificationCounter.objects.filter(user=user).exists()
+        
+        assert NotificationService.get_unread_count(user) == 1
+        assert self._stored(user) == 1
+    
+    def test_writes_adjust_counter_in_transaction(self, user, django_assert_num_queries):
+        """Test create/mark_as_read/mark_all_as_read keep the counter exact without recounting."""
+        first = self._create(user, 'One')
+        self._create(user, 'Two')
+        self._create(user, 'Three')
+        assert self._stored(user) == 3
+        
+        NotificationService.mark_as_read(first.id, user)
+        NotificationService.mark_as_read(first.id, user)  # already read: unchanged
+        assert self._stored(user) == 2
+        
+        NotificationService.mark_all_as_read(user)
+        with django_assert_num_queries(1):
+            assert NotificationService.get_unread_count(user) == 0
+    
+    def test_rolled_back_write_leaves_counter(self, user):
+        """Test the counter changes with the notification or not at all."""
+        self._create(user)
+        
+        with transaction.atomic():
+            self._create(user)
+            transaction.set_rollback(True)
+        
+        assert NotificationService.get_unread_count(user) == 1
+    
+    def test_mark_as_read_race(self, user):
+        """Test a notification read meanwhile by a concurrent request is not discounted twice."""
+        notification = self._create(user)
+        stale = Notification.objects.get(pk=notification.pk)
+        NotificationService.mark_as_read(notification.id, user)
+        
+        with patch.object(Notification.objects, 'get', return_value=stale):
+            NotificationService.mark_as_read(notification.id, user)
+        
+        assert stale.read_at is not None
+        assert self._stored(user) == 0
+    
+    def test_bulk_fan_out_increments_counters(self, user, actor):
+        """Test bulk creation bumps every recipient once per notification."""
+        assert NotificationService.get_unread_count(user) == 0
+        
+        NotificationService.create_notifications_bulk([user, actor, user], 'validation_requested', 'Review')
+        
+        assert NotificationService.get_unread_count(user) == 2
+        assert NotificationService.get_unread_count(actor) == 1
+    
+    def test_resource_hard_delete_discounts_unread(self, user, actor, resource):
+        """Test notifications cascaded away with their resource leave the counters."""
+        NotificationService.create_notification(user, 'resource_forked', 'Forked', resource=resource)
+        read = NotificationService.create_notification(actor, 'resource_forked', 'Forked', resource=resource)
+        NotificationService.mark_as_read(read.id, actor)
+        self._create(user)
+        
+        resource.delete()
+        
+        assert self._stored(user) == 1
+        assert self._stored(actor) == 0
+    
+    def test_check_unread_counts_command(self, user, actor):
+        """Test the consistency check reports and repairs drifted counters."""
+        from io import StringIO
+        from django.core.management import call_command
+        self._create(user)
+        self._create(actor)
+        NotificationCounter.objects.filter(user=user).update(unread_count=5)
+        
+        out = StringIO()
+        call_command('check_unread_counts', '--dry-run', stdout=out)
+        assert f'{user.id}: stored 5, actual 1' in out.getvalue()
+        assert '2 counter(s) checked' in out.getvalue()
+        assert '1 counter(s) drifted (dry run)' in out.getvalue()
+        assert self._stored(user) == 5
+        
+        out = StringIO()
+        call_command('check_unread_counts', '--batch-size', '1', stdout=out)
+        assert 'Repaired 1 counter(s)' in out.getvalue()
+        assert self._stored(user) == 1
+        
+        out = StringIO()
+        call_command('check_unread_counts', stdout=out)
+        assert 'All unread counters are consistent' in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestNotificationCoalescing:
+    """Tests for create_notification(coalesce=True)."""
+    
+    def _fork_event(self, user, resource, actor, **kwargs):
+        return NotificationService.create_notification(
+            user=user,
+            notification_type='resource_forked',
+            message=f'{actor.name} forked',
+            resource=resource,
+            actor=actor,
+            coalesce=True,
+            **kwargs
+        )
+    
+    def test_merges_into_recent_unread_notification(self, user, resource, actor):
+        """Test repeated events update one row instead of inserting."""
+        first = self._fork_event(user, resource, actor)
+        second = self._fork_event(user, resource, user, merged_message=lambda count: f'{count} forks')
+        
+        assert second.id == first.id
+        assert Notification.objects.count() == 1
+        second.refresh_from_db()
+        assert second.event_count == 2
+        assert second.message == '2 forks'
+        assert second.actor_id == user.id
+        assert second.actor_sample == [
+            {'id': str(user.id), 'name': 'Test User'},
+            {'id': str(actor.id), 'name': 'Actor User'},
+        ]
+        assert second.created_at > first.created_at
+    
+    def test_actor_sample_is_distinct_and_capped(self, user, resource):
+        """Test the sample keeps the newest distinct actors only."""
+        from apps.interactions.services import ACTOR_SAMPLE_SIZE
+        actors = [
+            User.objects.create_user(f'actor{n}@example.com', f'Actor {n}', 'pass123')
+            for n in range(ACTOR_SAMPLE_SIZE + 1)
+        ]
+        for actor in actors + [actors[0]]:
+            notification = self._fork_event(user, resource, actor)
+        
+        notification.refresh_from_db()
+        assert notification.event_count == ACTOR_SAMPLE_SIZE + 2
+        names = [item['name'] for item in notification.actor_sample]
+        assert names == ['Actor 0', f'Actor {ACTOR_SAMPLE_SIZE}', f'Actor {ACTOR_SAMPLE_SIZE - 1}']
+    
+    def test_read_notification_starts_new_row(self, user, resource, actor):
+        """Test events after the user read the notification are not hidden in it."""
+        first = self._fork_event(user, resource, actor)
+        NotificationService.mark_as_read(first.id, user)
+        
+        second = self._fork_event(user, resource, actor)
+        
+        assert second.id != first.id
+        assert second.event_count == 1
+    
+    def test_outside_window_starts_new_row(self, user, resource, actor, settings):
+        """Test events older than the coalescing window are not merged into."""
+        settings.NOTIFICATION_COALESCE_WINDOW_HOURS = 1
+        first = self._fork_event(user, resource, actor)
+        Notification.objects.filter(pk=first.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        
+        assert self._fork_event(user, resource, actor).id != first.id
+    
+    def test_other_resource_or_recipient_not_merged(self, user, resource, actor):
+        """Test coalescing is scoped to recipient, type and resource."""
+        other_resource = Resource.objects.create(owner=user, source_type='Internal')
+        
+        self._fork_event(user, resource, actor)
+        self._fork_event(user, other_resource, actor)
+        self._fork_event(actor, resource, user)
+        NotificationService.create_notification(user, 'resource_validated', 'Validated', resource=resource)
+        
+        assert Notification.objects.count() == 4
+    
+    def test_merge_does_not_change_unread_count(self, user, resource, actor):
+        """Test a merged event leaves the unread counter alone."""
+        self._fork_event(user, resource, actor)
+        self._fork_event(user, resource, actor)
+        
+        assert NotificationService.get_unread_count(user) == 1
+    
+    def test_payload_includes_count_and_actors(self, user, resource, actor):
+        """Test list payloads expose event_count and actor_sample."""
+        self._fork_event(user, resource, actor)
+        self._fork_event(user, resource, actor)
+        
+        row = NotificationService.get_feed(user)['results'][0]
+        
+        assert row['event_count'] == 2
+        assert row['actor_sample'] == [{'id': str(actor.id), 'name': 'Actor User'}]
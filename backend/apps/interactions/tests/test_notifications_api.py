@@ -139,3 +139,66 @@ class TestNotificationAPI:
         
         assert response.status_code == 200
         assert response.data['unread_count'] == 2
+
+
+def _seed_notifications(user, count, start=None):
+    """Create `count` notifications one minute apart (oldest first); return them newest first."""
+    from datetime import timedelta
+    from apps.interactions.models import Notification
+    
+    start = start or timezone.now() - timedelta(days=1)
+    created = []
+    for index in range(count):
+        notification = NotificationService.create_notification(user, 'resource_forked', f'Notification {index}')
+        Notification.objects.filter(id=notification.id).update(created_at=start + timedelta(minutes=index))
+        created.append(notification)
+    return [str(notification.id) for notification in reversed(created)]
+
+
+@pytest.mark.django_db
+class TestNotificationFeedAPI:
+    """Tests for the cursor-paginated notification feed."""
+    
+    def test_pages_follow_cursor(self, authenticated_client, user):
+        """Test pages are bounded and walk the whole feed without gaps or repeats."""
+        expected = _seed_notifications(user, 7)
+        
+        seen = []
+        url = '/api/notifications/?page_size=3'
+        while url:
+            response = authenticated_client.get(url)
+            assert len(response.data['notifications']) <= 3
+            seen += [item['id'] for item in response.data['notifications']]
+            url = None
+            if response.data['has_next']:
+                url = f'/api/notifications/?page_size=3&cursor={response.data["next"]}'
+        
+        assert seen == expected
+    
+    def test_since_returns_only_newer(self, authenticated_client, user):
+        """Test incremental polling with ?since=<created_at of the newest item seen>."""
+        ids = _seed_notifications(user, 4)
+        newest_seen = authenticated_client.get('/api/notifications/?page_size=3').data['notifications'][2]
+        
+        response = authenticated_client.get('/api/notifications/', {'since': newest_seen['created_at']})
+        
+        assert [item['id'] for item in response.data['notifications']] == ids[:2]
+    
+    def test_counts_in_one_query(self, authenticated_client, user, django_assert_max_num_queries):
+        """Test count/unread_count come from one aggregate (plus the page query)."""
+        _seed_notifications(user, 5)
+        NotificationService.mark_as_read(
+            user.notifications.order_by('created_at').values_list('id', flat=True).first(), user
+        )
+        
+        # JWT user lookup + page + aggregate
+        with django_assert_max_num_queries(3):
+            response = authenticated_client.get('/api/notifications/?page_size=2')
+        
+        assert (response.data['count'], response.data['unread_count']) == (5, 4)
+        assert authenticated_client.get('/api/notifications/?unread_only=true').data['count'] == 4
+    
+    def test_invalid_parameters(self, authenticated_client):
+        """Test malformed cursors and since values are rejected."""
+        assert authenticated_client.get('/api/notifications/?cursor=bogus').data['error_code'] == 'INVALID_CURSOR'
+        assert authenticated_client.get('/api/notifications/?since=yesterday').data['error_code'] == 'INVALID_SINCE'
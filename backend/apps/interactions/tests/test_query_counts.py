@@ -0,0 +1,101 @@
+"""
+N+1 guards for notification and vote endpoints (see assert_constant_queries in conftest.py).
+
+US-16: Votar Recurso
+US-18: Notificaciones In-App
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from apps.interactions.models import Notification
+from apps.interactions.serializers import NotificationSerializer
+from apps.interactions.services import NotificationService
+from apps.resources.models import Resource, ResourceVersion
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    """Create the notification recipient."""
+    return User.objects.create_user('user@example.com', 'Test User', 'pass123')
+
+
+@pytest.fixture
+def authenticated_client(user):
+    """Create API client authenticated as the recipient."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def seed_notifications(user):
+    """Return a seeder creating notifications, each about its own resource and actor."""
+    created = []
+    
+    def seed(count):
+        for _ in range(count):
+            index = len(created)
+            actor = User.objects.create_user(f'actor{index}@example.com', f'Actor {index}', 'pass123')
+            resource = Resource.objects.create(owner=user, source_type='Internal')
+            ResourceVersion.objects.create(
+                resource=resource,
+                version_number='1.0.0',
+                title=f'Resource {index}',
+                description='Test',
+                type='Prompt',
+                content='Content',
+                is_latest=True
+            )
+            created.append(Notification.objects.create(
+                user=user,
+                type='resource_forked',
+                message=f'Forked {index}',
+                resource=resource,
+                actor=actor
+            ))
+    
+    return seed
+
+
+@pytest.mark.django_db
+class TestNotificationQueryCounts:
+    """Query counts of notification endpoints must not grow with the number of rows."""
+    
+    def test_list(self, assert_constant_queries, authenticated_client, user):
+        """GET /api/notifications/"""
+        assert_constant_queries(
+            seed=seed_notifications(user),
+            request=lambda: authenticated_client.get('/api/notifications/'),
+        )
+    
+    def test_list_unread_only(self, assert_constant_queries, authenticated_client, user):
+        """GET /api/notifications/?unread_only=true"""
+        assert_constant_queries(
+            seed=seed_notifications(user),
+            request=lambda: authenticated_client.get('/api/notifications/?unread_only=true'),
+        )
+    
+    def test_unread_count(self, assert_constant_queries, authenticated_client, user):
+        """GET /api/notifications/unread-count/"""
+        assert_constant_queries(
+            seed=seed_notifications(user),
+            request=lambda: authenticated_client.get('/api/notifications/unread-count/'),
+        )
+    
+    def test_mark_all_read(self, assert_constant_queries, authenticated_client, user):
+        """POST /api/notifications/mark-all-read/"""
+        assert_constant_queries(
+            seed=seed_notifications(user),
+            request=lambda: authenticated_client.post('/api/notifications/mark-all-read/'),
+        )
+    
+    def test_serializer_over_service_queryset(self, assert_constant_queries, user):
+        """NotificationSerializer.resource_title must not query per notification."""
+        assert_constant_queries(
+            seed=seed_notifications(user),
+            request=lambda: NotificationSerializer(
+                NotificationService.get_user_notifications(user), many=True
+            ).data,
+        )
@@ -0,0 +1,151 @@
+"""
+Tests for notification retention (prune_notifications).
+
+US-18: Notificaciones In-App
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from apps.interactions import retention
+from apps.interactions.models import ArchivedNotification, Notification
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    """Create a test user."""
+    return User.objects.create_user('user@example.com', 'Test User', 'pass123')
+
+
+@pytest.fixture
+def other_user():
+    """Create another user."""
+    return User.objects.create_user('other@example.com', 'Other User', 'pass123')
+
+
+def make_notification(user, days_ago, read=True, message='Hello'):
+    """Create a notification created `days_ago` days ago."""
+    created_at = timezone.now() - timedelta(days=days_ago)
+    notification = Notification.objects.create(user=user, type='resource_forked', message=message)
+    Notification.objects.filter(pk=notification.pk).update(
+        created_at=created_at,
+        read_at=created_at + timedelta(hours=1) if read else None
+    )
+    notification.refresh_from_db()
+    return notification
+
+
+@pytest.mark.django_db
+class TestPruneExpired:
+    """Tests for retention.prune_expired."""
+    
+    def test_archives_old_read_notifications(self, user):
+        """Test old read rows move to the archive; recent and unread rows stay."""
+        old_read = make_notification(user, days_ago=100, message='Old read')
+        old_unread = make_notification(user, days_ago=100, read=False)
+        recent_read = make_notification(user, days_ago=10)
+        
+        pruned = retention.prune_expired(90)
+        
+        assert pruned == 1
+        assert set(Notification.objects.values_list('id', flat=True)) == {old_unread.id, recent_read.id}
+        archived = ArchivedNotification.objects.get()
+        assert archived.id == old_read.id
+        assert archived.user_id == user.id
+        assert archived.message == 'Old read'
+        assert archived.read_at == old_read.read_at
+        assert archived.created_at == old_read.created_at
+        assert archived.archived_at is not None
+    
+    def test_delete_without_archive(self, user):
+        """Test archive=False deletes outright."""
+        make_notification(user, days_ago=100)
+        
+        assert retention.prune_expired(90, archive=False) == 1
+        assert not Notification.objects.exists()
+        assert not ArchivedNotification.objects.exists()
+    
+    def test_batches_cover_every_row(self, user, django_assert_max_num_queries):
+        """Test small batches walk the whole key range."""
+        for _ in range(7):
+            make_notification(user, days_ago=100)
+        
+        # Per batch: id scan, locked read, archive insert, delete (+ savepoint bookkeeping)
+        with django_assert_max_num_queries(4 * 6 + 4):
+            assert retention.prune_expired(90, batch_size=2) == 7
+        
+        assert not Notification.objects.exists()
+        assert ArchivedNotification.objects.count() == 7
+    
+    def test_rerun_is_idempotent(self, user):
+        """Test a row already archived (interrupted run) does not fail the batch."""
+        notification = make_notification(user, days_ago=100)
+        retention.prune_expired(90)
+        Notification.objects.bulk_create([Notification(
+            id=notification.id,
+            user=user,
+            type=notification.type,
+            message=notification.message,
+            read_at=notification.read_at
+        )])
+        Notification.objects.filter(pk=notification.pk).update(created_at=notification.created_at)
+        
+        assert retention.prune_expired(90) == 1
+        assert ArchivedNotification.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestPruneOverCap:
+    """Tests for retention.prune_over_cap."""
+    
+    def test_keeps_newest_per_user(self, user, other_user):
+        """Test only read rows beyond each user's newest N are pruned."""
+        newest = [make_notification(user, days_ago=days) for days in (1, 2)]
+        old_unread = make_notification(user, days_ago=3, read=False)
+        make_notification(user, days_ago=4)
+        make_notification(user, days_ago=5)
+        other = [make_notification(other_user, days_ago=days) for days in (1, 2)]
+        
+        pruned = retention.prune_over_cap(2, batch_size=1)
+        
+        assert pruned == 2
+        kept = set(Notification.objects.values_list('id', flat=True))
+        assert kept == {n.id for n in newest + other} | {old_unread.id}
+        assert ArchivedNotification.objects.filter(user=user).count() == 2
+
+
+@pytest.mark.django_db
+class TestPruneNotificationsCommand:
+    """Tests for manage.py prune_notifications."""
+    
+    def test_reports_rows_per_second(self, user, settings):
+        """Test the command runs both passes from settings and reports throughput."""
+        settings.NOTIFICATION_RETENTION_DAYS = 30
+        settings.NOTIFICATION_MAX_PER_USER = 1
+        make_notification(user, days_ago=1)
+        make_notification(user, days_ago=2)
+        make_notification(user, days_ago=40)
+        out = StringIO()
+        
+        call_command('prune_notifications', stdout=out)
+        
+        output = out.getvalue()
+        assert 'rows/s' in output
+        assert 'Archived 2 notification(s)' in output
+        assert Notification.objects.count() == 1
+    
+    def test_delete_and_overrides(self, user):
+        """Test --delete and the command-line thresholds."""
+        make_notification(user, days_ago=10)
+        out = StringIO()
+        
+        call_command('prune_notifications', '--older-than-days', '5', '--max-per-user', '0', '--delete', stdout=out)
+        
+        assert 'Deleted 1 notification(s)' in out.getvalue()
+        assert not ArchivedNotification.objects.exists()
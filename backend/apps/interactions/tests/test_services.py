@@ -4,8 +4,13 @@ Tests for Vote services.
 US-16: Votar Recurso
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection
 from apps.interactions.models import Vote
 from apps.interactions.services import VoteService
 from apps.resources.models import Resource, ResourceVersion
@@ -74,6 +79,57 @@ class TestVoteService:
         assert result2['action'] == 'voted'
         assert result2['votes_count'] == 2
     
+    def test_toggle_vote_updates_stored_counter(self, user, another_user, resource):
+        """Test the denormalized Resource.votes_count follows toggles."""
+        VoteService.toggle_vote(user, resource.id)
+        VoteService.toggle_vote(another_user, resource.id)
+        resource.refresh_from_db()
+        assert resource.votes_count == 2
+        
+        VoteService.toggle_vote(user, resource.id)
+        resource.refresh_from_db()
+        assert resource.votes_count == 1
+    
+    def test_reconcile_vote_counts_repairs_drift(self, user, resource):
+        """Test the reconciliation command fixes a drifted counter."""
+        from io import StringIO
+        from django.core.management import call_command
+        
+        Vote.objects.create(user=user, resource=resource)  # bypasses the service
+        Resource.objects.filter(id=resource.id).update(votes_count=7)
+        
+        call_command('reconcile_vote_counts', '--dry-run', stdout=StringIO())
+        resource.refresh_from_db()
+        assert resource.votes_count == 7
+        
+        call_command('reconcile_vote_counts', stdout=StringIO())
+        resource.refresh_from_db()
+        assert resource.votes_count == 1
+    
+    def test_toggle_vote_round_trips(self, user, resource, django_assert_max_num_queries):
+        """Test a toggle is DELETE + INSERT + counter UPDATE (+ owner metrics), without COUNT(*)."""
+        VoteService.toggle_vote(user, resource.id)  # creates the owner's metrics row
+        VoteService.toggle_vote(user, resource.id)
+        
+        with django_assert_max_num_queries(6) as captured:
+            result = VoteService.toggle_vote(user, resource.id)
+        
+        statements = [query['sql'] for query in captured.captured_queries if 'SAVEPOINT' not in query['sql']]
+        assert result == {'action': 'voted', 'votes_count': 1}
+        assert len(statements) == 4
+        assert not any('COUNT(' in sql.upper() for sql in statements)
+    
+    def test_toggle_vote_soft_deleted_resource_keeps_vote(self, user, resource):
+        """Test unvoting a soft-deleted resource fails without removing the vote."""
+        from django.utils import timezone
+        
+        VoteService.toggle_vote(user, resource.id)
+        Resource.objects.filter(id=resource.id).update(deleted_at=timezone.now())
+        
+        with pytest.raises(ValueError, match='Resource not found'):
+            VoteService.toggle_vote(user, resource.id)
+        assert Vote.objects.filter(user=user, resource=resource).exists()
+    
     def test_toggle_vote_nonexistent_resource(self, user):
         """Test voting for nonexistent resource raises error."""
         import uuid
@@ -129,3 +185,71 @@ class TestVoteService:
         # After voting
         Vote.objects.create(user=user, resource=resource)
         assert VoteService.has_user_voted(user, resource.id) is True
+
+
+def _run_concurrently(calls):
+    """
+    Run callables in parallel threads (started together); return results and errors.
+    
+    The in-memory SQLite test database reports lock contention immediately
+    ('database table is locked') instead of waiting like PostgreSQL does, so
+    those attempts (rolled back as a whole) are retried.
+    """
+    barrier = threading.Barrier(len(calls))
+    
+    def run(call):
+        try:
+            barrier.wait()
+            while True:
+                try:
+                    return call()
+                except OperationalError as e:
+                    if connection.vendor != 'sqlite' or 'locked' not in str(e):
+                        raise
+                    time.sleep(0.001)
+        finally:
+            connection.close()
+    
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(run, call) for call in calls]
+    
+    results, errors = [], []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:  # collected for the assertion message
+            errors.append(e)
+    return results, errors
+
+
+@pytest.mark.django_db(transaction=True)
+class TestVoteConcurrency:
+    """Concurrent toggles must keep votes_count equal to the votes table."""
+    
+    def _assert_consistent(self, resource):
+        resource.refresh_from_db()
+        assert resource.votes_count == Vote.objects.filter(resource=resource).count()
+    
+    def test_many_users_toggle_same_resource(self, resource):
+        """Test N users voting at the same time are all counted."""
+        voters = [User.objects.create_user(f'concurrent{i}@example.com', f'Voter {i}', 'pass123') for i in range(12)]
+        
+        results, errors = _run_concurrently([
+            lambda voter=voter: VoteService.toggle_vote(voter, resource.id) for voter in voters
+        ])
+        
+        assert errors == []
+        assert {result['action'] for result in results} == {'voted'}
+        assert max(result['votes_count'] for result in results) == 12
+        self._assert_consistent(resource)
+    
+    def test_concurrent_double_clicks(self, user, resource):
+        """Test the same user toggling many times at once never errors or drifts."""
+        results, errors = _run_concurrently([
+            lambda: VoteService.toggle_vote(user, resource.id) for _ in range(10)
+        ])
+        
+        assert errors == []
+        assert len(results) == 10
+        self._assert_consistent(resource)
+        assert Vote.objects.filter(user=user, resource=resource).count() <= 1
@@ -0,0 +1,152 @@
+"""
+Tests for the per-request user_has_voted field on list and detail payloads.
+
+US-16: Votar Recurso
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from apps.interactions.models import Vote
+from apps.interactions.services import VoteService
+from apps.resources.models import Resource, ResourceVersion
+
+User = get_user_model()
+
+
+@pytest.fixture
+def voter():
+    """Create a user who votes."""
+    return User.objects.create_user('voter@example.com', 'Voter User', 'pass123')
+
+
+@pytest.fixture
+def resources():
+    """Create three resources (newest last)."""
+    owner = User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+    created = []
+    for index in range(3):
+        resource = Resource.objects.create(owner=owner, source_type='Internal')
+        ResourceVersion.objects.create(
+            resource=resource,
+            version_number='1.0.0',
+            title=f'Resource {index}',
+            description='Test',
+            type='Prompt',
+            content='Content',
+            is_latest=True
+        )
+        created.append(resource)
+    return created
+
+
+def _client(user=None):
+    client = APIClient()
+    if user is not None:
+        client.force_authenticate(user=user)
+    return client
+
+
+def _flags(response):
+    return {row['id']: row['user_has_voted'] for row in response.data['results']}
+
+
+def _vote_queries(captured):
+    return [query['sql'] for query in captured.captured_queries if 'FROM "votes"' in query['sql']]
+
+
+@pytest.mark.django_db
+class TestUserHasVotedAPI:
+    """Tests for user_has_voted on GET /api/resources/ and /api/resources/{id}/."""
+    
+    def test_list_flags_voted_rows_with_one_query(self, voter, resources):
+        """Test the flag comes from one page-scoped IN query."""
+        Vote.objects.create(user=voter, resource=resources[1])
+        
+        with CaptureQueriesContext(connection) as captured:
+            response = _client(voter).get('/api/resources/')
+        
+        assert _flags(response) == {
+            str(resources[2].id): False,
+            str(resources[1].id): True,
+            str(resources[0].id): False,
+        }
+        queries = _vote_queries(captured)
+        assert len(queries) == 1
+        assert ' IN (' in queries[0]
+    
+    def test_anonymous_gets_false_without_query(self, voter, resources):
+        """Test anonymous listings never query votes."""
+        Vote.objects.create(user=voter, resource=resources[0])
+        
+        with CaptureQueriesContext(connection) as captured:
+            response = _client().get('/api/resources/')
+        
+        assert set(_flags(response).values()) == {False}
+        assert _vote_queries(captured) == []
+    
+    def test_cached_page_is_personalized(self, voter, resources):
+        """Test a cached page shared by users carries each user's own flags."""
+        other = User.objects.create_user('other@example.com', 'Other User', 'pass123')
+        Vote.objects.create(user=voter, resource=resources[0])
+        
+        first = _client(voter).get('/api/resources/')
+        second = _client(other).get('/api/resources/')
+        
+        assert second['X-Cache'] == 'HIT'
+        assert _flags(first)[str(resources[0].id)] is True
+        assert _flags(second)[str(resources[0].id)] is False
+        assert first['ETag'] != second['ETag']
+        assert 'Authorization' in second['Vary']
+    
+    def test_toggle_updates_flag(self, voter, resources):
+        """Test list and detail reflect a toggle immediately."""
+        client = _client(voter)
+        resource_id = str(resources[0].id)
+        assert client.get(f'/api/resources/{resource_id}/').data['user_has_voted'] is False
+        
+        VoteService.toggle_vote(voter, resources[0].id)
+        
+        assert client.get(f'/api/resources/{resource_id}/').data['user_has_voted'] is True
+        assert _flags(client.get('/api/resources/'))[resource_id] is True
+    
+    def test_sparse_fieldset(self, voter, resources):
+        """Test user_has_voted can be selected or left out with ?fields=."""
+        Vote.objects.create(user=voter, resource=resources[0])
+        client = _client(voter)
+        
+        selected = client.get('/api/resources/?fields=id,user_has_voted')
+        omitted = client.get('/api/resources/?fields=id')
+        
+        assert _flags(selected)[str(resources[0].id)] is True
+        assert all(set(row) == {'id'} for row in omitted.data['results'])
+
+
+@pytest.mark.django_db
+class TestVotedResourceIds:
+    """Tests for VoteService.get_voted_resource_ids."""
+    
+    def test_scoped_to_requested_ids(self, voter, resources):
+        """Test only the requested resources are returned."""
+        for resource in resources:
+            Vote.objects.create(user=voter, resource=resource)
+        
+        voted = VoteService.get_voted_resource_ids(voter, [str(resources[0].id), resources[1].id])
+        
+        assert voted == {resources[0].id, resources[1].id}
+    
+    @override_settings(USER_VOTES_CACHE_TIMEOUT=60)
+    def test_cached_vote_set_is_invalidated_on_toggle(self, voter, resources, django_assert_num_queries):
+        """Test the optional per-user cache serves repeat pages and follows toggles."""
+        ids = [resource.id for resource in resources]
+        assert VoteService.get_voted_resource_ids(voter, ids) == set()
+        
+        with django_assert_num_queries(0):
+            VoteService.get_voted_resource_ids(voter, ids)
+        
+        VoteService.toggle_vote(voter, resources[2].id)
+        
+        assert VoteService.get_voted_resource_ids(voter, ids) == {resources[2].id}
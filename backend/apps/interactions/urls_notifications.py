@@ -6,11 +6,13 @@ from apps.interactions.views_notifications import (
     NotificationMarkReadView,
     NotificationMarkAllReadView,
     NotificationUnreadCountView,
+    NotificationStreamView,
 )
 
 urlpatterns = [
     path('', NotificationListView.as_view(), name='notification-list'),
     path('unread-count/', NotificationUnreadCountView.as_view(), name='notification-unread-count'),
+    path('stream/', NotificationStreamView.as_view(), name='notification-stream'),
     path('mark-all-read/', NotificationMarkAllReadView.as_view(), name='notification-mark-all-read'),
     path('<uuid:notification_id>/read/', NotificationMarkReadView.as_view(), name='notification-mark-read'),
 ]
@@ -4,25 +4,38 @@ API views for notifications.
 US-18: Notificaciones In-App
 """
 
+import time
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
-from apps.interactions.services import NotificationService
-from apps.interactions.serializers import (
-    NotificationSerializer,
-    NotificationListSerializer,
-)
+from config.pubsub import get_broker
+from config.renderers import FastJSONRenderer
+from config.sse import EventStreamRenderer, StreamSlots, event_stream_response, format_comment, format_event
+from apps.authentication.authentication import QueryParamJWTAuthentication
+from apps.interactions.services import NotificationService, notification_channel
+from apps.interactions.serializers import NotificationSerializer
 
 
 class NotificationListView(APIView):
     """
-    List user notifications.
+    List user notifications (newest first, cursor-paginated).
     
     GET /api/notifications/
     Query params:
     - unread_only (bool): If true, return only unread notifications
+    - page_size (int): Items per page (default: 20, max: 100)
+    - cursor (str): Opaque cursor from a previous 'next' (older notifications)
+    - since (ISO 8601 datetime): Only notifications created after this
+      (incremental polling: pass the created_at of the newest item seen)
+    
+    count/unread_count come from one aggregate query.
     
     US-18: Notificaciones In-App
     """
@@ -31,22 +44,46 @@ class NotificationListView(APIView):
     
     def get(self, request):
         unread_only = request.query_params.get('unread_only', 'false').lower() == 'true'
+        page_size = max(1, min(int(request.query_params.get('page_size', 20)), 100))
         
-        notifications = NotificationService.get_user_notifications(
-            user=request.user,
-            unread_only=unread_only
-        )
+        since = request.query_params.get('since')
+        if since:
+            # A literal '+' in the offset arrives as a space when not URL-encoded
+            since = parse_datetime(since.replace(' ', '+'))
+            if since is None:
+                return Response(
+                    {'error': 'Invalid since (expected an ISO 8601 datetime)', 'error_code': 'INVALID_SINCE'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
         
-        unread_count = NotificationService.get_unread_count(request.user)
+        try:
+            feed = NotificationService.get_feed(
+                user=request.user,
+                unread_only=unread_only,
+                cursor=request.query_params.get('cursor') or None,
+                since=since,
+                page_size=page_size
+            )
+        except ValueError as e:
+            return Response(
+                {'error': str(e), 'error_code': 'INVALID_CURSOR'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
+        counts = NotificationService.get_counts(request.user)
+        
+        # Items come from the values() fast path (same shape as NotificationSerializer)
         response_data = {
-            'count': notifications.count(),
-            'unread_count': unread_count,
-            'notifications': NotificationSerializer(notifications, many=True).data
+            'count': counts['unread_count'] if unread_only else counts['count'],
+            'unread_count': counts['unread_count'],
+            'notifications': feed['results'],
+            'next': feed['next'],
+            'has_next': feed['has_next'],
         }
         
-        serializer = NotificationListSerializer(response_data)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(response_data, status=status.HTTP_200_OK)
 
 
 class NotificationMarkReadView(APIView):
@@ -115,3 +152,75 @@ class NotificationUnreadCountView(APIView):
             {'unread_count': count},
             status=status.HTTP_200_OK
         )
+
+
+class NotificationStreamView(APIView):
+    """
+    Live notification events over Server-Sent Events.
+    
+    GET /api/notifications/stream/
+    Auth: Authorization header, or ?access_token= for browser EventSource
+    
+    Events:
+    - unread_count: {"unread_count": n} on connect (and after a resync)
+    - notification: {"notification": {...}, "unread_delta": 1}
+    - unread: {"unread_delta": 1} (bulk notifications, no item payload)
+    - read: {"notification_id": id or null, "unread_delta": -n}
+    
+    A ': ping' comment is sent every NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+    and the stream ends after NOTIFICATION_STREAM_MAX_SECONDS (EventSource
+    reconnects on its own). A client too slow to keep up has its backlog
+    dropped and gets a fresh unread_count instead.
+    
+    Each open stream holds a worker thread, so a process serves at most
+    NOTIFICATION_STREAM_MAX_PER_PROCESS at once. Past that the response is
+    only a 'retry:' hint and a 'busy' event, and EventSource reconnects
+    after BUSY_RETRY_MS (a non-200 status would make it give up for good).
+    
+    US-18: Notificaciones In-App
+    """
+    
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [JWTAuthentication, QueryParamJWTAuthentication]
+    renderer_classes = [FastJSONRenderer, EventStreamRenderer]
+    
+    # Client reconnection delay, in milliseconds (normal end / process at capacity)
+    RETRY_MS = 5000
+    BUSY_RETRY_MS = 15000
+    
+    slots = StreamSlots()
+    
+    def get(self, request):
+        if not self.slots.acquire(getattr(settings, 'NOTIFICATION_STREAM_MAX_PER_PROCESS', 8)):
+            return event_stream_response([format_event('busy', {}, retry=self.BUSY_RETRY_MS)])
+        return event_stream_response(self._events(request.user), on_close=self.slots.release)
+    
+    def _events(self, user):
+        heartbeat = getattr(settings, 'NOTIFICATION_STREAM_HEARTBEAT_SECONDS', 15)
+        deadline = time.monotonic() + getattr(settings, 'NOTIFICATION_STREAM_MAX_SECONDS', 300)
+        
+        # Subscribe before counting so no event is lost in between
+        subscription = get_broker().subscribe(notification_channel(user.pk))
+        try:
+            yield format_event(
+                'unread_count',
+                {'unread_count': NotificationService.get_unread_count(user)},
+                retry=self.RETRY_MS
+            )
+            
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                message = subscription.get(timeout=min(heartbeat, remaining))
+                
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    subscription.drain()
+                    yield format_event('unread_count', {'unread_count': NotificationService.get_unread_count(user)})
+                elif message is not None:
+                    yield format_event(message['event'], message['data'])
+                else:
+                    yield format_comment('ping')
+        finally:
+            subscription.close()
@@ -0,0 +1,2 @@
+"""Outbox app: transactional outbox for asynchronous side effects"""
+default_app_config = 'apps.outbox.apps.OutboxConfig'
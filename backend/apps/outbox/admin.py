@@ -0,0 +1,22 @@
+"""
+Admin for outbox app.
+"""
+
+from django.contrib import admin
+from django.utils import timezone
+from apps.outbox.models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """Admin interface for OutboxMessage model (inspect and retry failed messages)."""
+    
+    list_display = ('id', 'topic', 'status', 'attempts', 'available_at', 'created_at')
+    list_filter = ('status', 'topic')
+    search_fields = ('topic', 'last_error')
+    readonly_fields = ('id', 'created_at')
+    actions = ['retry']
+    
+    @admin.action(description='Retry selected messages now')
+    def retry(self, request, queryset):
+        queryset.update(status=OutboxMessage.STATUS_PENDING, attempts=0, available_at=timezone.now())
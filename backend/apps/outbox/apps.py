@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class OutboxConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.outbox'
+    verbose_name = 'Outbox'
+    
+    def ready(self):
+        """Register the outbox handlers declared in each app's tasks.py"""
+        autodiscover_modules('tasks')
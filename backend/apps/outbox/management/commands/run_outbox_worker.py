@@ -0,0 +1,81 @@
+"""
+Management command to deliver outbox messages (emails, notifications).
+
+Run one or more long-lived workers next to the web processes:
+
+    python manage.py run_outbox_worker
+    python manage.py run_outbox_worker --once   # drain what is due and exit (cron, tests)
+
+Several workers can run concurrently: messages are claimed with
+SELECT ... FOR UPDATE SKIP LOCKED (see apps/outbox/services.py).
+"""
+
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from apps.outbox.services import OutboxService
+
+
+class Command(BaseCommand):
+    help = 'Process outbox messages in batches, with retries'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Messages claimed per batch (default: 100)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to sleep when nothing is due (default: 1)',
+        )
+        parser.add_argument(
+            '--lease',
+            type=int,
+            default=300,
+            help='Seconds before a claimed but unfinished message can be claimed again (default: 300)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process every due message and exit',
+        )
+    
+    def handle(self, *args, **options):
+        """Claim and process batches until stopped (SIGINT/SIGTERM) or, with --once, drained."""
+        batch_size = options['batch_size']
+        lease = options['lease']
+        
+        if options['once']:
+            succeeded, failed = OutboxService.process_pending(batch_size=batch_size, lease_seconds=lease)
+            self._report(succeeded, failed)
+            self.stdout.write(self.style.SUCCESS(f'\n✓ Outbox drained ({succeeded} delivered, {failed} failed)'))
+            return
+        
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        self.stdout.write(f'→ Outbox worker started (batch size {batch_size}, lease {lease}s)')
+        
+        while not self._stopping:
+            close_old_connections()
+            succeeded, failed = OutboxService.process_batch(batch_size=batch_size, lease_seconds=lease)
+            if succeeded or failed:
+                self._report(succeeded, failed)
+            else:
+                time.sleep(options['interval'])
+        
+        self.stdout.write(self.style.SUCCESS('\n✓ Outbox worker stopped'))
+    
+    def _stop(self, signum, frame):
+        """Finish the current batch, then exit."""
+        self._stopping = True
+    
+    def _report(self, succeeded, failed):
+        line = f'→ {succeeded} delivered, {failed} failed'
+        self.stdout.write(self.style.WARNING(line) if failed else line)
@@ -0,0 +1,70 @@
+"""
+Outbox model: side effects recorded in the transaction that causes them.
+
+See apps/outbox/services.py for the delivery protocol.
+"""
+
+import uuid
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxMessage(models.Model):
+    """
+    A pending side effect (email, notification, ...) for `manage.py run_outbox_worker`.
+    
+    Messages are deleted once handled; only failed ones stay for inspection.
+    """
+    
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_FAILED = 'failed'
+    
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    
+    topic = models.CharField(
+        _('topic'),
+        max_length=100,
+        help_text=_('Registered handler name (e.g. email.send)')
+    )
+    
+    payload = models.JSONField(_('payload'), default=dict, encoder=DjangoJSONEncoder)
+    
+    status = models.CharField(
+        _('status'),
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING
+    )
+    
+    attempts = models.PositiveIntegerField(_('attempts'), default=0)
+    
+    available_at = models.DateTimeField(
+        _('available at'),
+        default=timezone.now,
+        help_text=_('Next attempt (pending) or lease expiry (processing)')
+    )
+    
+    last_error = models.TextField(_('last error'), blank=True, default='')
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'outbox_messages'
+        ordering = ['available_at']
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='outbox_due_idx'),
+        ]
+        verbose_name = _('outbox message')
+        verbose_name_plural = _('outbox messages')
+    
+    def __str__(self):
+        return f"{self.topic} ({self.status}, {self.attempts} attempt(s))"
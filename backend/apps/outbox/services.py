@@ -0,0 +1,207 @@
+"""
+Transactional outbox.
+
+Side effects that should neither slow down nor fail the request that
+triggers them (emails, notifications and the cache/stream updates they
+cause) are saved as OutboxMessage rows in the same transaction as the
+change (OutboxService.enqueue), so they happen if and only if it commits.
+`manage.py run_outbox_worker` delivers them:
+
+- Claiming: up to batch_size due messages are locked with
+  SELECT ... FOR UPDATE SKIP LOCKED and leased (available_at = now + lease)
+  in one short transaction, so concurrent workers never share a message and
+  the messages of a crashed worker are retried once their lease expires.
+- Handling: each message runs in its own transaction together with its
+  deletion, so database side effects are applied exactly once (external
+  ones, like email, at least once).
+- Retries: a failing message is rescheduled with exponential backoff and
+  marked failed after OUTBOX_MAX_ATTEMPTS attempts.
+
+Handlers are registered per topic with @handler('topic') in each app's
+tasks.py (imported by OutboxConfig.ready()).
+"""
+
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from apps.outbox.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+_handlers = {}
+
+
+def handler(topic):
+    """Register the function handling `topic` messages (called with the payload dict)."""
+    def decorator(func):
+        _handlers[topic] = func
+        return func
+    
+    return decorator
+
+
+def get_max_attempts():
+    """Attempts before a message is marked failed."""
+    return getattr(settings, 'OUTBOX_MAX_ATTEMPTS', 5)
+
+
+def get_retry_delay(attempts):
+    """Seconds before retrying a message that failed `attempts` times (exponential, max 1 hour)."""
+    return min(getattr(settings, 'OUTBOX_RETRY_BASE_SECONDS', 30) * 2 ** (attempts - 1), 3600)
+
+
+class OutboxService:
+    """Service layer for outbox operations."""
+    
+    @staticmethod
+    def enqueue(topic, payload, delay=0):
+        """
+        Record a side effect to run after the current transaction commits.
+        
+        Args:
+            topic (str): Registered handler name
+            payload (dict): JSON-serializable arguments (UUIDs/datetimes allowed)
+            delay (int): Seconds before the message becomes due
+        
+        Returns:
+            OutboxMessage: The saved message
+        
+        Raises:
+            ValueError: If no handler is registered for the topic
+        """
+        if topic not in _handlers:
+            raise ValueError(f'Unknown outbox topic: {topic}')
+        
+        return OutboxMessage.objects.create(
+            topic=topic,
+            payload=payload,
+            available_at=timezone.now() + timedelta(seconds=delay)
+        )
+    
+    @staticmethod
+    def enqueue_email(subject, message, recipient_list, from_email=None):
+        """
+        Queue a plain-text email (same arguments as django.core.mail.send_mail).
+        
+        Returns:
+            OutboxMessage: The saved message
+        """
+        return OutboxService.enqueue('email.send', {
+            'subject': subject,
+            'message': message,
+            'from_email': from_email or settings.DEFAULT_FROM_EMAIL,
+            'recipient_list': list(recipient_list),
+        })
+    
+    @staticmethod
+    def claim(batch_size=100, lease_seconds=300):
+        """
+        Lease up to `batch_size` due messages for this worker.
+        
+        Args:
+            batch_size (int): Maximum messages to claim
+            lease_seconds (int): Time after which an unfinished message is claimable again
+        
+        Returns:
+            list: Claimed OutboxMessage instances (attempts already incremented)
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            messages = list(
+                OutboxMessage.objects.select_for_update(skip_locked=True).filter(
+                    status__in=[OutboxMessage.STATUS_PENDING, OutboxMessage.STATUS_PROCESSING],
+                    available_at__lte=now
+                ).order_by('available_at')[:batch_size]
+            )
+            if messages:
+                OutboxMessage.objects.filter(pk__in=[message.pk for message in messages]).update(
+                    status=OutboxMessage.STATUS_PROCESSING,
+                    available_at=now + timedelta(seconds=lease_seconds),
+                    attempts=F('attempts') + 1
+                )
+        
+        for message in messages:
+            message.status = OutboxMessage.STATUS_PROCESSING
+            message.attempts += 1
+        return messages
+    
+    @staticmethod
+    def process(message):
+        """
+        Run a claimed message's handler and delete the message in one transaction.
+        
+        Args:
+            message (OutboxMessage): A message returned by claim()
+        
+        Returns:
+            bool: True if the handler succeeded
+        """
+        func = _handlers.get(message.topic)
+        try:
+            if func is None:
+                raise LookupError(f'No handler registered for outbox topic: {message.topic}')
+            with transaction.atomic():
+                func(message.payload)
+                OutboxMessage.objects.filter(pk=message.pk).delete()
+        except Exception as exc:
+            OutboxService._record_failure(message, exc)
+            return False
+        return True
+    
+    @staticmethod
+    def _record_failure(message, exc):
+        error = ''.join(traceback.format_exception_only(type(exc), exc)).strip()
+        if message.attempts >= get_max_attempts():
+            status = OutboxMessage.STATUS_FAILED
+            available_at = timezone.now()
+            logger.error('Outbox message %s (%s) failed permanently: %s', message.pk, message.topic, error)
+        else:
+            status = OutboxMessage.STATUS_PENDING
+            available_at = timezone.now() + timedelta(seconds=get_retry_delay(message.attempts))
+            logger.warning('Outbox message %s (%s) failed, will retry: %s', message.pk, message.topic, error)
+        
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            status=status,
+            available_at=available_at,
+            last_error=error
+        )
+        message.status = status
+        message.available_at = available_at
+        message.last_error = error
+    
+    @staticmethod
+    def process_batch(batch_size=100, lease_seconds=300):
+        """
+        Claim and process one batch.
+        
+        Returns:
+            tuple: (succeeded, failed) counts; (0, 0) when nothing was due
+        """
+        succeeded = failed = 0
+        for message in OutboxService.claim(batch_size=batch_size, lease_seconds=lease_seconds):
+            if OutboxService.process(message):
+                succeeded += 1
+            else:
+                failed += 1
+        return succeeded, failed
+    
+    @staticmethod
+    def process_pending(batch_size=100, lease_seconds=300):
+        """
+        Process batches until no message is due (retries scheduled later are left).
+        
+        Returns:
+            tuple: (succeeded, failed) counts
+        """
+        succeeded = failed = 0
+        while True:
+            batch_succeeded, batch_failed = OutboxService.process_batch(batch_size, lease_seconds)
+            if not batch_succeeded and not batch_failed:
+                return succeeded, failed
+            succeeded += batch_succeeded
+            failed += batch_failed
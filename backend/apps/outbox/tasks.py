@@ -0,0 +1,18 @@
+"""
+Generic outbox handlers.
+"""
+
+from django.core.mail import send_mail
+from apps.outbox.services import handler
+
+
+@handler('email.send')
+def send_email(payload):
+    """Send a queued email; SMTP errors propagate so the message is retried."""
+    send_mail(
+        subject=payload['subject'],
+        message=payload['message'],
+        from_email=payload['from_email'],
+        recipient_list=payload['recipient_list'],
+        fail_silently=False,
+    )
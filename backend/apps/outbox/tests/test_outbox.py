@@ -0,0 +1,264 @@
+"""
+Tests for the transactional outbox and run_outbox_worker.
+"""
+
+import smtplib
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+from apps.authentication.models import Role
+from apps.authentication.services import AuthService
+from apps.interactions.models import Notification
+from apps.outbox import services as outbox_services
+from apps.outbox.models import OutboxMessage
+from apps.outbox.services import OutboxService
+from apps.resources.models import Resource, ResourceVersion
+from apps.resources.services import ResourceService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    """Create a test user."""
+    return User.objects.create_user('owner@example.com', 'Owner', 'pass123')
+
+
+@pytest.fixture
+def admin_user():
+    """Create an admin user."""
+    admin_role, _ = Role.objects.get_or_create(name='Admin')
+    admin = User.objects.create_user('admin@example.com', 'Admin User', 'pass123')
+    admin.roles.add(admin_role)
+    return admin
+
+
+@pytest.fixture
+def resource(user):
+    """Create a test resource."""
+    resource = Resource.objects.create(owner=user, source_type='Internal')
+    ResourceVersion.objects.create(
+        resource=resource,
+        version_number='1.0.0',
+        title='Test Resource',
+        description='Test',
+        type='Prompt',
+        content='Content',
+        is_latest=True
+    )
+    return resource
+
+
+@pytest.fixture
+def flaky_handler(monkeypatch):
+    """Register a 'test.flaky' handler that creates a row and then fails while `calls['fail']` is set."""
+    calls = {'count': 0, 'fail': True}
+    
+    def flaky(payload):
+        calls['count'] += 1
+        User.objects.create_user(f'side-effect-{calls["count"]}@example.com', 'Side Effect', 'pass123')
+        if calls['fail']:
+            raise RuntimeError('boom')
+    
+    monkeypatch.setitem(outbox_services._handlers, 'test.flaky', flaky)
+    return calls
+
+
+@pytest.mark.django_db
+class TestOutboxService:
+    """Tests for OutboxService."""
+    
+    def test_enqueue_unknown_topic(self):
+        """Test enqueuing needs a registered handler."""
+        with pytest.raises(ValueError, match='Unknown outbox topic: nope'):
+            OutboxService.enqueue('nope', {})
+    
+    def test_enqueue_is_part_of_the_transaction(self):
+        """Test a rolled-back change leaves no message behind."""
+        with transaction.atomic():
+            OutboxService.enqueue_email('Subject', 'Body', ['a@example.com'])
+            transaction.set_rollback(True)
+        
+        assert not OutboxMessage.objects.exists()
+    
+    def test_email_delivered_and_message_deleted(self):
+        """Test queued emails are sent by the worker."""
+        OutboxService.enqueue_email('Subject', 'Body', ['a@example.com'])
+        assert len(mail.outbox) == 0
+        
+        assert OutboxService.process_pending() == (1, 0)
+        
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].subject == 'Subject'
+        assert mail.outbox[0].to == ['a@example.com']
+        assert not OutboxMessage.objects.exists()
+    
+    def test_delayed_message_not_due(self):
+        """Test messages wait for their available_at."""
+        OutboxService.enqueue_email('Subject', 'Body', ['a@example.com'])
+        OutboxMessage.objects.update(available_at=timezone.now() + timedelta(minutes=5))
+        
+        assert OutboxService.process_pending() == (0, 0)
+    
+    def test_failure_is_retried_with_backoff(self, flaky_handler, settings):
+        """Test a failing handler is rolled back and rescheduled."""
+        settings.OUTBOX_RETRY_BASE_SECONDS = 30
+        OutboxService.enqueue('test.flaky', {})
+        
+        assert OutboxService.process_pending() == (0, 1)
+        
+        message = OutboxMessage.objects.get()
+        assert message.status == OutboxMessage.STATUS_PENDING
+        assert message.attempts == 1
+        assert 'RuntimeError: boom' in message.last_error
+        assert message.available_at > timezone.now() + timedelta(seconds=25)
+        # The handler's database changes were rolled back with it
+        assert not User.objects.filter(email__startswith='side-effect-').exists()
+        
+        flaky_handler['fail'] = False
+        OutboxMessage.objects.update(available_at=timezone.now())
+        assert OutboxService.process_pending() == (1, 0)
+        assert User.objects.filter(email__startswith='side-effect-').count() == 1
+        assert not OutboxMessage.objects.exists()
+    
+    def test_marked_failed_after_max_attempts(self, flaky_handler, settings):
+        """Test a message stops being retried after OUTBOX_MAX_ATTEMPTS."""
+        settings.OUTBOX_MAX_ATTEMPTS = 2
+        settings.OUTBOX_RETRY_BASE_SECONDS = 0
+        OutboxService.enqueue('test.flaky', {})
+        
+        assert OutboxService.process_pending() == (0, 2)
+        
+        message = OutboxMessage.objects.get()
+        assert message.status == OutboxMessage.STATUS_FAILED
+        assert message.attempts == 2
+        assert OutboxService.process_pending() == (0, 0)
+    
+    def test_retry_delay_grows_exponentially(self, settings):
+        """Test backoff doubles per attempt and is capped."""
+        settings.OUTBOX_RETRY_BASE_SECONDS = 30
+        
+        assert [outbox_services.get_retry_delay(attempts) for attempts in (1, 2, 3)] == [30, 60, 120]
+        assert outbox_services.get_retry_delay(20) == 3600
+    
+    def test_claimed_messages_are_leased(self):
+        """Test a claimed message is not handed out again until its lease expires."""
+        OutboxService.enqueue_email('Subject', 'Body', ['a@example.com'])
+        
+        claimed = OutboxService.claim(lease_seconds=60)
+        assert len(claimed) == 1
+        assert OutboxService.claim() == []
+        
+        # Worker died: once the lease is over the message is claimable again
+        OutboxMessage.objects.update(available_at=timezone.now() - timedelta(seconds=1))
+        reclaimed = OutboxService.claim()
+        assert [message.pk for message in reclaimed] == [claimed[0].pk]
+        assert reclaimed[0].attempts == 2
+    
+    def test_batches(self):
+        """Test claim() honours batch_size."""
+        for index in range(5):
+            OutboxService.enqueue_email('Subject', 'Body', [f'user{index}@example.com'])
+        
+        assert len(OutboxService.claim(batch_size=2)) == 2
+        assert OutboxService.process_pending(batch_size=2) == (3, 0)
+    
+    def test_smtp_outage_does_not_fail_registration(self, monkeypatch):
+        """Test registration succeeds while SMTP is down and the email is retried."""
+        Role.objects.get_or_create(name='User')
+        
+        def smtp_down(**kwargs):
+            raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        
+        monkeypatch.setattr('apps.outbox.tasks.send_mail', smtp_down)
+        user = AuthService.register('new@example.com', 'New User', 'pass12345')
+        
+        assert user.pk is not None
+        assert OutboxService.process_pending() == (0, 1)
+        assert 'SMTPServerDisconnected' in OutboxMessage.objects.get().last_error
+
+
+@pytest.mark.django_db
+class TestResourceOutboxHandlers:
+    """Tests for the notification handlers fed by resource events."""
+    
+    def test_validation_notifies_owner_after_commit(self, user, admin_user, resource):
+        """Test validate_resource queues the owner's notification."""
+        ResourceService.validate_resource(admin_user, resource.id)
+        assert not Notification.objects.exists()
+        
+        OutboxService.process_pending()
+        
+        notification = Notification.objects.get()
+        assert notification.user == user
+        assert notification.type == 'resource_validated'
+        assert notification.actor == admin_user
+        assert notification.message == 'Tu recurso "Test Resource" ha sido validado'
+    
+    def test_fork_of_deleted_resource_is_skipped(self, user, admin_user, resource):
+        """Test a resource deleted before delivery produces no notification."""
+        ResourceService.fork_resource(admin_user, resource.id)
+        Resource.objects.filter(pk=resource.pk).delete()
+        
+        assert OutboxService.process_pending() == (1, 0)
+        assert not Notification.objects.filter(type='resource_forked').exists()
+    
+    def test_self_fork_queues_nothing(self, user, resource):
+        """Test owners forking their own resource are not notified."""
+        ResourceService.fork_resource(user, resource.id)
+        
+        assert not OutboxMessage.objects.exists()
+    
+    def test_validation_request_notifies_admins(self, user, admin_user):
+        """Test publishing with status Pending Validation queues the admin fan-out."""
+        resource = ResourceService.create_resource(user, {
+            'title': 'Needs Review',
+            'description': 'Test',
+            'type': 'Prompt',
+            'content': 'Content',
+            'status': 'Pending Validation',
+        })
+        assert not Notification.objects.exists()
+        
+        assert OutboxService.process_pending() == (1, 0)
+        
+        notification = Notification.objects.get()
+        assert notification.user == admin_user
+        assert notification.type == 'validation_requested'
+        assert notification.resource == resource
+        assert notification.actor == user
+        assert notification.message == 'Nueva solicitud de validación: "Needs Review"'
+    
+    def test_sandbox_resource_queues_nothing(self, user, admin_user):
+        """Test publishing to the sandbox notifies nobody."""
+        ResourceService.create_resource(user, {
+            'title': 'Draft',
+            'description': 'Test',
+            'type': 'Prompt',
+            'content': 'Content',
+        })
+        
+        assert not OutboxMessage.objects.exists()
+
+
+@pytest.mark.django_db
+class TestRunOutboxWorkerCommand:
+    """Tests for manage.py run_outbox_worker."""
+    
+    def test_once_drains_due_messages(self):
+        """Test --once processes everything due and reports."""
+        for index in range(3):
+            OutboxService.enqueue_email('Subject', 'Body', [f'user{index}@example.com'])
+        out = StringIO()
+        
+        call_command('run_outbox_worker', '--once', '--batch-size', '2', stdout=out)
+        
+        assert 'Outbox drained (3 delivered, 0 failed)' in out.getvalue()
+        assert len(mail.outbox) == 3
+        assert not OutboxMessage.objects.exists()
@@ -9,7 +9,7 @@ class ResourceAdmin(admin.ModelAdmin):
     list_display = ('id', 'owner', 'source_type', 'forks_count', 'created_at')
     list_filter = ('source_type', 'created_at')
     search_fields = ('id', 'owner__email', 'owner__name')
-    raw_id_fields = ('owner', 'derived_from_resource', 'derived_from_version')
+    raw_id_fields = ('owner', 'latest_version', 'derived_from_resource', 'derived_from_version')
     readonly_fields = ('id', 'created_at', 'updated_at')
     date_hierarchy = 'created_at'
 
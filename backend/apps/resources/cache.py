@@ -0,0 +1,175 @@
+"""
+Response caching for resource read endpoints.
+
+Each resource has a version stamp in the cache; cached detail payloads are
+keyed by (resource id, stamp). Listing pages are keyed by a hash of the
+normalized query plus a catalog-wide generation token. Writes call
+invalidate_resource() (Resource and ResourceVersion saves,
+VoteService.toggle_vote), which replaces both tokens so every older payload
+becomes unreachable and simply expires. Owner data is embedded in the
+payloads too, so profile and role changes call invalidate_owner_resources().
+
+Uses the default Django cache. Invalidation only reaches processes that share
+it, so production uses Redis (config/settings/production.py); the locmem
+default is only correct with a single process (runserver, tests).
+
+US-05: Explorar Recursos
+US-07: Ver Detalle
+"""
+
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+KEY_PREFIX = 'resources'
+
+
+CATALOG_GENERATION_KEY = f'{KEY_PREFIX}:catalog:generation'
+LIST_HITS_KEY = f'{KEY_PREFIX}:list:hits'
+LIST_MISSES_KEY = f'{KEY_PREFIX}:list:misses'
+
+
+def _stamp_key(resource_id):
+    return f'{KEY_PREFIX}:{resource_id}:stamp'
+
+
+def _detail_key(resource_id, stamp):
+    return f'{KEY_PREFIX}:{resource_id}:detail:{stamp}'
+
+
+def get_detail_timeout():
+    """Seconds a cached detail payload is kept."""
+    return getattr(settings, 'RESOURCE_DETAIL_CACHE_TIMEOUT', 300)
+
+
+def get_resource_stamp(resource_id):
+    """Return the current version stamp of a resource, creating one if missing."""
+    return cache.get_or_set(_stamp_key(resource_id), lambda: uuid.uuid4().hex, timeout=None)
+
+
+def get_cached_detail(resource_id):
+    """
+    Look up the cached detail payload of a resource.
+
+    Returns:
+        tuple: (payload or None, stamp). Pass the stamp back to set_cached_detail
+        so a payload computed before an invalidation is never served.
+    """
+    stamp = get_resource_stamp(resource_id)
+    return cache.get(_detail_key(resource_id, stamp)), stamp
+
+
+def set_cached_detail(resource_id, stamp, payload):
+    """Store a serialized detail payload under the stamp it was computed for."""
+    cache.set(_detail_key(resource_id, stamp), payload, timeout=get_detail_timeout())
+
+
+def get_list_timeout():
+    """Seconds a cached listing page is kept."""
+    return getattr(settings, 'RESOURCE_LIST_CACHE_TIMEOUT', 30)
+
+
+def get_catalog_generation():
+    """Return the current catalog generation token, creating one if missing."""
+    return cache.get_or_set(CATALOG_GENERATION_KEY, lambda: uuid.uuid4().hex, timeout=None)
+
+
+def list_cache_key(params, generation):
+    """
+    Build the cache key of a listing query.
+
+    Args:
+        params (dict): Already normalized query (sorted tags, normalized search, ...)
+        generation (str): Catalog generation token
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)
+    digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return f'{KEY_PREFIX}:list:{generation}:{digest}'
+
+
+def _incr(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Counter missing (first use or evicted)
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def get_cached_list(params):
+    """
+    Look up a cached listing page and record a hit or miss.
+
+    Returns:
+        tuple: (payload or None, cache key to pass to set_cached_list)
+    """
+    key = list_cache_key(params, get_catalog_generation())
+    payload = cache.get(key)
+    _incr(LIST_HITS_KEY if payload is not None else LIST_MISSES_KEY)
+    return payload, key
+
+
+def set_cached_list(key, payload):
+    """Store a serialized listing page."""
+    cache.set(key, payload, timeout=get_list_timeout())
+
+
+def is_shared_cache():
+    """Return True unless the default cache lives inside each process (locmem, dummy)."""
+    backend = settings.CACHES['default']['BACKEND']
+    return not backend.endswith(('.LocMemCache', '.DummyCache'))
+
+
+def get_list_cache_stats():
+    """
+    Return listing cache counters.
+
+    The counters live in the default cache: with a per-process backend they
+    only cover the worker that answers, which `scope` reports.
+
+    Returns:
+        dict: {'hits': int, 'misses': int, 'hit_rate': float, 'scope': 'shared' or 'process'}
+    """
+    hits = cache.get(LIST_HITS_KEY, 0)
+    misses = cache.get(LIST_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0,
+        'scope': 'shared' if is_shared_cache() else 'process',
+    }
+
+
+def _bump(*resource_ids):
+    tokens = {_stamp_key(resource_id): uuid.uuid4().hex for resource_id in resource_ids}
+    tokens[CATALOG_GENERATION_KEY] = uuid.uuid4().hex
+    cache.set_many(tokens, timeout=None)
+
+
+def invalidate_resource(resource_id):
+    """
+    Invalidate cached payloads of a resource and every cached listing page.
+
+    Bumps the tokens immediately and again after commit, so readers that
+    cached pre-commit data in between are invalidated too.
+    """
+    _bump(resource_id)
+    transaction.on_commit(lambda: _bump(resource_id))
+
+
+def invalidate_owner_resources(*user_ids):
+    """
+    Invalidate cached payloads embedding these users as `owner` (profile or role change).
+
+    Same immediate + after-commit bump as invalidate_resource().
+    """
+    from apps.resources.models import Resource
+
+    resource_ids = list(Resource.objects.filter(owner_id__in=user_ids).values_list('id', flat=True))
+    _bump(*resource_ids)
+    transaction.on_commit(lambda: _bump(*resource_ids))
@@ -0,0 +1,74 @@
+"""
+Management command to compare listing serialization paths.
+
+Times one page of GET /api/resources/ (query + serialization + JSON
+rendering) through ResourceListSerializer/JSONRenderer and through the
+values() fast path/FastJSONRenderer, and reports the cost per row.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from config.renderers import FastJSONRenderer, orjson
+from apps.resources.projections import fetch_resource_list
+from apps.resources.serializers import ResourceListSerializer
+from apps.resources.services import ResourceService
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-row cost of the resource listing: DRF serializer vs values() fast path'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=100,
+            help='Rows per page (default: 100)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Timed iterations per path (default: 20)',
+        )
+    
+    def handle(self, *args, **options):
+        """Time both paths over the first listing page."""
+        page_size = options['page_size']
+        repeat = options['repeat']
+        
+        page = ResourceService._build_list_queryset().order_by('-created_at')[:page_size]
+        row_count = page.count()
+        if row_count == 0:
+            self.stdout.write(self.style.WARNING('→ No resources to benchmark'))
+            return
+        
+        def serializer_path():
+            return JSONRenderer().render(ResourceListSerializer(list(page.all()), many=True).data)
+        
+        def fast_path():
+            return FastJSONRenderer().render(fetch_resource_list(page.all()))
+        
+        self.stdout.write(f'→ {row_count} row(s) x {repeat} iteration(s), orjson: {"yes" if orjson else "no"}')
+        
+        before = self._per_row_us(serializer_path, repeat, row_count)
+        after = self._per_row_us(fast_path, repeat, row_count)
+        
+        self.stdout.write(f'  DRF serializer + JSONRenderer: {before:.1f} µs/row')
+        self.stdout.write(f'  values() rows + FastJSONRenderer: {after:.1f} µs/row')
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Fast path is {before / after:.1f}x faster per row')
+        )
+    
+    def _per_row_us(self, func, repeat, row_count):
+        """Best-of-N wall time of func, in microseconds per row."""
+        func()  # warm up (query compilation, imports)
+        best = min(self._timed(func) for _ in range(repeat))
+        return best / row_count * 1_000_000
+    
+    @staticmethod
+    def _timed(func):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
@@ -0,0 +1,38 @@
+"""
+Management command to rebuild resource full-text search vectors.
+"""
+
+from django.core.management.base import BaseCommand
+from apps.resources.models import Resource
+from apps.resources.search import index_version, is_full_text_enabled
+
+
+class Command(BaseCommand):
+    help = 'Rebuild Resource.search_vector from each latest version (PostgreSQL only)'
+    
+    def handle(self, *args, **options):
+        """Re-index every resource that has a latest version."""
+        if not is_full_text_enabled():
+            self.stdout.write(
+                self.style.WARNING('→ Database has no full-text support; search uses the icontains fallback')
+            )
+            return
+        
+        resources = Resource.objects.filter(
+            latest_version__isnull=False
+        ).select_related('latest_version').only(
+            'id',
+            'latest_version__resource_id',
+            'latest_version__title',
+            'latest_version__description',
+            'latest_version__tags',
+        )
+        
+        indexed_count = 0
+        for resource in resources.iterator(chunk_size=500):
+            index_version(resource.latest_version)
+            indexed_count += 1
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Re-indexed {indexed_count} resource(s)')
+        )
@@ -0,0 +1,45 @@
+"""
+Management command to recompute Resource.trending_score from votes and forks.
+
+Scores are kept up to date by vote toggles and forks; run this after changing
+TRENDING_HALF_LIFE_HOURS, or periodically to repair drift. Scores are rebased
+to the current epoch first (see apps/resources/trending.py).
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from apps.resources.trending import refresh_scores
+
+
+class Command(BaseCommand):
+    help = 'Recompute the time-decayed trending score of every resource (or the given resources)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--resource',
+            action='append',
+            dest='resource_ids',
+            metavar='RESOURCE_ID',
+            help='Only refresh this resource (repeatable)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Resources per locked batch (default: 500)',
+        )
+    
+    def handle(self, *args, **options):
+        """Recompute scores in batches."""
+        started = time.monotonic()
+        
+        updated = refresh_scores(
+            resource_ids=options['resource_ids'],
+            batch_size=options['batch_size']
+        )
+        
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✓ Refreshed trending score of {updated} resource(s) in {elapsed:.1f}s')
+        )
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_latest_version(apps, schema_editor):
+    """Point every resource at its current is_latest=True version."""
+    Resource = apps.get_model("resources", "Resource")
+    ResourceVersion = apps.get_model("resources", "ResourceVersion")
+
+    latest = ResourceVersion.objects.filter(resource_id=OuterRef("pk"), is_latest=True).order_by("-created_at")
+    Resource.objects.update(latest_version_id=Subquery(latest.values("id")[:1]))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0002_alter_resourceversion_tags"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="latest_version",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="resources.resourceversion",
+                verbose_name="latest version",
+            ),
+        ),
+        migrations.RunPython(backfill_latest_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:17
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+GIN_INDEX_NAME = "idx_resources_search_vector"
+
+
+def create_search_index(apps, schema_editor):
+    """Create the GIN index and backfill vectors from latest versions (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    search_config = getattr(settings, "RESOURCE_SEARCH_CONFIG", "english")
+    schema_editor.execute(f"CREATE INDEX IF NOT EXISTS {GIN_INDEX_NAME} ON resources USING gin (search_vector)")
+    schema_editor.execute(
+        """
+        UPDATE resources r SET search_vector =
+            setweight(to_tsvector(%s::regconfig, coalesce(v.title, '')), 'A') ||
+            setweight(to_tsvector(%s::regconfig, coalesce(v.description, '')), 'B') ||
+            setweight(to_tsvector(%s::regconfig, coalesce(
+                (SELECT string_agg(t, ' ') FROM jsonb_array_elements_text(v.tags) AS t), ''
+            )), 'C')
+        FROM resource_versions v
+        WHERE v.id = r.latest_version_id
+        """,
+        params=[search_config, search_config, search_config],
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(f"DROP INDEX IF EXISTS {GIN_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0003_resource_latest_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True, verbose_name="search vector"
+            ),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
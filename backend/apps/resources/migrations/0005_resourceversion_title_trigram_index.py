@@ -0,0 +1,34 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:40
+
+from django.db import migrations
+
+TRIGRAM_INDEX_NAME = "idx_versions_latest_title_trgm"
+
+
+def create_trigram_index(apps, schema_editor):
+    """Enable pg_trgm and index latest-version titles for autocomplete (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX_NAME} "
+        "ON resource_versions USING gin (title gin_trgm_ops) WHERE is_latest"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TRIGRAM_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0004_resource_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
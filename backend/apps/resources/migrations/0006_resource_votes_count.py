@@ -0,0 +1,42 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:20
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_votes_count(apps, schema_editor):
+    """Initialize the stored counter from the votes table."""
+    Resource = apps.get_model("resources", "Resource")
+    Vote = apps.get_model("interactions", "Vote")
+
+    counts = (
+        Vote.objects.filter(resource_id=OuterRef("pk"))
+        .order_by()
+        .values("resource_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Resource.objects.update(votes_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0005_resourceversion_title_trigram_index"),
+        ("interactions", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="votes_count",
+            field=models.IntegerField(default=0, verbose_name="votes count"),
+        ),
+        migrations.RunPython(backfill_votes_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="resource",
+            index=models.Index(fields=["-votes_count", "-id"], name="resources_votes_c_88f98d_idx"),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0006_resource_votes_count"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="resource",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name="updated at"),
+        ),
+        migrations.AlterField(
+            model_name="resourceversion",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name="updated at"),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:42
+
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Score formula as of this migration, kept inline so later edits to
+# apps/resources/trending.py cannot change what this migration writes
+# (0009 rewrites the scores relative to a moving epoch)
+VOTE_WEIGHT = 1.0
+FORK_WEIGHT = 5.0
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+MAX_EXPONENT = 1000.0
+
+
+def event_score(weight, at):
+    exponent = (at - EPOCH).total_seconds() / (getattr(settings, "TRENDING_HALF_LIFE_HOURS", 48) * 3600)
+    return weight * 2.0 ** max(min(exponent, MAX_EXPONENT), -MAX_EXPONENT)
+
+
+def backfill_trending_score(apps, schema_editor):
+    """Initialize the stored score from existing votes and forks."""
+    Resource = apps.get_model("resources", "Resource")
+    Vote = apps.get_model("interactions", "Vote")
+
+    scores = {}
+    for resource_id, created_at in Vote.objects.values_list("resource_id", "created_at").iterator():
+        scores[resource_id] = scores.get(resource_id, 0.0) + event_score(VOTE_WEIGHT, created_at)
+    forks = Resource.objects.filter(derived_from_resource__isnull=False).values_list(
+        "derived_from_resource_id", "created_at"
+    )
+    for resource_id, created_at in forks.iterator():
+        scores[resource_id] = scores.get(resource_id, 0.0) + event_score(FORK_WEIGHT, created_at)
+
+    for resource_id, score in scores.items():
+        Resource.objects.filter(pk=resource_id).update(trending_score=score)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0007_updated_at_indexes"),
+        ("interactions", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="trending_score",
+            field=models.FloatField(default=0.0, verbose_name="trending score"),
+        ),
+        migrations.RunPython(backfill_trending_score, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="resource",
+            index=models.Index(fields=["-trending_score", "-id"], name="resources_trendin_71380c_idx"),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.0.1 on 2026-10-18 15:25
+
+import math
+import time
+
+import apps.resources.trending
+from django.conf import settings
+from django.db import migrations, models
+
+# Score formula as of this migration, kept inline so later edits to
+# apps/resources/trending.py cannot change what this migration writes
+VOTE_WEIGHT = 1.0
+FORK_WEIGHT = 5.0
+REBASE_HALF_LIVES = 64
+MAX_EXPONENT = 1000.0
+
+
+def recompute_trending_scores(apps, schema_editor):
+    """Rewrite every score relative to the current epoch period."""
+    Resource = apps.get_model("resources", "Resource")
+    Vote = apps.get_model("interactions", "Vote")
+
+    half_life = getattr(settings, "TRENDING_HALF_LIFE_HOURS", 48) * 3600
+    period = REBASE_HALF_LIVES * half_life
+    epoch = float(math.floor(time.time() / period) * period)
+
+    def event_score(weight, at):
+        exponent = (at.timestamp() - epoch) / half_life
+        return weight * 2.0 ** max(min(exponent, MAX_EXPONENT), -MAX_EXPONENT)
+
+    scores = {}
+    for resource_id, created_at in Vote.objects.values_list("resource_id", "created_at").iterator():
+        scores[resource_id] = scores.get(resource_id, 0.0) + event_score(VOTE_WEIGHT, created_at)
+    forks = Resource.objects.filter(derived_from_resource__isnull=False).values_list(
+        "derived_from_resource_id", "created_at"
+    )
+    for resource_id, created_at in forks.iterator():
+        scores[resource_id] = scores.get(resource_id, 0.0) + event_score(FORK_WEIGHT, created_at)
+
+    Resource.objects.update(trending_score=0.0, trending_epoch=epoch)
+    for resource_id, score in scores.items():
+        Resource.objects.filter(pk=resource_id).update(trending_score=score)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0008_resource_trending_score"),
+        ("interactions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="trending_epoch",
+            field=models.FloatField(default=apps.resources.trending.current_epoch, verbose_name="trending epoch"),
+        ),
+        migrations.RunPython(recompute_trending_scores, migrations.RunPython.noop),
+    ]
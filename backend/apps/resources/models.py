@@ -13,10 +13,12 @@ US-08: Publicar Recurso
 
 import uuid
 import hashlib
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import SearchVectorField
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import RegexValidator
+from apps.resources.trending import current_epoch
 
 User = get_user_model()
 
@@ -66,15 +68,33 @@ class Resource(models.Model):
         verbose_name=_('derived from version')
     )
     
+    # Denormalized pointer to the current version (kept in sync by ResourceVersion.save)
+    latest_version = models.ForeignKey(
+        'ResourceVersion',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=_('latest version')
+    )
+    
     # Denormalized metrics (for performance)
     forks_count = models.IntegerField(_('forks count'), default=0)
+    votes_count = models.IntegerField(_('votes count'), default=0)
+    
+    # Time-decayed vote/fork score, stored relative to trending_epoch (Unix time, see trending.py)
+    trending_score = models.FloatField(_('trending score'), default=0.0)
+    trending_epoch = models.FloatField(_('trending epoch'), default=current_epoch)
+    
+    # Full-text search document of the latest version (PostgreSQL only, see search.py)
+    search_vector = SearchVectorField(_('search vector'), null=True, blank=True, editable=False)
     
     # Soft delete
     deleted_at = models.DateTimeField(_('deleted at'), null=True, blank=True, db_index=True)
     
     # Timestamps
     created_at = models.DateTimeField(_('created at'), auto_now_add=True, db_index=True)
-    updated_at = models.DateTimeField(_('updated at'), auto_now=True)
+    updated_at = models.DateTimeField(_('updated at'), auto_now=True, db_index=True)
     
     class Meta:
         db_table = 'resources'
@@ -84,21 +104,58 @@ class Resource(models.Model):
         indexes = [
             models.Index(fields=['owner', '-created_at']),
             models.Index(fields=['-created_at']),
+            models.Index(fields=['-votes_count', '-id']),
+            models.Index(fields=['-trending_score', '-id']),
         ]
     
     def __str__(self):
         latest = self.latest_version
         return f"{latest.title if latest else 'Untitled'} (by {self.owner.name})"
     
-    @property
-    def latest_version(self):
-        """Get the latest version of this resource."""
-        return self.versions.filter(is_latest=True).first()
+    def save(self, *args, **kwargs):
+        """
+        Override save to drop cached responses and autocomplete data (e.g. after a soft delete)
+        and to keep the owner's metrics in step when deleted_at is set or cleared.
+        """
+        update_fields = kwargs.get('update_fields')
+        tracks_deletion = not self._state.adding and (update_fields is None or 'deleted_at' in update_fields)
+        
+        with transaction.atomic():
+            previous = None
+            if tracks_deletion:
+                previous = self._locked_deletion_state().first()
+            
+            super().save(*args, **kwargs)
+            
+            if previous is not None and (previous['deleted_at'] is None) != (self.deleted_at is None):
+                self._apply_deletion_metrics(previous, sign=-1 if self.deleted_at else 1)
+        
+        from apps.resources.cache import invalidate_resource
+        from apps.resources.suggest import invalidate_suggest_index
+        invalidate_resource(self.pk)
+        invalidate_suggest_index()
     
-    @property
-    def votes_count(self):
-        """Count of votes (computed)."""
-        return self.votes.count()
+    def _locked_deletion_state(self):
+        """
+        The stored row's deletion state, locked so concurrent deletes/restores apply the metrics delta once.
+        
+        latest_version is a nullable FK (LEFT OUTER JOIN): PostgreSQL only accepts
+        FOR UPDATE OF the resources table there.
+        """
+        return Resource.objects.select_for_update(of=('self',)).filter(pk=self.pk).values(
+            'deleted_at', 'votes_count', 'forks_count', 'latest_version__status'
+        )
+    
+    def _apply_deletion_metrics(self, row, sign):
+        """A deleted resource stops counting towards its owner's profile; a restored one counts again."""
+        from apps.authentication.services import UserMetricsService
+        UserMetricsService.apply(
+            self.owner_id,
+            resources=sign,
+            validated=sign if row['latest_version__status'] == 'Validated' else 0,
+            votes=sign * row['votes_count'],
+            reuses=sign * row['forks_count']
+        )
     
     @property
     def is_fork(self):
@@ -129,6 +186,9 @@ class ResourceVersion(models.Model):
         ('Validated', 'Validated'),
     ]
     
+    # Fields that feed Resource.search_vector
+    SEARCH_FIELDS = {'title', 'description', 'tags'}
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     resource = models.ForeignKey(
         Resource,
@@ -184,7 +244,7 @@ class ResourceVersion(models.Model):
     
     # Timestamps
     created_at = models.DateTimeField(_('created at'), auto_now_add=True, db_index=True)
-    updated_at = models.DateTimeField(_('updated at'), auto_now=True)
+    updated_at = models.DateTimeField(_('updated at'), auto_now=True, db_index=True)
     
     class Meta:
         db_table = 'resource_versions'
@@ -209,8 +269,47 @@ class ResourceVersion(models.Model):
         return f"ccg-ai:R-{self.resource_id}@v{self.version_number}"
     
     def save(self, *args, **kwargs):
-        """Override save to calculate content_hash for Internal resources."""
+        """
+        Override save to calculate content_hash for Internal resources
+        and keep Resource.latest_version in sync with is_latest.
+        """
         if self.resource.source_type == 'Internal' and self.content:
             self.content_hash = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
         
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self._sync_latest_pointer()
+            
+            update_fields = kwargs.get('update_fields')
+            if self.is_latest and (update_fields is None or set(update_fields) & self.SEARCH_FIELDS):
+                from apps.resources.search import index_version
+                index_version(self)
+            
+            from apps.resources.cache import invalidate_resource
+            from apps.resources.suggest import invalidate_suggest_index
+            invalidate_resource(self.resource_id)
+            invalidate_suggest_index()
+    
+    def _sync_latest_pointer(self):
+        """
+        Promote this version to Resource.latest_version (demoting siblings),
+        or clear the pointer if this version stops being the latest.
+        """
+        resource = self.resource
+        
+        if self.is_latest:
+            ResourceVersion.objects.filter(
+                resource_id=self.resource_id,
+                is_latest=True
+            ).exclude(pk=self.pk).update(is_latest=False)
+            
+            if resource.latest_version_id != self.pk:
+                Resource.objects.filter(pk=self.resource_id).update(latest_version=self)
+            resource.latest_version = self
+        else:
+            Resource.objects.filter(
+                pk=self.resource_id,
+                latest_version_id=self.pk
+            ).update(latest_version=None)
+            if resource.latest_version_id == self.pk:
+                resource.latest_version = None
@@ -0,0 +1,177 @@
+"""
+Fast-path listing rows for GET /api/resources/.
+
+Produces the same payload as ResourceListSerializer from a single
+values_list() query plus one query for the owners' roles, skipping model
+instantiation and DRF field-by-field serialization. Only the summary
+columns of the latest version are read (no content/example/changelog), and
+a sparse fieldset (?fields=) narrows the SELECT list further.
+
+US-05: Explorar Recursos
+"""
+
+from functools import lru_cache
+
+from config.projections import Projection, format_datetime, format_uuid
+
+RESOURCE = Projection([
+    ('id', 'id', format_uuid),
+    ('owner', 'owner_id', None),                    # replaced by the OWNER dict
+    ('source_type', 'source_type', None),
+    ('latest_version', 'latest_version_id', None),  # replaced by the VERSION dict
+    ('votes_count', 'votes_count', None),
+    ('user_has_voted', 'id', lambda value: False),  # set per request (VoteService.get_voted_resource_ids)
+    ('forks_count', 'forks_count', None),
+    ('is_fork', 'derived_from_resource_id', lambda value: value is not None),
+    ('created_at', 'created_at', format_datetime),
+])
+
+OWNER = Projection([
+    ('id', 'id', format_uuid),
+    ('email', 'email', None),
+    ('name', 'name', None),
+    ('is_active', 'is_active', None),
+    ('email_verified_at', 'email_verified_at', format_datetime),
+    ('roles', 'id', None),                          # replaced by the owner's roles
+    ('is_admin', 'is_superuser', None),             # or-ed with the Admin role
+    ('created_at', 'created_at', format_datetime),
+], prefix='owner__')
+
+# Same fields as ResourceVersionSummarySerializer
+VERSION = Projection([
+    ('id', 'id', format_uuid),
+    ('version_number', 'version_number', None),
+    ('title', 'title', None),
+    ('description', 'description', None),
+    ('type', 'type', None),
+    ('tags', 'tags', None),
+    ('content_hash', 'content_hash', None),
+    ('repo_url', 'repo_url', None),
+    ('repo_tag', 'repo_tag', None),
+    ('repo_commit_sha', 'repo_commit_sha', None),
+    ('license', 'license', None),
+    ('status', 'status', None),
+    ('validated_at', 'validated_at', format_datetime),
+    ('is_latest', 'is_latest', None),
+    ('pid', ('resource_id', 'version_number'), lambda resource_id, number: f'ccg-ai:R-{resource_id}@v{number}'),
+    ('created_at', 'created_at', format_datetime),
+    ('updated_at', 'updated_at', format_datetime),
+], prefix='latest_version__')
+
+NESTED = {'owner': OWNER, 'latest_version': VERSION}
+
+
+def parse_fields(value):
+    """
+    Parse a ?fields= sparse fieldset.
+    
+    Top-level names select whole keys ('latest_version' is the full summary);
+    dotted names select nested keys ('latest_version.title', 'owner.name').
+    
+    Args:
+        value (str): Comma-separated field names
+    
+    Returns:
+        tuple: Sorted, de-duplicated names, or None if no field was given
+    
+    Raises:
+        ValueError: If a name is not part of the listing payload
+    """
+    names = {name.strip() for name in value.split(',')}
+    names.discard('')
+    
+    for name in names:
+        parent, _, child = name.partition('.')
+        if parent not in RESOURCE.keys or (child and child not in getattr(NESTED.get(parent), 'keys', ())):
+            raise ValueError(f'Unknown field: {name}')
+    
+    return tuple(sorted(names)) or None
+
+
+@lru_cache(maxsize=128)
+def compile_fields(fields=None):
+    """
+    Build (resource, owner, version) projections for a normalized fieldset.
+    
+    owner/version are None when that nested object is not requested.
+    """
+    if fields is None:
+        return RESOURCE, OWNER, VERSION
+    
+    top = {name.partition('.')[0] for name in fields}
+    nested = []
+    for parent, projection in NESTED.items():
+        children = {name.partition('.')[2] for name in fields if name.startswith(f'{parent}.')}
+        if parent not in top:
+            nested.append(None)
+        elif parent in fields or not children:
+            nested.append(projection)
+        else:
+            nested.append(projection.subset(children))
+    
+    return (RESOURCE.subset(top), *nested)
+
+
+def _roles_by_user(user_ids):
+    """Fetch RoleSerializer dicts for many users in one query (ordered by name, like Role.Meta)."""
+    from apps.authentication.models import Role
+    
+    roles = {}
+    if not user_ids:
+        return roles
+    
+    rows = Role.objects.filter(
+        user_roles__user_id__in=user_ids
+    ).values_list('user_roles__user_id', 'id', 'name', 'description')
+    for user_id, role_id, name, description in rows:
+        roles.setdefault(user_id, []).append({'id': str(role_id), 'name': name, 'description': description})
+    return roles
+
+
+def fetch_resource_list(queryset, fields=None):
+    """
+    Evaluate an ordered (and sliced) listing queryset as ready-to-render dicts.
+    
+    Args:
+        queryset (QuerySet): Resource queryset, already filtered/ordered/sliced
+        fields (tuple, optional): Sparse fieldset from parse_fields()
+    
+    Returns:
+        list: Dicts shaped like ResourceListSerializer(...).data, restricted
+        to `fields` when given
+    """
+    resource_projection, owner_projection, version_projection = compile_fields(fields)
+    owner_start = len(resource_projection)
+    version_start = owner_start + len(owner_projection or ())
+    
+    lookups = resource_projection.lookups
+    if owner_projection:
+        lookups += owner_projection.lookups
+    if version_projection:
+        lookups += version_projection.lookups
+    rows = list(queryset.values_list(*lookups))
+    
+    roles = {}
+    if owner_projection is not None and {'roles', 'is_admin'} & set(owner_projection.keys):
+        owner_column = resource_projection.lookups.index('owner_id')
+        roles = _roles_by_user({row[owner_column] for row in rows})
+    
+    results = []
+    for row in rows:
+        resource = resource_projection.build(row[:owner_start])
+        
+        if owner_projection is not None:
+            owner = owner_projection.build(row[owner_start:version_start])
+            owner_roles = roles.get(resource['owner'], [])
+            if 'roles' in owner:
+                owner['roles'] = owner_roles
+            if 'is_admin' in owner:
+                owner['is_admin'] = owner['is_admin'] or any(role['name'] == 'Admin' for role in owner_roles)
+            resource['owner'] = owner
+        
+        if version_projection is not None and resource['latest_version'] is not None:
+            resource['latest_version'] = version_projection.build(row[version_start:])
+        
+        results.append(resource)
+    
+    return results
@@ -0,0 +1,92 @@
+"""
+Full-text search for resources.
+
+PostgreSQL: each Resource stores a weighted `search_vector` of its latest
+version (title A, description B, tags C) backed by a GIN index, queried with
+websearch_to_tsquery and ranked with ts_rank.
+
+Other backends (SQLite in tests): falls back to icontains matching over the
+same fields, with a relevance score that mirrors the ts_rank weights.
+
+US-06: Buscar y Filtrar
+"""
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, Value, When
+
+# Default ts_rank weights for D, C, B, A (reused by the fallback ranking)
+WEIGHT_A = 1.0
+WEIGHT_B = 0.4
+WEIGHT_C = 0.2
+
+
+def is_full_text_enabled():
+    """Check if the database supports PostgreSQL full-text search."""
+    return connection.vendor == 'postgresql'
+
+
+def get_search_config():
+    """Text search configuration used for vectors and queries."""
+    return getattr(settings, 'RESOURCE_SEARCH_CONFIG', 'english')
+
+
+def build_search_vector(title, description, tags):
+    """
+    Build the weighted tsvector expression for a version's searchable fields.
+
+    Values are passed as literals so the expression can be used in
+    Resource.objects.update() (which cannot reference joined columns).
+    """
+    search_config = get_search_config()
+    return (
+        SearchVector(Value(title or ''), weight='A', config=search_config)
+        + SearchVector(Value(description or ''), weight='B', config=search_config)
+        + SearchVector(Value(' '.join(tags or [])), weight='C', config=search_config)
+    )
+
+
+def index_version(version):
+    """
+    Refresh the search vector of version.resource from the given (latest) version.
+
+    No-op on backends without full-text support.
+    """
+    if not is_full_text_enabled():
+        return
+
+    from apps.resources.models import Resource
+    Resource.objects.filter(pk=version.resource_id).update(
+        search_vector=build_search_vector(version.title, version.description, version.tags)
+    )
+
+
+def apply_search(queryset, search):
+    """
+    Filter a Resource queryset by a text query and annotate `search_rank`.
+
+    Args:
+        queryset (QuerySet): Resource queryset (latest_version joinable)
+        search (str): User-entered search text
+
+    Returns:
+        QuerySet: Filtered queryset annotated with search_rank (higher is better)
+    """
+    if is_full_text_enabled():
+        query = SearchQuery(search, search_type='websearch', config=get_search_config())
+        return queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F('search_vector'), query)
+        )
+
+    title_match = Q(latest_version__title__icontains=search)
+    description_match = Q(latest_version__description__icontains=search)
+    tags_match = Q(latest_version__tags__icontains=search)
+
+    return queryset.filter(title_match | description_match | tags_match).annotate(
+        search_rank=(
+            Case(When(title_match, then=Value(WEIGHT_A)), default=Value(0.0), output_field=FloatField())
+            + Case(When(description_match, then=Value(WEIGHT_B)), default=Value(0.0), output_field=FloatField())
+            + Case(When(tags_match, then=Value(WEIGHT_C)), default=Value(0.0), output_field=FloatField())
+        )
+    )
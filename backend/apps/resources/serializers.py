@@ -46,16 +46,66 @@ class ResourceVersionSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'content_hash', 'pid', 'created_at', 'updated_at')
 
 
-class ResourceListSerializer(serializers.ModelSerializer):
+class ResourceVersionSummarySerializer(serializers.ModelSerializer):
     """
-    Serializer for Resource list (with latest version embedded).
+    Serializer for ResourceVersion in list payloads.
+    
+    Leaves out the large text columns (content, example, changelog); list
+    querysets defer them (see ResourceService.LIST_DEFERRED_FIELDS).
+    """
+    
+    pid = serializers.CharField(read_only=True)
+    
+    class Meta:
+        model = ResourceVersion
+        fields = (
+            'id',
+            'version_number',
+            'title',
+            'description',
+            'type',
+            'tags',
+            'content_hash',
+            'repo_url',
+            'repo_tag',
+            'repo_commit_sha',
+            'license',
+            'status',
+            'validated_at',
+            'is_latest',
+            'pid',
+            'created_at',
+            'updated_at',
+        )
+        read_only_fields = fields
+
+
+class UserHasVotedMixin(serializers.Serializer):
+    """
+    Adds `user_has_voted`, read from context['voted_resource_ids'].
+    
+    The set comes from VoteService.get_voted_resource_ids() (one query per
+    page); without it the field is False (anonymous or cached payloads).
+    
+    US-16: Votar Recurso
+    """
+    
+    user_has_voted = serializers.SerializerMethodField()
+    
+    def get_user_has_voted(self, obj):
+        voted = self.context.get('voted_resource_ids')
+        return voted is not None and obj.id in voted
+
+
+class ResourceListSerializer(UserHasVotedMixin, serializers.ModelSerializer):
+    """
+    Serializer for Resource list (with latest version summary embedded).
     
     US-05: Explorar Recursos
     """
     
     owner = UserSerializer(read_only=True)
-    latest_version = ResourceVersionSerializer(read_only=True)
-    votes_count = serializers.IntegerField(read_only=True, source='votes_count_annotated')
+    latest_version = ResourceVersionSummarySerializer(read_only=True)
     
     class Meta:
         model = Resource
@@ -65,6 +115,7 @@ class ResourceListSerializer(serializers.ModelSerializer):
             'source_type',
             'latest_version',
             'votes_count',
+            'user_has_voted',
             'forks_count',
             'is_fork',
             'created_at',
@@ -72,7 +123,7 @@ class ResourceListSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class ResourceDetailSerializer(serializers.ModelSerializer):
+class ResourceDetailSerializer(UserHasVotedMixin, serializers.ModelSerializer):
     """
     Serializer for Resource detail (with all data).
     
@@ -81,7 +132,6 @@ class ResourceDetailSerializer(serializers.ModelSerializer):
     
     owner = UserSerializer(read_only=True)
     latest_version = ResourceVersionSerializer(read_only=True)
-    votes_count = serializers.IntegerField(read_only=True, source='votes_count_annotated')
     derived_from_resource_id = serializers.UUIDField(read_only=True)
     derived_from_version_id = serializers.UUIDField(read_only=True)
     
@@ -93,6 +143,7 @@ class ResourceDetailSerializer(serializers.ModelSerializer):
             'source_type',
             'latest_version',
             'votes_count',
+            'user_has_voted',
             'forks_count',
             'is_fork',
             'derived_from_resource_id',
@@ -9,77 +9,151 @@ US-08: Publicar Recurso
 US-13: Validar Recurso (Admin)
 """
 
+import uuid
+from datetime import datetime
+
 from django.db import transaction, IntegrityError
-from django.db.models import Q, Count, Prefetch
+from django.db.models import Q, Count, Max
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from config.cursors import decode_cursor, encode_cursor
+from apps.resources import trending
 from apps.resources.models import Resource, ResourceVersion
+from apps.resources.projections import fetch_resource_list
+from apps.resources.search import apply_search
 
 User = get_user_model()
 
+# Keyset orderings supported by cursor pagination: ordering -> (sort field, descending)
+CURSOR_ORDERINGS = {
+    '-created_at': ('created_at', True),
+    'created_at': ('created_at', False),
+    '-votes': ('votes_count', True),
+}
+
+
+def _encode_cursor(resource, ordering, direction):
+    """Encode the (sort key, id) position of a resource (instance or projected row) as an opaque cursor."""
+    field, _ = CURSOR_ORDERINGS[ordering]
+    if isinstance(resource, dict):
+        # Projected rows already hold ISO 8601 strings
+        value, resource_id = resource[field], resource['id']
+    else:
+        value, resource_id = getattr(resource, field), resource.id
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    
+    return encode_cursor({'o': ordering, 'd': direction, 'v': value, 'id': str(resource_id)})
+
+
+def _decode_cursor(cursor, ordering):
+    """Decode an opaque cursor produced by _encode_cursor."""
+    try:
+        payload = decode_cursor(cursor)
+        
+        if payload['o'] != ordering or payload['d'] not in ('next', 'previous'):
+            raise ValueError
+        
+        field, _ = CURSOR_ORDERINGS[ordering]
+        value = payload['v']
+        if field == 'created_at':
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, int):
+            raise ValueError
+        
+        return {'direction': payload['d'], 'value': value, 'id': uuid.UUID(payload['id'])}
+    except (ValueError, KeyError, TypeError):
+        raise ValueError('Invalid cursor')
+
 
 class ResourceService:
     """Service layer for resource operations."""
     
+    # Large columns never needed by list payloads (see ResourceVersionSummarySerializer)
+    LIST_DEFERRED_FIELDS = (
+        'search_vector',
+        'latest_version__content',
+        'latest_version__example',
+        'latest_version__changelog',
+    )
+    
     @staticmethod
-    def list_resources(filters=None, search=None, ordering='-created_at', page=1, page_size=20):
+    def _build_list_queryset(filters=None, search=None):
         """
-        List resources with pagination, search and filters.
+        Build the filtered (unordered) listing queryset shared by offset and cursor paging.
         
         Args:
-            filters (dict): Filters (type, status, tags)
-            search (str): Text search (title, description)
-            ordering (str): Order by field (default: -created_at)
-            page (int): Page number (1-indexed)
-            page_size (int): Items per page
+            filters (dict): Filters (owner, type, status, tags)
+            search (str): Text search (title, description, tags)
         
         Returns:
-            dict: {
-                'results': List of resources,
-                'count': Total count,
-                'page': Current page,
-                'page_size': Items per page,
-                'has_next': Boolean,
-                'has_previous': Boolean
-            }
+            QuerySet: Resources with latest_version/owner joined (large columns deferred)
         """
         filters = filters or {}
         
         # Base queryset (exclude soft-deleted)
+        # latest_version is a denormalized FK, so filters below share a single join
         queryset = Resource.objects.filter(deleted_at__isnull=True)
+        queryset = queryset.select_related('latest_version', 'owner').prefetch_related('owner__roles')
+        queryset = queryset.defer(*ResourceService.LIST_DEFERRED_FIELDS)
         
-        # Prefetch latest version for each resource
-        latest_versions = Prefetch(
-            'versions',
-            queryset=ResourceVersion.objects.filter(is_latest=True),
-            to_attr='latest_version_list'
-        )
-        queryset = queryset.prefetch_related(latest_versions, 'owner', 'owner__roles')
-        
-        # Annotate with votes count
-        queryset = queryset.annotate(votes_count_annotated=Count('votes'))
+        if 'owner' in filters:
+            queryset = queryset.filter(owner_id=filters['owner'])
         
         # Apply filters on latest version
         if 'type' in filters:
-            queryset = queryset.filter(versions__is_latest=True, versions__type=filters['type'])
+            queryset = queryset.filter(latest_version__type=filters['type'])
         
         if 'status' in filters:
-            queryset = queryset.filter(versions__is_latest=True, versions__status=filters['status'])
+            queryset = queryset.filter(latest_version__status=filters['status'])
         
         if 'tags' in filters:
             # JSONB contains check (PostgreSQL)
             tags = filters['tags'] if isinstance(filters['tags'], list) else [filters['tags']]
-            queryset = queryset.filter(versions__is_latest=True, versions__tags__contains=tags)
+            queryset = queryset.filter(latest_version__tags__contains=tags)
         
-        # Text search (title or description in latest version)
+        # Text search over latest version (full-text on PostgreSQL, see search.py)
         if search:
-            queryset = queryset.filter(
-                Q(versions__is_latest=True) &
-                (Q(versions__title__icontains=search) | Q(versions__description__icontains=search))
-            )
+            queryset = apply_search(queryset, search)
         
-        # Ensure distinct (due to joins on versions)
-        queryset = queryset.distinct()
+        return queryset
+    
+    @staticmethod
+    def _fetch(queryset, as_rows, fields=None):
+        """Evaluate a listing page as model instances or as projected rows."""
+        if as_rows:
+            return fetch_resource_list(queryset, fields)
+        return list(queryset)
+    
+    @staticmethod
+    def list_resources(filters=None, search=None, ordering='-created_at', page=1, page_size=20, as_rows=False,
+                       fields=None):
+        """
+        List resources with pagination, search and filters.
+        
+        Args:
+            filters (dict): Filters (owner, type, status, tags)
+            search (str): Text search (title, description, tags)
+            ordering (str): Order by field (default: -created_at).
+                -relevance orders by search rank and requires `search`.
+                -trending orders by the stored time-decayed score (see trending.py).
+            page (int): Page number (1-indexed)
+            page_size (int): Items per page
+            as_rows (bool): If True, results are ResourceListSerializer-shaped
+                dicts built by the values() fast path (see projections.py)
+            fields (tuple, optional): Sparse fieldset for as_rows (see projections.parse_fields)
+        
+        Returns:
+            dict: {
+                'results': List of resources,
+                'count': Total count,
+                'page': Current page,
+                'page_size': Items per page,
+                'has_next': Boolean,
+                'has_previous': Boolean
+            }
+        """
+        queryset = ResourceService._build_list_queryset(filters, search)
         
         # Ordering
         if ordering == '-created_at':
@@ -87,7 +161,14 @@ class ResourceService:
         elif ordering == 'created_at':
             queryset = queryset.order_by('created_at')
         elif ordering == '-votes':
-            queryset = queryset.order_by('-votes_count_annotated')
+            queryset = queryset.order_by('-votes_count', '-id')
+        elif ordering == '-trending':
+            queryset = queryset.order_by('-trending_score', '-id')
+        elif ordering == '-relevance':
+            if search:
+                queryset = queryset.order_by('-search_rank', '-created_at')
+            else:
+                queryset = queryset.order_by('-created_at')
         
         # Count total
         total_count = queryset.count()
@@ -95,7 +176,7 @@ class ResourceService:
         # Pagination
         start = (page - 1) * page_size
         end = start + page_size
-        results = list(queryset[start:end])
+        results = ResourceService._fetch(queryset[start:end], as_rows, fields)
         
         return {
             'results': results,
@@ -106,6 +187,103 @@ class ResourceService:
             'has_previous': page > 1,
         }
     
+    @staticmethod
+    def list_resources_cursor(filters=None, search=None, ordering='-created_at', cursor=None,
+                              page_size=20, include_count=False, as_rows=False, fields=None):
+        """
+        List resources with keyset (cursor) pagination.
+        
+        Each page is fetched with a `(sort_key, id)` range filter instead of
+        OFFSET, so deep pages cost the same as the first one. The exact total
+        count is optional because it requires a full scan of the filtered set.
+        
+        Args:
+            filters (dict): Filters (owner, type, status, tags)
+            search (str): Text search (title, description, tags)
+            ordering (str): -created_at, created_at or -votes (default: -created_at;
+                -relevance and -trending are not keyset-pageable)
+            cursor (str, optional): Opaque cursor from a previous response
+            page_size (int): Items per page
+            include_count (bool): If True, also compute the exact total count
+            as_rows (bool): If True, results are ResourceListSerializer-shaped
+                dicts built by the values() fast path (see projections.py)
+            fields (tuple, optional): Sparse fieldset for as_rows (see projections.parse_fields)
+        
+        Returns:
+            dict: {
+                'results': List of resources,
+                'next': Cursor for the next page or None,
+                'previous': Cursor for the previous page or None,
+                'page_size': Items per page,
+                'has_next': Boolean,
+                'has_previous': Boolean,
+                'count': Total count (only if include_count)
+            }
+        
+        Raises:
+            ValueError: If the ordering is not keyset-pageable, or the cursor is
+                malformed or belongs to another ordering
+        """
+        if ordering not in CURSOR_ORDERINGS:
+            raise ValueError(f'Ordering {ordering} is not supported with cursor pagination')
+        page_size = max(1, page_size)
+        field, descending = CURSOR_ORDERINGS[ordering]
+        
+        queryset = ResourceService._build_list_queryset(filters, search)
+        
+        backwards = False
+        if cursor:
+            position = _decode_cursor(cursor, ordering)
+            backwards = position['direction'] == 'previous'
+            
+            # Walking backwards flips the comparison and the sort order
+            after = descending == backwards
+            lookup = 'gt' if after else 'lt'
+            queryset = queryset.filter(
+                Q(**{f'{field}__{lookup}': position['value']})
+                | Q(**{field: position['value'], f'id__{lookup}': position['id']})
+            )
+        
+        sort_desc = descending != backwards
+        prefix = '-' if sort_desc else ''
+        queryset = queryset.order_by(f'{prefix}{field}', f'{prefix}id')
+        
+        # Cursors are built from the id and sort key, so a sparse fieldset must include them
+        extra_fields = ()
+        if fields is not None:
+            extra_fields = tuple({'id', field} - set(fields))
+            fields = tuple(sorted(fields + extra_fields))
+        
+        # Fetch one extra row to know whether there is another page
+        rows = ResourceService._fetch(queryset[:page_size + 1], as_rows, fields)
+        has_more = len(rows) > page_size
+        results = rows[:page_size]
+        
+        if backwards:
+            results.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, cursor is not None
+        
+        result = {
+            'results': results,
+            'next': _encode_cursor(results[-1], ordering, 'next') if has_next and results else None,
+            'previous': _encode_cursor(results[0], ordering, 'previous') if has_previous and results else None,
+            'page_size': page_size,
+            'has_next': has_next,
+            'has_previous': has_previous,
+        }
+        
+        if extra_fields:
+            for row in results:
+                for key in extra_fields:
+                    del row[key]
+        
+        if include_count:
+            result['count'] = ResourceService._build_list_queryset(filters, search).count()
+        
+        return result
+    
     @staticmethod
     @transaction.atomic
     def create_resource(owner, data):
@@ -119,6 +297,9 @@ class ResourceService:
         Returns:
             Resource: Created resource with v1.0.0
         
+        With status 'Pending Validation' the admins are notified
+        (validation_requested) through the outbox.
+        
         US-08: Publicar Recurso
         """
         # Create Resource wrapper
@@ -127,8 +308,8 @@ class ResourceService:
             source_type=data.get('source_type', 'Internal')
         )
         
-        # Create initial version (v1.0.0)
-        version = ResourceVersion.objects.create(
+        # Create initial version (v1.0.0); also sets resource.latest_version
+        ResourceVersion.objects.create(
             resource=resource,
             version_number='1.0.0',
             title=data['title'],
@@ -144,6 +325,23 @@ class ResourceService:
             is_latest=True
         )
         
+        from apps.authentication.services import UserMetricsService
+        UserMetricsService.apply(
+            owner.id,
+            resources=1,
+            validated=1 if resource.latest_version.status == 'Validated' else 0
+        )
+        
+        # Validation requested: notify the admins from the outbox worker, once this commits (US-18)
+        if resource.latest_version.status == 'Pending Validation':
+            from apps.outbox.services import OutboxService
+            OutboxService.enqueue('notifications.notify_admins', {
+                'type': 'validation_requested',
+                'message': f'Nueva solicitud de validación: "{data["title"]}"',
+                'resource_id': resource.id,
+                'actor_id': owner.id,
+            })
+        
         return resource
     
     @staticmethod
@@ -168,12 +366,14 @@ class ResourceService:
         US-13: Validar Recurso (Admin)
         """
         # Check admin permission
-        if not admin_user.is_admin:
+        if not admin_user.has_admin_access():
             raise ValueError('Only administrators can validate resources')
         
         # Get resource
         try:
-            resource = Resource.objects.select_for_update().get(
+            resource = Resource.objects.select_for_update(of=('self',)).select_related(
+                'latest_version', 'owner'
+            ).get(
                 id=resource_id,
                 deleted_at__isnull=True
             )
@@ -194,15 +394,16 @@ class ResourceService:
         latest_version.validated_at = timezone.now()
         latest_version.save(update_fields=['status', 'validated_at', 'updated_at'])
         
-        # Create notification for owner (US-18)
-        from apps.interactions.services import NotificationService
-        NotificationService.create_notification(
-            user=resource.owner,
-            notification_type='resource_validated',
-            message=f'Tu recurso "{latest_version.title}" ha sido validado',
-            resource=resource,
-            actor=user  # Admin who validated
-        )
+        from apps.authentication.services import UserMetricsService
+        UserMetricsService.apply(resource.owner_id, validated=1)
+        
+        # Notify the owner from the outbox worker, once this commits (US-18)
+        from apps.outbox.services import OutboxService
+        OutboxService.enqueue('resources.notify_validated', {
+            'resource_id': resource.id,
+            'admin_id': admin_user.id,
+            'title': latest_version.title,
+        })
         
         return resource
     
@@ -233,7 +434,9 @@ class ResourceService:
         """
         # Get original resource with lock (will increment forks_count)
         try:
-            original_resource = Resource.objects.select_for_update().get(
+            original_resource = Resource.objects.select_for_update(of=('self',)).select_related(
+                'latest_version', 'owner'
+            ).get(
                 id=resource_id,
                 deleted_at__isnull=True
             )
@@ -268,23 +471,61 @@ class ResourceService:
             is_latest=True,
         )
         
-        # Increment forks_count on original
+        # Increment forks_count and the trending score on original (row is locked)
         original_resource.forks_count += 1
-        original_resource.save(update_fields=['forks_count', 'updated_at'])
-        
-        # Create notification for original resource owner (US-18)
-        from apps.interactions.services import NotificationService
-        if original_resource.owner != user:  # Don't notify self-forks
-            NotificationService.create_notification(
-                user=original_resource.owner,
-                notification_type='resource_forked',
-                message=f'{user.name} reutilizó tu recurso "{latest_version.title}"',
-                resource=original_resource,
-                actor=user
-            )
+        original_resource.trending_score += trending.row_event_score(
+            trending.FORK_WEIGHT, forked_resource.created_at, original_resource.trending_epoch
+        )
+        original_resource.save(update_fields=['forks_count', 'trending_score', 'updated_at'])
+        transaction.on_commit(trending.ensure_current_epoch, robust=True)
+        
+        from apps.authentication.services import UserMetricsService
+        UserMetricsService.apply(user.id, resources=1)
+        UserMetricsService.apply(original_resource.owner_id, reuses=1)
+        
+        # Notify the original resource owner from the outbox worker, once this commits (US-18)
+        from apps.outbox.services import OutboxService
+        if original_resource.owner_id != user.id:  # Don't notify self-forks
+            OutboxService.enqueue('resources.notify_forked', {
+                'resource_id': original_resource.id,
+                'actor_id': user.id,
+                'actor_name': user.name,
+                'title': latest_version.title,
+            })
         
         return forked_resource
     
+    @staticmethod
+    @transaction.atomic
+    def soft_delete_resource(user, resource_id):
+        """
+        Soft-delete a resource (sets deleted_at; rows are kept).
+        
+        Args:
+            user (User): Owner of the resource or an admin
+            resource_id (UUID): The resource ID
+        
+        Returns:
+            Resource: The deleted resource
+        
+        Raises:
+            ValueError: If resource doesn't exist, is already deleted, or user
+                is neither its owner nor an admin
+        """
+        try:
+            resource = Resource.objects.select_for_update().get(id=resource_id, deleted_at__isnull=True)
+        except Resource.DoesNotExist:
+            raise ValueError('Resource not found or has been deleted')
+        
+        if resource.owner_id != user.id and not user.has_admin_access():
+            raise ValueError('Only the owner or an admin can delete this resource')
+        
+        # Resource.save() takes the resource out of its owner's metrics
+        resource.deleted_at = timezone.now()
+        resource.save(update_fields=['deleted_at', 'updated_at'])
+        
+        return resource
+    
     @staticmethod
     def get_version_history(resource_id):
         """
@@ -314,4 +555,83 @@ class ResourceService:
         
         # Return all versions ordered by created_at (newest first)
         return resource.versions.select_related('resource__owner').order_by('-created_at')
-
+    
+    @staticmethod
+    def get_detail_freshness(resource_id):
+        """
+        Get the values that change whenever a resource detail payload changes.
+        
+        One primary-key lookup (joined to the latest version); used to build
+        HTTP validators without loading or serializing the resource.
+        
+        Args:
+            resource_id (UUID): The resource ID
+        
+        Returns:
+            dict or None: {'last_modified', 'votes_count', 'forks_count', 'latest_version_id',
+            'owner_updated_at'}, or None if the resource doesn't exist or is deleted
+        """
+        row = Resource.objects.filter(
+            id=resource_id,
+            deleted_at__isnull=True
+        ).values(
+            'updated_at',
+            'votes_count',
+            'forks_count',
+            'latest_version_id',
+            'latest_version__updated_at',
+            'owner__updated_at',
+        ).first()
+        
+        if row is None:
+            return None
+        
+        # The payload embeds the owner (profile and roles touch users.updated_at)
+        row['owner_updated_at'] = row.pop('owner__updated_at')
+        timestamps = [row.pop('updated_at'), row.pop('latest_version__updated_at'), row['owner_updated_at']]
+        row['last_modified'] = max(filter(None, timestamps))
+        return row
+    
+    @staticmethod
+    def get_catalog_last_modified():
+        """
+        Get the time of the most recent change to any resource, version or owner.
+        
+        Every write path touches one of the resource/version updated_at columns
+        (soft deletes and vote toggles included), and profile or role changes
+        touch users.updated_at (owners are embedded in listings), so this
+        changes with any listing.
+        
+        Returns:
+            datetime or None: Latest updated_at, None for an empty catalog
+        """
+        resources_max = Resource.objects.aggregate(last=Max('updated_at'))['last']
+        if resources_max is None:
+            return None
+        versions_max = ResourceVersion.objects.aggregate(last=Max('updated_at'))['last']
+        owners_max = User.objects.aggregate(last=Max('updated_at'))['last']
+        return max(filter(None, [resources_max, versions_max, owners_max]))
+    
+    @staticmethod
+    def get_version_history_freshness(resource_id):
+        """
+        Get the version count and latest change of a resource's history.
+        
+        Args:
+            resource_id (UUID): The resource ID
+        
+        Returns:
+            dict: {'count': int, 'last_modified': datetime or None}
+        
+        Raises:
+            ValueError: If resource doesn't exist or is deleted
+        
+        US-22: Historial de Versiones
+        """
+        if not Resource.objects.filter(id=resource_id, deleted_at__isnull=True).exists():
+            raise ValueError('Resource not found or has been deleted')
+        
+        return ResourceVersion.objects.filter(resource_id=resource_id).aggregate(
+            count=Count('id'),
+            last_modified=Max('updated_at'),
+        )
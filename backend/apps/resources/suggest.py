@@ -0,0 +1,201 @@
+"""
+Typo-tolerant autocomplete for resource titles and tags.
+
+PostgreSQL: trigram word similarity (pg_trgm) over latest-version titles, served
+by a partial GIN index (see migration 0005), plus a prefix match on tags.
+
+Other backends (SQLite in tests/dev): an in-process trigram index over the
+same data, rebuilt lazily after any change to a latest version.
+
+Only lightweight rows are returned (no serializer), so a suggestion request
+costs one or two indexed queries.
+
+US-06: Buscar y Filtrar
+"""
+
+import threading
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection, transaction
+from django.db.models import Q
+
+# Minimum word similarity for a non-prefix match (pg_trgm.word_similarity_threshold default)
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+
+def trigrams(text):
+    """Split text into pg_trgm-style trigrams (each word padded with two leading and one trailing space)."""
+    grams = set()
+    for word in text.lower().split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def word_similarity(query_grams, word_grams):
+    """
+    Approximate pg_trgm word_similarity: the best share of the query's
+    trigrams found in a single word of the text.
+    """
+    if not query_grams:
+        return 0.0
+    best = max((len(query_grams & grams) for grams in word_grams), default=0)
+    return best / len(query_grams)
+
+
+def is_prefix_match(query, text):
+    """Check if the query is a prefix of the text or of any of its words."""
+    text = text.lower()
+    return text.startswith(query) or any(word.startswith(query) for word in text.split())
+
+
+class InMemorySuggestIndex:
+    """
+    Trigram index over latest-version titles and tags, held in process memory.
+
+    The index is rebuilt on the next lookup after invalidate() is called.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirty = True
+        self._titles = []        # [(resource_id, title, type, per-word trigram sets)]
+        self._title_grams = {}   # trigram -> set of positions in _titles
+        self._tags = {}          # tag -> number of resources using it
+
+    def invalidate(self):
+        """Mark the index as stale."""
+        self._dirty = True
+
+    def _rebuild(self):
+        from apps.resources.models import ResourceVersion
+
+        rows = ResourceVersion.objects.filter(
+            is_latest=True,
+            resource__deleted_at__isnull=True
+        ).values_list('resource_id', 'title', 'type', 'tags')
+
+        titles = []
+        title_grams = {}
+        tags = {}
+        for resource_id, title, resource_type, version_tags in rows:
+            word_grams = [trigrams(word) for word in title.split()]
+            position = len(titles)
+            titles.append((resource_id, title, resource_type, word_grams))
+            for grams in word_grams:
+                for gram in grams:
+                    title_grams.setdefault(gram, set()).add(position)
+            for tag in version_tags or []:
+                tags[tag] = tags.get(tag, 0) + 1
+
+        self._titles, self._title_grams, self._tags = titles, title_grams, tags
+
+    def _ensure_fresh(self):
+        if self._dirty:
+            with self._lock:
+                if self._dirty:
+                    self._dirty = False
+                    self._rebuild()
+
+    def suggest_titles(self, query, limit):
+        self._ensure_fresh()
+        query = query.lower()
+        query_grams = trigrams(query)
+
+        candidates = set()
+        for gram in query_grams:
+            candidates |= self._title_grams.get(gram, set())
+
+        scored = []
+        for position in candidates:
+            resource_id, title, resource_type, word_grams = self._titles[position]
+            score = word_similarity(query_grams, word_grams)
+            if score >= WORD_SIMILARITY_THRESHOLD or is_prefix_match(query, title):
+                scored.append((score, title, resource_id, resource_type))
+
+        scored.sort(key=lambda row: (-row[0], row[1]))
+        return [
+            {'id': resource_id, 'title': title, 'type': resource_type}
+            for _, title, resource_id, resource_type in scored[:limit]
+        ]
+
+    def suggest_tags(self, query, limit):
+        self._ensure_fresh()
+        query = query.lower()
+        matches = [(count, tag) for tag, count in self._tags.items() if tag.lower().startswith(query)]
+        matches.sort(key=lambda row: (-row[0], row[1]))
+        return [tag for _, tag in matches[:limit]]
+
+
+_memory_index = InMemorySuggestIndex()
+
+
+def invalidate_suggest_index():
+    """
+    Drop the in-process index (called when a latest version or resource changes).
+
+    Also re-invalidates after commit so a rebuild that raced the writing
+    transaction does not keep serving pre-commit data.
+    """
+    _memory_index.invalidate()
+    transaction.on_commit(_memory_index.invalidate)
+
+
+def _suggest_titles_trigram(query, limit):
+    from apps.resources.models import ResourceVersion
+
+    rows = ResourceVersion.objects.filter(
+        is_latest=True,
+        resource__deleted_at__isnull=True
+    ).filter(
+        Q(title__trigram_word_similar=query) | Q(title__istartswith=query)
+    ).annotate(
+        similarity=TrigramWordSimilarity(query, 'title')
+    ).order_by('-similarity', 'title').values('resource_id', 'title', 'type')[:limit]
+
+    return [{'id': row['resource_id'], 'title': row['title'], 'type': row['type']} for row in rows]
+
+
+def _suggest_tags_prefix(query, limit):
+    pattern = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT tag
+            FROM resource_versions v
+            JOIN resources r ON r.id = v.resource_id
+            CROSS JOIN LATERAL jsonb_array_elements_text(v.tags) AS tag
+            WHERE v.is_latest AND r.deleted_at IS NULL AND tag ILIKE %s
+            GROUP BY tag
+            ORDER BY count(*) DESC, tag
+            LIMIT %s
+            """,
+            [pattern, limit],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def suggest(query, limit=8):
+    """
+    Return autocomplete suggestions for a partial query.
+
+    Args:
+        query (str): Partial user input (already stripped)
+        limit (int): Maximum suggestions per group
+
+    Returns:
+        dict: {
+            'results': [{'id', 'title', 'type'}, ...] best title matches first,
+            'tags': [tag, ...] most used matching tags first
+        }
+    """
+    if connection.vendor == 'postgresql':
+        return {
+            'results': _suggest_titles_trigram(query, limit),
+            'tags': _suggest_tags_prefix(query, limit),
+        }
+
+    return {
+        'results': _memory_index.suggest_titles(query, limit),
+        'tags': _memory_index.suggest_tags(query, limit),
+    }
@@ -0,0 +1,55 @@
+"""
+Outbox handlers for resource events.
+
+Owner notifications for validations and forks are created by the outbox
+worker after the request commits (see apps/outbox/services.py).
+
+US-18: Notificaciones In-App
+"""
+
+from django.contrib.auth import get_user_model
+from apps.outbox.services import handler
+from apps.resources.models import Resource
+
+User = get_user_model()
+
+
+@handler('resources.notify_validated')
+def notify_validated(payload):
+    """Notify the owner that their resource was validated."""
+    from apps.interactions.services import NotificationService
+    
+    resource = Resource.objects.select_related('owner').filter(pk=payload['resource_id']).first()
+    if resource is None:
+        return  # deleted since: nothing to notify about
+    
+    NotificationService.create_notification(
+        user=resource.owner,
+        notification_type='resource_validated',
+        message=f'Tu recurso "{payload["title"]}" ha sido validado',
+        resource=resource,
+        actor=User.objects.filter(pk=payload['admin_id']).first()  # Admin who validated
+    )
+
+
+@handler('resources.notify_forked')
+def notify_forked(payload):
+    """Notify the owner that their resource was forked (coalesced per burst)."""
+    from apps.interactions.services import NotificationService
+    
+    # Lock the original resource so concurrent fork events merge into one notification
+    resource = Resource.objects.select_for_update().select_related('owner').filter(pk=payload['resource_id']).first()
+    if resource is None:
+        return
+    
+    actor_name = payload['actor_name']
+    title = payload['title']
+    NotificationService.create_notification(
+        user=resource.owner,
+        notification_type='resource_forked',
+        message=f'{actor_name} reutilizó tu recurso "{title}"',
+        resource=resource,
+        actor=User.objects.filter(pk=payload['actor_id']).first(),
+        coalesce=True,
+        merged_message=lambda count: f'{actor_name} y {count - 1} más reutilizaron tu recurso "{title}"'
+    )
@@ -132,6 +132,54 @@ class TestResourceListAPI:
         assert response.status_code == 200
         assert response.data['count'] == 1
         assert 'Workflow' in response.data['results'][0]['latest_version']['title']
+    
+    def test_list_resources_cursor_pagination(self, api_client, sample_resources):
+        """Test cursor mode returns next/previous cursors and no count by default."""
+        response = api_client.get('/api/resources/?pagination=cursor&page_size=1')
+        
+        assert response.status_code == 200
+        assert len(response.data['results']) == 1
+        assert response.data['has_next'] is True
+        assert response.data['previous'] is None
+        assert 'count' not in response.data
+        
+        response = api_client.get(f"/api/resources/?cursor={response.data['next']}&page_size=1&include_count=true")
+        
+        assert response.status_code == 200
+        assert len(response.data['results']) == 1
+        assert response.data['has_next'] is False
+        assert response.data['previous'] is not None
+        assert response.data['count'] == 2
+    
+    def test_list_resources_invalid_cursor(self, api_client, sample_resources):
+        """Test malformed cursor returns 400."""
+        response = api_client.get('/api/resources/?cursor=bogus')
+        
+        assert response.status_code == 400
+        assert response.data['error_code'] == 'INVALID_CURSOR'
+    
+    def test_list_resources_cursor_rejects_unpageable_ordering(self, api_client, sample_resources):
+        """Test -relevance/-trending are refused in cursor mode instead of silently replaced."""
+        for ordering in ('-relevance', '-trending'):
+            response = api_client.get(f'/api/resources/?pagination=cursor&ordering={ordering}')
+            
+            assert response.status_code == 400
+            assert response.data['error_code'] == 'INVALID_ORDERING'
+    
+    def test_list_resources_page_size_clamped(self, api_client, sample_resources):
+        """Test page_size below 1 is clamped in both pagination modes."""
+        response = api_client.get('/api/resources/?pagination=cursor&page_size=0')
+        
+        assert response.status_code == 200
+        assert response.data['page_size'] == 1
+        assert len(response.data['results']) == 1
+        assert response.data['next'] is not None
+        
+        response = api_client.get('/api/resources/?page_size=-5')
+        
+        assert response.status_code == 200
+        assert response.data['page_size'] == 1
+        assert len(response.data['results']) == 1
 
 
 @pytest.mark.django_db
@@ -147,6 +195,33 @@ class TestResourceDetailAPI:
         assert response.data['id'] == str(resource_id)
         assert response.data['latest_version']['title'] == 'Test Prompt'
     
+    def test_get_resource_detail_is_cached(self, api_client, sample_resources, django_assert_num_queries):
+        """Test repeated reads are served from cache without queries."""
+        resource_id = sample_resources[0].id
+        first = api_client.get(f'/api/resources/{resource_id}/')
+        
+        with django_assert_num_queries(0):
+            second = api_client.get(f'/api/resources/{resource_id}/')
+        
+        assert second.data == first.data
+    
+    def test_get_resource_detail_invalidated_by_writes(self, api_client, sample_resources, user):
+        """Test votes and validation replace the cached payload."""
+        from apps.interactions.services import VoteService
+        
+        resource = sample_resources[0]
+        api_client.get(f'/api/resources/{resource.id}/')
+        
+        VoteService.toggle_vote(user, resource.id)
+        response = api_client.get(f'/api/resources/{resource.id}/')
+        assert response.data['votes_count'] == 1
+        
+        version = resource.latest_version
+        version.status = 'Pending Validation'
+        version.save(update_fields=['status', 'updated_at'])
+        response = api_client.get(f'/api/resources/{resource.id}/')
+        assert response.data['latest_version']['status'] == 'Pending Validation'
+    
     def test_get_nonexistent_resource(self, api_client):
         """Test getting nonexistent resource returns 404."""
         import uuid
@@ -155,6 +230,35 @@ class TestResourceDetailAPI:
         
         assert response.status_code == 404
         assert response.data['error_code'] == 'RESOURCE_NOT_FOUND'
+    
+    def test_delete_resource(self, authenticated_client, sample_resources):
+        """Test the owner can soft-delete a resource; it disappears from reads."""
+        resource = sample_resources[0]
+        
+        response = authenticated_client.delete(f'/api/resources/{resource.id}/')
+        
+        assert response.status_code == 204
+        resource.refresh_from_db()
+        assert resource.deleted_at is not None
+        assert authenticated_client.get(f'/api/resources/{resource.id}/').status_code == 404
+        assert authenticated_client.delete(f'/api/resources/{resource.id}/').status_code == 404
+    
+    def test_delete_resource_permissions(self, api_client, sample_resources):
+        """Test anonymous users and non-owners cannot delete."""
+        from apps.authentication.services import AuthService
+        resource = sample_resources[0]
+        
+        assert api_client.delete(f'/api/resources/{resource.id}/').status_code == 401
+        
+        User.objects.create_user(
+            'other@example.com', 'Other User', 'pass123', email_verified_at='2024-01-01T00:00:00Z'
+        )
+        tokens = AuthService.login('other@example.com', 'pass123')
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+        response = api_client.delete(f'/api/resources/{resource.id}/')
+        
+        assert response.status_code == 403
+        assert response.data['error_code'] == 'PERMISSION_DENIED'
 
 
 @pytest.mark.django_db
@@ -0,0 +1,127 @@
+"""
+API tests for the resource listing cache.
+
+US-05: Explorar Recursos
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.authentication.models import Role
+from apps.resources.cache import is_shared_cache
+from apps.resources.models import Resource, ResourceVersion
+from apps.resources.services import ResourceService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    """Create API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    """Create a test user."""
+    user = User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+    user.email_verified_at = timezone.now()
+    user.save()
+    return user
+
+
+@pytest.fixture
+def admin_client(api_client):
+    """Create authenticated admin API client."""
+    from apps.authentication.services import AuthService
+    admin_role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+    admin = User.objects.create_user('admin@example.com', 'Admin User', 'pass123')
+    admin.roles.add(admin_role)
+    admin.email_verified_at = timezone.now()
+    admin.save()
+    
+    tokens = AuthService.login(admin.email, 'pass123')
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+    return api_client
+
+
+@pytest.fixture
+def resource(user):
+    """Create a resource."""
+    resource = Resource.objects.create(owner=user, source_type='Internal')
+    ResourceVersion.objects.create(
+        resource=resource,
+        version_number='1.0.0',
+        title='Cached Prompt',
+        description='A prompt',
+        type='Prompt',
+        tags=['a', 'b'],
+        content='Content',
+        is_latest=True
+    )
+    return resource
+
+
+@pytest.mark.django_db
+class TestResourceListCache:
+    """Tests for the GET /api/resources/ query cache."""
+    
+    def test_repeated_query_is_a_hit(self, api_client, resource, django_assert_num_queries):
+        """Test the second identical request does not touch the database."""
+        first = api_client.get('/api/resources/?type=Prompt')
+        assert first['X-Cache'] == 'MISS'
+        
+        with django_assert_num_queries(0):
+            second = api_client.get('/api/resources/?type=Prompt')
+        
+        assert second['X-Cache'] == 'HIT'
+        assert second.data == first.data
+    
+    def test_equivalent_queries_share_an_entry(self, api_client, resource):
+        """Test search case and spacing are normalized."""
+        api_client.get('/api/resources/?search=Cached%20%20Prompt')
+        response = api_client.get('/api/resources/?search=%20cached%20prompt')
+        
+        assert response['X-Cache'] == 'HIT'
+        assert response.data['count'] == 1
+    
+    def test_write_invalidates_every_page(self, api_client, resource, user):
+        """Test publishing a resource drops cached listings."""
+        assert api_client.get('/api/resources/').data['count'] == 1
+        
+        ResourceService.create_resource(user, {
+            'title': 'New',
+            'description': 'New',
+            'type': 'Prompt',
+            'content': 'Content',
+        })
+        response = api_client.get('/api/resources/')
+        
+        assert response['X-Cache'] == 'MISS'
+        assert response.data['count'] == 2
+    
+    def test_stats_require_admin(self, api_client, resource):
+        """Test anonymous users cannot read cache statistics."""
+        response = api_client.get('/api/resources/cache-stats/')
+        
+        assert response.status_code == 401
+    
+    def test_stats_count_hits_and_misses(self, admin_client, resource):
+        """Test hit/miss counters are exposed to admins."""
+        admin_client.get('/api/resources/')
+        admin_client.get('/api/resources/')
+        admin_client.get('/api/resources/?page=2')
+        
+        response = admin_client.get('/api/resources/cache-stats/')
+        
+        assert response.status_code == 200
+        assert response.data == {'hits': 1, 'misses': 2, 'hit_rate': 0.3333, 'scope': 'process'}
+    
+    def test_shared_cache_detection(self, settings):
+        """Test only in-process backends are reported as per-process."""
+        assert is_shared_cache() is False
+        
+        settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache'}}
+        
+        assert is_shared_cache() is True
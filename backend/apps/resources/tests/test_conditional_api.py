@@ -0,0 +1,189 @@
+"""
+API tests for conditional GET (ETag / Last-Modified) on read endpoints.
+
+US-05: Explorar Recursos
+US-07: Ver Detalle
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.authentication.models import Role
+from apps.resources.models import Resource, ResourceVersion
+from apps.interactions.services import VoteService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    """Create API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    """Create a test user."""
+    user = User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+    user.email_verified_at = timezone.now()
+    user.save()
+    return user
+
+
+@pytest.fixture
+def voter():
+    """Create a second user who votes."""
+    return User.objects.create_user('voter@example.com', 'Voter User', 'pass123')
+
+
+@pytest.fixture
+def resource(user):
+    """Create a resource."""
+    resource = Resource.objects.create(owner=user, source_type='Internal')
+    ResourceVersion.objects.create(
+        resource=resource,
+        version_number='1.0.0',
+        title='Conditional Prompt',
+        description='A prompt',
+        type='Prompt',
+        tags=['a'],
+        content='Content',
+        is_latest=True
+    )
+    return resource
+
+
+def _urls(resource):
+    return [
+        f'/api/resources/{resource.id}/',
+        '/api/resources/?type=Prompt',
+        f'/api/resources/{resource.id}/versions/',
+        f'/api/users/{resource.owner_id}/',
+    ]
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match and Last-Modified validators."""
+    
+    def test_responses_carry_validators(self, api_client, resource):
+        """Test every read endpoint returns ETag, Last-Modified and no-cache."""
+        for url in _urls(resource):
+            response = api_client.get(url)
+            
+            assert response.status_code == 200, url
+            assert response['ETag'].startswith('"'), url
+            assert 'Last-Modified' in response, url
+            assert 'no-cache' in response['Cache-Control'], url
+    
+    def test_matching_etag_returns_304(self, api_client, resource):
+        """Test a revalidation with the current ETag gets an empty 304."""
+        for url in _urls(resource):
+            etag = api_client.get(url)['ETag']
+            
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+            
+            assert response.status_code == 304, url
+            assert response['ETag'] == etag, url
+            assert not response.content, url
+    
+    def test_304_skips_cold_cache_serialization(self, api_client, resource, django_assert_max_num_queries):
+        """Test a cold-cache detail revalidation only runs the freshness query."""
+        etag = api_client.get(f'/api/resources/{resource.id}/')['ETag']
+        cache.clear()
+        
+        with django_assert_max_num_queries(1):
+            response = api_client.get(f'/api/resources/{resource.id}/', HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == 304
+    
+    def test_if_modified_since_returns_304(self, api_client, resource):
+        """Test Last-Modified round-trips through If-Modified-Since."""
+        url = f'/api/resources/{resource.id}/'
+        last_modified = api_client.get(url)['Last-Modified']
+        
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        
+        assert response.status_code == 304
+    
+    def test_vote_changes_etag(self, api_client, resource, voter):
+        """Test a vote invalidates the validators of detail, list and profile."""
+        urls = [
+            f'/api/resources/{resource.id}/',
+            '/api/resources/?type=Prompt',
+            f'/api/users/{resource.owner_id}/',
+        ]
+        etags = {url: api_client.get(url)['ETag'] for url in urls}
+        
+        VoteService.toggle_vote(voter, resource.id)
+        
+        for url in urls:
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+            
+            assert response.status_code == 200, url
+            assert response['ETag'] != etags[url], url
+    
+    def test_owner_changes_change_etag(self, api_client, resource):
+        """Test profile and role changes of the owner invalidate detail and list validators."""
+        urls = [f'/api/resources/{resource.id}/', '/api/resources/?type=Prompt']
+        admin_role, _ = Role.objects.get_or_create(name='Admin')
+        
+        def rename(owner):
+            owner.name = 'Renamed Owner'
+            owner.save()
+        
+        def promote(owner):
+            owner.roles.add(admin_role)
+        
+        for change in (rename, promote):
+            etags = {url: api_client.get(url)['ETag'] for url in urls}
+            change(User.objects.get(pk=resource.owner_id))
+            
+            for url in urls:
+                response = api_client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+                
+                assert response.status_code == 200, url
+                assert response['ETag'] != etags[url], url
+        
+        detail = api_client.get(urls[0]).data
+        assert detail['owner']['name'] == 'Renamed Owner'
+        assert detail['owner']['is_admin'] is True
+    
+    def test_login_keeps_etag(self, api_client, resource):
+        """Test saving fields not shown in payloads leaves validators alone."""
+        url = f'/api/resources/{resource.id}/'
+        etag = api_client.get(url)['ETag']
+        owner = User.objects.get(pk=resource.owner_id)
+        owner.last_login_at = timezone.now()
+        owner.save(update_fields=['last_login_at'])
+        
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    
+    def test_new_version_changes_history_etag(self, api_client, resource):
+        """Test adding a version invalidates the version history validators."""
+        url = f'/api/resources/{resource.id}/versions/'
+        etag = api_client.get(url)['ETag']
+        
+        ResourceVersion.objects.create(
+            resource=resource,
+            version_number='1.1.0',
+            title='Conditional Prompt v2',
+            description='A prompt',
+            type='Prompt',
+            content='Content',
+            is_latest=True
+        )
+        
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == 200
+        assert response.data['count'] == 2
+    
+    def test_missing_resource_is_404(self, api_client):
+        """Test validators are not computed for unknown resources."""
+        missing = '00000000-0000-0000-0000-000000000000'
+        
+        assert api_client.get(f'/api/resources/{missing}/').status_code == 404
+        assert api_client.get(f'/api/resources/{missing}/versions/').status_code == 404
@@ -8,6 +8,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from apps.resources.models import Resource, ResourceVersion
+from apps.outbox.services import OutboxService
 from apps.resources.services import ResourceService
 
 User = get_user_model()
@@ -131,3 +132,18 @@ class TestForkResourceService:
         
         resource.refresh_from_db()
         assert resource.forks_count == 2
+    
+    def test_repeated_forks_coalesce_owner_notification(self, user, another_user, resource):
+        """Test a burst of forks leaves the owner one notification with a count."""
+        third_user = User.objects.create_user('user3@example.com', 'User 3', 'pass123')
+        
+        ResourceService.fork_resource(another_user, resource.id)
+        ResourceService.fork_resource(third_user, resource.id)
+        ResourceService.fork_resource(another_user, resource.id)
+        assert not user.notifications.exists()  # created by the outbox worker
+        OutboxService.process_pending()
+        
+        notification = user.notifications.get(type='resource_forked')
+        assert notification.event_count == 3
+        assert [actor['name'] for actor in notification.actor_sample] == ['User 2', 'User 3']
+        assert notification.message == 'User 2 y 2 más reutilizaron tu recurso "Original Prompt"'
@@ -8,6 +8,8 @@ US-08: Publicar Recurso
 import pytest
 import hashlib
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgreSQLDatabaseWrapper
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from apps.resources.models import Resource, ResourceVersion
@@ -70,6 +72,38 @@ class TestResourceModel:
         assert resource.latest_version.id == v2.id
         assert resource.latest_version.version_number == '1.1.0'
     
+    def test_latest_version_pointer_follows_promotion(self, resource):
+        """Test promoting a version demotes the previous one and moves the FK."""
+        v1 = ResourceVersion.objects.create(
+            resource=resource,
+            version_number='1.0.0',
+            title='Version 1',
+            description='First version',
+            type='Prompt',
+            content='Content v1',
+            is_latest=True
+        )
+        assert Resource.objects.get(id=resource.id).latest_version_id == v1.id
+        
+        v2 = ResourceVersion.objects.create(
+            resource=resource,
+            version_number='1.1.0',
+            title='Version 2',
+            description='Second version',
+            type='Prompt',
+            content='Content v2',
+            is_latest=True
+        )
+        
+        v1.refresh_from_db()
+        assert v1.is_latest is False
+        assert Resource.objects.get(id=resource.id).latest_version_id == v2.id
+        
+        # Demoting the current latest clears the pointer
+        v2.is_latest = False
+        v2.save()
+        assert Resource.objects.get(id=resource.id).latest_version_id is None
+    
     def test_resource_votes_count_property(self, resource):
         """Test votes_count property."""
         # TODO: Update when Vote model is implemented (US-16)
@@ -99,6 +133,19 @@ class TestResourceModel:
         resource.save()
         
         assert resource.deleted_at is not None
+    
+    def test_deletion_state_lock_is_valid_on_postgresql(self, resource):
+        """Test save() locks only the resources row (FOR UPDATE on an outer join fails on PostgreSQL)."""
+        postgresql = PostgreSQLDatabaseWrapper(
+            {**connection.settings_dict, 'ENGINE': 'django.db.backends.postgresql'}, alias='postgresql'
+        )
+        # Compile only: SELECT ... FOR UPDATE needs a transaction, never connect
+        postgresql.get_autocommit = lambda: False
+        
+        sql, params = resource._locked_deletion_state().query.get_compiler(connection=postgresql).as_sql()
+        
+        assert 'LEFT OUTER JOIN "resource_versions"' in sql
+        assert sql.endswith('FOR UPDATE OF "resources"')
 
 
 @pytest.mark.django_db
@@ -0,0 +1,214 @@
+"""
+Tests for the values() listing fast path and the orjson renderer.
+
+US-05: Explorar Recursos
+"""
+
+import json
+import uuid
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from config.renderers import FastJSONRenderer
+from apps.authentication.models import Role
+from apps.resources.models import Resource, ResourceVersion
+from apps.resources.projections import fetch_resource_list, parse_fields
+from apps.resources.serializers import ResourceListSerializer
+from apps.resources.services import ResourceService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def admin_owner():
+    """Create a verified owner with the Admin role."""
+    admin_role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+    user_role, _ = Role.objects.get_or_create(name='User', defaults={'description': 'Regular user'})
+    owner = User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+    owner.roles.add(admin_role, user_role)
+    owner.email_verified_at = timezone.now()
+    owner.save()
+    return owner
+
+
+@pytest.fixture
+def resources(admin_owner):
+    """Create a validated resource, a fork of it and a resource without versions."""
+    original = Resource.objects.create(owner=admin_owner, source_type='Internal')
+    ResourceVersion.objects.create(
+        resource=original,
+        version_number='1.0.0',
+        title='Original',
+        description='Line\u2028separator',
+        type='Notebook',
+        tags=['genomics', 'python'],
+        content='print(1)',
+        example='Example',
+        status='Validated',
+        validated_at=timezone.now(),
+        is_latest=True
+    )
+    
+    plain_owner = User.objects.create_user('plain@example.com', 'Plain User', 'pass123')
+    fork = Resource.objects.create(
+        owner=plain_owner,
+        source_type='Internal',
+        derived_from_resource=original,
+        derived_from_version=original.latest_version
+    )
+    ResourceVersion.objects.create(
+        resource=fork,
+        version_number='1.0.0',
+        title='Fork',
+        description='Forked',
+        type='Notebook',
+        content='print(2)',
+        is_latest=True
+    )
+    
+    Resource.objects.create(owner=plain_owner, source_type='Internal')
+    return original, fork
+
+
+@pytest.fixture
+def api_client():
+    """Create API client."""
+    return APIClient()
+
+
+def _listing():
+    return ResourceService._build_list_queryset().order_by('-created_at')
+
+
+def _selects_heavy_columns(queries):
+    heavy = ('"content"', '"example"', '"changelog"', '"search_vector"')
+    return any(column in query['sql'] for query in queries for column in heavy)
+
+
+@pytest.mark.django_db
+class TestResourceListProjection:
+    """Tests for fetch_resource_list() parity with ResourceListSerializer."""
+    
+    def test_rows_match_serializer(self, resources):
+        """Test projected rows equal the DRF serializer output, key order included."""
+        expected = ResourceListSerializer(list(_listing()), many=True).data
+        
+        rows = fetch_resource_list(_listing())
+        
+        assert json.dumps(rows) == json.dumps(expected)
+    
+    def test_two_queries_per_page(self, resources, django_assert_num_queries):
+        """Test a page costs one row query plus one roles query."""
+        with django_assert_num_queries(2):
+            fetch_resource_list(_listing())
+    
+    def test_cursor_pages_from_rows(self, resources):
+        """Test cursor pagination works on projected rows."""
+        first = ResourceService.list_resources_cursor(page_size=2, as_rows=True)
+        second = ResourceService.list_resources_cursor(cursor=first['next'], page_size=2, as_rows=True)
+        
+        seen = [row['id'] for row in first['results'] + second['results']]
+        assert seen == [str(resource.id) for resource in _listing()]
+        assert second['has_next'] is False
+    
+    def test_heavy_columns_are_not_fetched(self, resources):
+        """Test neither the fast path nor the model path selects content/example/changelog."""
+        with CaptureQueriesContext(connection) as fast:
+            rows = fetch_resource_list(_listing())
+        with CaptureQueriesContext(connection) as models:
+            ResourceListSerializer(list(_listing()), many=True).data
+        
+        assert not _selects_heavy_columns(fast.captured_queries)
+        assert not _selects_heavy_columns(models.captured_queries)
+        versions = [row['latest_version'] for row in rows if row['latest_version']]
+        assert all('content' not in version and 'title' in version for version in versions)
+    
+    def test_sparse_fieldset(self, resources):
+        """Test ?fields= narrows top-level and nested keys."""
+        fields = parse_fields('id, votes_count,latest_version.title,owner.name,owner.is_admin')
+        
+        rows = fetch_resource_list(_listing(), fields)
+        
+        original = next(row for row in rows if row['latest_version'] and row['latest_version']['title'] == 'Original')
+        assert original == {
+            'id': original['id'],
+            'owner': {'name': 'Owner User', 'is_admin': True},
+            'latest_version': {'title': 'Original'},
+            'votes_count': 0,
+        }
+    
+    def test_parse_fields_rejects_unknown_names(self):
+        """Test unknown top-level and nested names are rejected."""
+        assert parse_fields('') is None
+        assert parse_fields('votes_count,id,id') == ('id', 'votes_count')
+        
+        for value in ('password', 'owner.password', 'latest_version.content', 'votes_count.x'):
+            with pytest.raises(ValueError, match='Unknown field'):
+                parse_fields(value)
+    
+    def test_benchmark_command(self, resources):
+        """Test the benchmark reports per-row cost for both paths."""
+        out = StringIO()
+        
+        call_command('benchmark_list_serialization', '--repeat', '2', stdout=out)
+        
+        output = out.getvalue()
+        assert 'µs/row' in output
+        assert 'faster per row' in output
+
+
+@pytest.mark.django_db
+class TestSparseFieldsetAPI:
+    """Tests for GET /api/resources/?fields="""
+    
+    def test_fields_param(self, api_client, resources):
+        """Test the listing only returns the requested keys."""
+        response = api_client.get('/api/resources/?fields=id,latest_version.title')
+        
+        assert response.status_code == 200
+        for row in response.data['results']:
+            assert set(row) == {'id', 'latest_version'}
+    
+    def test_fields_param_with_cursor(self, api_client, resources):
+        """Test cursors still work when the fieldset omits the sort key."""
+        first = api_client.get('/api/resources/?pagination=cursor&page_size=2&fields=latest_version.title')
+        second = api_client.get(f"/api/resources/?cursor={first.data['next']}&page_size=2&fields=latest_version.title")
+        
+        assert second.status_code == 200
+        assert [set(row) for row in first.data['results'] + second.data['results']] == [{'latest_version'}] * 3
+    
+    def test_invalid_fields(self, api_client):
+        """Test unknown fields are rejected."""
+        response = api_client.get('/api/resources/?fields=id,owner.password')
+        
+        assert response.status_code == 400
+        assert response.data['error_code'] == 'INVALID_FIELDS'
+
+
+class TestFastJSONRenderer:
+    """Tests for FastJSONRenderer parity with DRF's JSONRenderer."""
+    
+    def test_output_matches_json_renderer(self):
+        """Test bytes are identical for DRF's usual value types."""
+        data = {
+            'id': uuid.uuid4(),
+            'when': timezone.now(),
+            'name': 'Ünïcode\u2028line',
+            'nested': [{'count': 3, 'ratio': 0.5, 'flag': None}],
+            'day': timezone.now().date(),
+        }
+        
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+    
+    def test_indent_falls_back_to_json_renderer(self):
+        """Test indented output (e.g. Accept: application/json; indent=2) still works."""
+        rendered = FastJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+        
+        assert rendered == JSONRenderer().render({'a': 1}, 'application/json; indent=2')
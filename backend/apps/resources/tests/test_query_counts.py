@@ -0,0 +1,155 @@
+"""
+N+1 guards for resource read endpoints (see assert_constant_queries in conftest.py).
+
+US-05: Explorar Recursos
+US-07: Ver Detalle
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from apps.authentication.models import Role
+from apps.interactions.models import Vote
+from apps.resources.models import Resource, ResourceVersion
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    """Create API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def admin_role():
+    """Create the Admin role."""
+    role, _ = Role.objects.get_or_create(name='Admin', defaults={'description': 'Administrator'})
+    return role
+
+
+@pytest.fixture
+def resource():
+    """Create a resource with v1.0.0."""
+    owner = User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+    resource = Resource.objects.create(owner=owner, source_type='Internal')
+    ResourceVersion.objects.create(
+        resource=resource,
+        version_number='1.0.0',
+        title='Counted Prompt',
+        description='A prompt',
+        type='Prompt',
+        content='Content',
+        is_latest=True
+    )
+    return resource
+
+
+def seed_resources(admin_role):
+    """Return a seeder creating resources with distinct owners (every other one an admin) and a vote each."""
+    created = []
+    
+    def seed(count):
+        for _ in range(count):
+            index = len(created)
+            owner = User.objects.create_user(f'seed{index}@example.com', f'Seed {index}', 'pass123')
+            if index % 2 == 0:
+                owner.roles.add(admin_role)
+            resource = Resource.objects.create(owner=owner, source_type='Internal')
+            ResourceVersion.objects.create(
+                resource=resource,
+                version_number='1.0.0',
+                title=f'Seeded resource {index}',
+                description='Seeded',
+                type='Prompt',
+                tags=['seed'],
+                content='Content',
+                is_latest=True
+            )
+            Vote.objects.create(user=owner, resource=resource)
+            created.append(resource)
+    
+    return seed
+
+
+def seed_versions(resource):
+    """Return a seeder adding new latest versions (and voters) to a resource."""
+    def seed(count):
+        for _ in range(count):
+            index = resource.versions.count()
+            ResourceVersion.objects.create(
+                resource=resource,
+                version_number=f'1.{index}.0',
+                title=f'Counted Prompt v{index}',
+                description='A prompt',
+                type='Prompt',
+                content='Content',
+                is_latest=True
+            )
+            voter = User.objects.create_user(f'voter{index}@example.com', f'Voter {index}', 'pass123')
+            Vote.objects.create(user=voter, resource=resource)
+    
+    return seed
+
+
+@pytest.mark.django_db
+class TestResourceQueryCounts:
+    """Query counts of resource endpoints must not grow with the number of rows."""
+    
+    def test_list(self, assert_constant_queries, api_client, admin_role):
+        """GET /api/resources/"""
+        assert_constant_queries(
+            seed=seed_resources(admin_role),
+            request=lambda: api_client.get('/api/resources/?page_size=100'),
+        )
+    
+    def test_list_with_search_and_filters(self, assert_constant_queries, api_client, admin_role):
+        """GET /api/resources/?search=...&type=...&ordering=-votes"""
+        assert_constant_queries(
+            seed=seed_resources(admin_role),
+            request=lambda: api_client.get('/api/resources/?search=seeded&type=Prompt&ordering=-votes&page_size=100'),
+        )
+    
+    def test_list_authenticated(self, assert_constant_queries, api_client, admin_role):
+        """GET /api/resources/ as a voter (user_has_voted is one page-scoped query)"""
+        voter = User.objects.create_user('browser@example.com', 'Browser', 'pass123')
+        api_client.force_authenticate(user=voter)
+        seed = seed_resources(admin_role)
+        
+        def seed_and_vote(count):
+            seed(count)
+            for resource in Resource.objects.exclude(votes__user=voter):
+                Vote.objects.create(user=voter, resource=resource)
+        
+        assert_constant_queries(
+            seed=seed_and_vote,
+            request=lambda: api_client.get('/api/resources/?page_size=100'),
+        )
+    
+    def test_list_trending(self, assert_constant_queries, api_client, admin_role):
+        """GET /api/resources/?ordering=-trending"""
+        assert_constant_queries(
+            seed=seed_resources(admin_role),
+            request=lambda: api_client.get('/api/resources/?ordering=-trending&page_size=100'),
+        )
+    
+    def test_list_cursor(self, assert_constant_queries, api_client, admin_role):
+        """GET /api/resources/?pagination=cursor"""
+        assert_constant_queries(
+            seed=seed_resources(admin_role),
+            request=lambda: api_client.get('/api/resources/?pagination=cursor&include_count=true&page_size=100'),
+        )
+    
+    def test_detail(self, assert_constant_queries, api_client, resource):
+        """GET /api/resources/{id}/"""
+        assert_constant_queries(
+            seed=seed_versions(resource),
+            request=lambda: api_client.get(f'/api/resources/{resource.id}/'),
+        )
+    
+    def test_version_history(self, assert_constant_queries, api_client, resource):
+        """GET /api/resources/{id}/versions/"""
+        assert_constant_queries(
+            seed=seed_versions(resource),
+            request=lambda: api_client.get(f'/api/resources/{resource.id}/versions/'),
+        )
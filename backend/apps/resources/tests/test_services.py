@@ -141,6 +141,55 @@ class TestResourceService:
         result = ResourceService.list_resources(ordering='created_at')
         assert result['results'][0].latest_version.title == 'Test Prompt'  # First created
     
+    def test_list_resources_cursor_walks_forward_and_back(self, sample_resources):
+        """Test keyset pagination visits every row once in both directions."""
+        first = ResourceService.list_resources_cursor(page_size=2)
+        assert [r.latest_version.title for r in first['results']] == ['Test Dataset', 'Test Workflow']
+        assert first['has_next'] is True
+        assert first['has_previous'] is False
+        assert first['previous'] is None
+        assert 'count' not in first
+        
+        second = ResourceService.list_resources_cursor(cursor=first['next'], page_size=2)
+        assert [r.latest_version.title for r in second['results']] == ['Test Prompt']
+        assert second['has_next'] is False
+        assert second['next'] is None
+        
+        back = ResourceService.list_resources_cursor(cursor=second['previous'], page_size=2)
+        assert [r.id for r in back['results']] == [r.id for r in first['results']]
+        assert back['has_previous'] is False
+    
+    def test_list_resources_cursor_votes_ordering_breaks_ties_by_id(self, sample_resources):
+        """Test -votes cursor pages do not skip or repeat rows with equal counts."""
+        seen = []
+        cursor = None
+        while True:
+            page = ResourceService.list_resources_cursor(ordering='-votes', cursor=cursor, page_size=1)
+            seen.extend(r.id for r in page['results'])
+            if not page['has_next']:
+                break
+            cursor = page['next']
+        
+        assert sorted(seen) == sorted(r.id for r in sample_resources)
+    
+    def test_list_resources_cursor_optional_count(self, sample_resources):
+        """Test exact count is only computed when requested."""
+        result = ResourceService.list_resources_cursor(filters={'type': 'Prompt'}, include_count=True)
+        assert result['count'] == 1
+    
+    def test_list_resources_cursor_rejects_foreign_cursor(self, sample_resources):
+        """Test a cursor from another ordering (or garbage) is rejected."""
+        first = ResourceService.list_resources_cursor(page_size=1)
+        
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            ResourceService.list_resources_cursor(ordering='created_at', cursor=first['next'])
+        
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            ResourceService.list_resources_cursor(cursor='not-a-cursor')
+        
+        with pytest.raises(ValueError, match='not supported with cursor pagination'):
+            ResourceService.list_resources_cursor(ordering='-trending')
+    
     def test_create_resource_internal(self, user):
         """Test creating an Internal resource."""
         data = {
@@ -0,0 +1,117 @@
+"""
+Tests for search autocomplete (in-process trigram index used on SQLite).
+
+US-06: Buscar y Filtrar
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.resources.models import Resource, ResourceVersion
+from apps.resources.suggest import invalidate_suggest_index, suggest
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    """The index is process-wide; drop rows left over from rolled-back tests."""
+    invalidate_suggest_index()
+
+
+@pytest.fixture
+def user():
+    """Create a test user."""
+    return User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+
+
+@pytest.fixture
+def catalog(user):
+    """Create resources with distinct titles and tags."""
+    resources = {}
+    for title, tags in [
+        ('CRISPR guide designer', ['crispr', 'genomics']),
+        ('Protein folding notebook', ['proteins']),
+        ('Genome assembly workflow', ['genomics', 'assembly']),
+    ]:
+        resource = Resource.objects.create(owner=user, source_type='Internal')
+        ResourceVersion.objects.create(
+            resource=resource,
+            version_number='1.0.0',
+            title=title,
+            description='Description',
+            type='Tool',
+            tags=tags,
+            content='Content',
+            is_latest=True
+        )
+        resources[title] = resource
+    return resources
+
+
+@pytest.mark.django_db
+class TestSuggest:
+    """Tests for the suggest() lookup."""
+    
+    def test_prefix_matches_any_word(self, catalog):
+        """Test a prefix of any title word is suggested."""
+        result = suggest('fold')
+        
+        assert [r['title'] for r in result['results']] == ['Protein folding notebook']
+    
+    def test_tolerates_typos(self, catalog):
+        """Test a word with a missing letter still finds the title."""
+        result = suggest('protin')
+        
+        assert result['results'][0]['id'] == catalog['Protein folding notebook'].id
+    
+    def test_tags_ordered_by_usage(self, catalog):
+        """Test tag suggestions are prefix matches, most used first."""
+        result = suggest('gen')
+        
+        assert result['tags'] == ['genomics']
+        assert result['results'][0]['title'] == 'Genome assembly workflow'
+    
+    def test_index_refreshes_after_soft_delete(self, catalog):
+        """Test soft-deleted resources disappear from suggestions."""
+        assert suggest('crispr')['results']
+        
+        resource = catalog['CRISPR guide designer']
+        resource.deleted_at = timezone.now()
+        resource.save()
+        
+        assert suggest('crispr')['results'] == []
+
+
+@pytest.mark.django_db
+class TestSuggestAPI:
+    """Tests for GET /api/resources/suggest/"""
+    
+    def test_suggest_endpoint(self, catalog):
+        """Test endpoint returns lightweight rows."""
+        response = APIClient().get('/api/resources/suggest/?q=genome')
+        
+        assert response.status_code == 200
+        assert response.data['results'][0]['title'] == 'Genome assembly workflow'
+        assert set(response.data['results'][0]) == {'id', 'title', 'type'}
+    
+    def test_suggest_short_query_returns_nothing(self, catalog):
+        """Test queries under 2 characters skip the lookup."""
+        response = APIClient().get('/api/resources/suggest/?q=g')
+        
+        assert response.status_code == 200
+        assert response.data['results'] == []
+        assert response.data['tags'] == []
+    
+    def test_suggest_limit_is_validated(self, catalog):
+        """Test a non-numeric limit falls back to the default and negatives are clamped."""
+        response = APIClient().get('/api/resources/suggest/?q=genome&limit=abc')
+        
+        assert response.status_code == 200
+        assert response.data['results'][0]['title'] == 'Genome assembly workflow'
+        
+        response = APIClient().get('/api/resources/suggest/?q=genome&limit=-3')
+        
+        assert response.status_code == 200
+        assert len(response.data['results']) == 1
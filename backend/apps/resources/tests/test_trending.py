@@ -0,0 +1,196 @@
+"""
+Tests for the time-decayed trending score (ordering=-trending).
+
+US-05: Explorar Recursos
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from freezegun import freeze_time
+from rest_framework.test import APIClient
+from apps.interactions.models import Vote
+from apps.interactions.services import VoteService
+from apps.resources import trending
+from apps.resources.models import Resource, ResourceVersion
+from apps.resources.services import ResourceService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    """Create a resource owner."""
+    return User.objects.create_user('owner@example.com', 'Owner User', 'pass123')
+
+
+@pytest.fixture
+def voters():
+    """Create users who vote."""
+    return [User.objects.create_user(f'voter{i}@example.com', f'Voter {i}', 'pass123') for i in range(3)]
+
+
+def make_resource(owner, title):
+    resource = Resource.objects.create(owner=owner, source_type='Internal')
+    ResourceVersion.objects.create(
+        resource=resource,
+        version_number='1.0.0',
+        title=title,
+        description='A prompt',
+        type='Prompt',
+        content='Content',
+        is_latest=True
+    )
+    return resource
+
+
+def _score(resource):
+    return Resource.objects.values_list('trending_score', flat=True).get(pk=resource.pk)
+
+
+def _computed(resource):
+    return trending.compute_scores([resource.pk])[resource.pk]
+
+
+@pytest.mark.django_db
+class TestTrendingScore:
+    """Tests for incremental maintenance of Resource.trending_score."""
+    
+    def test_vote_and_unvote_update_score(self, user, voters):
+        """Test a vote adds its decayed weight and the unvote removes it."""
+        resource = make_resource(user, 'Voted')
+        
+        VoteService.toggle_vote(voters[0], resource.id)
+        vote = Vote.objects.get(resource=resource)
+        
+        assert _score(resource) == pytest.approx(trending.event_score(trending.VOTE_WEIGHT, vote.created_at))
+        
+        VoteService.toggle_vote(voters[0], resource.id)
+        
+        assert _score(resource) == pytest.approx(0.0, abs=1e-9 * trending.event_score(1, timezone.now()))
+    
+    def test_fork_adds_fork_weight(self, user, voters):
+        """Test a fork counts FORK_WEIGHT votes."""
+        resource = make_resource(user, 'Forked')
+        
+        ResourceService.fork_resource(voters[0], resource.id)
+        
+        assert _score(resource) == pytest.approx(_computed(resource))
+        resource.refresh_from_db()
+        decayed = trending.decayed(resource.trending_score, resource.trending_epoch, timezone.now())
+        assert decayed == pytest.approx(trending.FORK_WEIGHT, rel=1e-3)
+    
+    def test_older_votes_weigh_less(self, user, voters):
+        """Test one fresh vote outranks two votes from a week ago."""
+        old = make_resource(user, 'Old favourite')
+        fresh = make_resource(user, 'Fresh')
+        for voter in voters[:2]:
+            VoteService.toggle_vote(voter, old.id)
+        VoteService.toggle_vote(voters[2], fresh.id)
+        Vote.objects.filter(resource=old).update(created_at=timezone.now() - timedelta(days=7))
+        
+        call_command('refresh_trending_scores', stdout=StringIO())
+        result = ResourceService.list_resources(ordering='-trending')
+        
+        assert [resource.id for resource in result['results']] == [fresh.id, old.id]
+        assert ResourceService.list_resources(ordering='-votes')['results'][0].id == old.id
+    
+    def test_refresh_command_repairs_drift(self, user, voters):
+        """Test the command recomputes stored scores from votes and forks."""
+        resource = make_resource(user, 'Drifted')
+        VoteService.toggle_vote(voters[0], resource.id)
+        ResourceService.fork_resource(voters[1], resource.id)
+        expected = _score(resource)
+        Resource.objects.filter(pk=resource.pk).update(trending_score=123.0)
+        out = StringIO()
+        
+        call_command('refresh_trending_scores', '--resource', str(resource.id), stdout=out)
+        
+        assert _score(resource) == pytest.approx(expected)
+        assert 'Refreshed trending score of 1 resource(s)' in out.getvalue()
+    
+    @override_settings(TRENDING_HALF_LIFE_HOURS=24)
+    def test_half_life_setting(self):
+        """Test an event loses half its weight after one half-life."""
+        now = timezone.now()
+        
+        ratio = trending.event_score(1, now - timedelta(hours=24)) / trending.event_score(1, now)
+        
+        assert ratio == pytest.approx(0.5)
+    
+    @override_settings(TRENDING_HALF_LIFE_HOURS=6)
+    def test_votes_years_later_do_not_overflow(self, user, voters, django_capture_on_commit_callbacks):
+        """Test exponents stay bounded however far the clock is from the first epoch."""
+        resource = make_resource(user, 'Long lived')
+        VoteService.toggle_vote(voters[0], resource.id)
+        
+        with freeze_time(timezone.now() + timedelta(days=3650)):
+            with django_capture_on_commit_callbacks(execute=True):
+                VoteService.toggle_vote(voters[1], resource.id)
+                ResourceService.fork_resource(voters[2], resource.id)
+                VoteService.toggle_vote(voters[0], resource.id)
+            
+            resource.refresh_from_db()
+            assert resource.trending_epoch == trending.current_epoch()
+            assert resource.trending_score == pytest.approx(_computed(resource))
+            assert resource.trending_score < 2.0 ** 128
+    
+    def test_rebase_keeps_order_and_decayed_scores(self, user, voters, django_capture_on_commit_callbacks):
+        """Test the first write of a new epoch period rescales every row without changing the ranking."""
+        busy = make_resource(user, 'Busy')
+        quiet = make_resource(user, 'Quiet')
+        for voter in voters[:2]:
+            VoteService.toggle_vote(voter, busy.id)
+        VoteService.toggle_vote(voters[2], quiet.id)
+        later = timezone.now() + timedelta(hours=2 * trending.REBASE_HALF_LIVES * 48)
+        before = {
+            resource.pk: trending.decayed(resource.trending_score, resource.trending_epoch, later)
+            for resource in Resource.objects.all()
+        }
+        
+        with freeze_time(later):
+            fresh = make_resource(user, 'Fresh')
+            with django_capture_on_commit_callbacks(execute=True):
+                VoteService.toggle_vote(voters[0], fresh.id)
+            
+            epoch = trending.current_epoch()
+            for resource in Resource.objects.filter(pk__in=before):
+                assert resource.trending_epoch == epoch
+                decayed = trending.decayed(resource.trending_score, epoch, later)
+                assert decayed == pytest.approx(before[resource.pk], rel=1e-9)
+            
+            result = ResourceService.list_resources(ordering='-trending')
+            assert [resource.id for resource in result['results']] == [fresh.id, busy.id, quiet.id]
+    
+    def test_vote_on_row_not_yet_rebased(self, user, voters):
+        """Test a vote racing a rebase is applied relative to the row's own epoch."""
+        resource = make_resource(user, 'Lagging')
+        old_epoch = trending.current_epoch() - trending.REBASE_HALF_LIVES * trending.get_half_life_seconds()
+        Resource.objects.filter(pk=resource.pk).update(trending_epoch=old_epoch)
+        
+        VoteService.toggle_vote(voters[0], resource.id)
+        trending.rebase()
+        
+        assert _score(resource) == pytest.approx(_computed(resource))
+
+
+@pytest.mark.django_db
+class TestTrendingOrderingAPI:
+    """Tests for GET /api/resources/?ordering=-trending."""
+    
+    def test_list_ordered_by_trending(self, user, voters):
+        """Test the listing orders by the stored score without aggregating votes."""
+        quiet = make_resource(user, 'Quiet')
+        busy = make_resource(user, 'Busy')
+        for voter in voters:
+            VoteService.toggle_vote(voter, busy.id)
+        
+        response = APIClient().get('/api/resources/?ordering=-trending')
+        
+        assert response.status_code == 200
+        assert [row['id'] for row in response.data['results']] == [str(busy.id), str(quiet.id)]
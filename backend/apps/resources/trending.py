@@ -0,0 +1,208 @@
+"""
+Time-decayed "trending" score for resources (ordering=-trending).
+
+Every vote and fork adds `weight * 2 ** ((event_time - epoch) / half_life)`
+to Resource.trending_score, where `epoch` is the row's trending_epoch.
+Dividing all scores by the same `2 ** ((now - epoch) / half_life)` gives the
+usual decayed score (each event counts `weight * 2 ** -(age / half_life)`), so
+while every row shares the same epoch the stored values already sort in
+trending order at any time: nothing has to decay, events are added (vote,
+fork) or removed (unvote) in the UPDATE that maintains the counters, and the
+column is indexed like votes_count.
+
+Scores grow by 2x per half-life since the epoch, so the epoch moves forward
+by itself: current_epoch() starts a new period every REBASE_HALF_LIVES
+half-lives, and the first vote or fork of a new period rebases every row
+(one UPDATE rescaling the scores, see rebase()). Increments are applied
+relative to each row's own trending_epoch, so votes racing with a rebase stay
+exact, and exponents stay far below the float limit (2 ** 1024). A row left
+behind for more than MAX_LAG_HALF_LIVES half-lives (no write at all for
+years) is rescaled with a clamped factor: its old events are negligible by
+then, and the same clamp in rebase() keeps new events exact.
+
+`manage.py refresh_trending_scores` recomputes the column from the votes and
+forks tables (after changing TRENDING_HALF_LIFE_HOURS, or to repair drift).
+
+US-05: Explorar Recursos
+"""
+
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Greatest, Power
+from django.utils import timezone
+
+# Same relative weights as the contribution impact score (vote 1, reuse 5)
+VOTE_WEIGHT = 1.0
+FORK_WEIGHT = 5.0
+
+# Half-lives per epoch period: stored scores stay below ~2 ** 64 per event
+REBASE_HALF_LIVES = 64
+
+# Largest epoch difference applied as a factor (2 ** 512 keeps scores finite)
+MAX_LAG_HALF_LIVES = 512.0
+
+# Exponent clamp, last resort against OverflowError (rebasing keeps exponents far lower)
+MAX_EXPONENT = 1000.0
+
+EPOCH_CACHE_KEY = 'resources:trending:epoch'
+
+
+def get_half_life_seconds():
+    """Half-life of an event's contribution, in seconds."""
+    return getattr(settings, 'TRENDING_HALF_LIFE_HOURS', 48) * 3600
+
+
+def current_epoch(now=None):
+    """Start of the current epoch period, as a Unix timestamp (default for new rows)."""
+    period = REBASE_HALF_LIVES * get_half_life_seconds()
+    now = now or timezone.now()
+    return float(math.floor(now.timestamp() / period) * period)
+
+
+def _pow2(exponent):
+    return 2.0 ** max(min(exponent, MAX_EXPONENT), -MAX_EXPONENT)
+
+
+def event_score(weight, at, epoch=None):
+    """Contribution of one event that happened at `at`, relative to `epoch` (default: current_epoch())."""
+    if epoch is None:
+        epoch = current_epoch()
+    return weight * _pow2((at.timestamp() - epoch) / get_half_life_seconds())
+
+
+def lag_factor(epoch, row_epoch):
+    """Factor converting a score relative to `epoch` into one relative to an older `row_epoch`."""
+    return _pow2(min((epoch - row_epoch) / get_half_life_seconds(), MAX_LAG_HALF_LIVES))
+
+
+def row_event_score(weight, at, row_epoch):
+    """Contribution of one event to a row whose scores are relative to `row_epoch`."""
+    epoch = current_epoch()
+    return event_score(weight, at, epoch) * lag_factor(epoch, row_epoch)
+
+
+def decayed(score, epoch, now):
+    """Convert a stored score (relative to `epoch`) into the decayed score at `now` (for display/debugging)."""
+    return score * _pow2((epoch - now.timestamp()) / get_half_life_seconds())
+
+
+def rebase(epoch=None):
+    """
+    Move every score still relative to an older epoch to `epoch` (one UPDATE).
+
+    Returns:
+        int: Number of rows rescaled
+    """
+    from apps.resources.models import Resource
+
+    if epoch is None:
+        epoch = current_epoch()
+    exponent = Greatest(
+        (F('trending_epoch') - Value(epoch)) / Value(float(get_half_life_seconds())),
+        Value(-MAX_LAG_HALF_LIVES),
+        output_field=FloatField()
+    )
+    return Resource.objects.filter(trending_epoch__lt=epoch).update(
+        trending_score=F('trending_score') * Power(Value(2.0), exponent),
+        trending_epoch=epoch
+    )
+
+
+def ensure_current_epoch():
+    """Rebase once per epoch period; a cache lookup otherwise. Called after votes and forks commit."""
+    epoch = current_epoch()
+    if cache.get(EPOCH_CACHE_KEY) != epoch:
+        rebase(epoch)
+        cache.set(EPOCH_CACHE_KEY, epoch, timeout=None)
+
+
+def compute_scores(resource_ids, epoch=None):
+    """
+    Compute trending scores from the votes and forks tables.
+
+    Args:
+        resource_ids (list): Resources to compute
+        epoch (float, optional): Epoch of the scores (default: current_epoch())
+
+    Returns:
+        dict: {resource_id: score} (0.0 for resources without events)
+    """
+    from apps.interactions.models import Vote
+    from apps.resources.models import Resource
+
+    if epoch is None:
+        epoch = current_epoch()
+    scores = dict.fromkeys(resource_ids, 0.0)
+
+    votes = Vote.objects.filter(resource_id__in=resource_ids).values_list('resource_id', 'created_at')
+    for resource_id, created_at in votes.iterator(chunk_size=2000):
+        scores[resource_id] += event_score(VOTE_WEIGHT, created_at, epoch)
+
+    forks = Resource.objects.filter(derived_from_resource_id__in=resource_ids).values_list(
+        'derived_from_resource_id', 'created_at'
+    )
+    for resource_id, created_at in forks.iterator(chunk_size=2000):
+        scores[resource_id] += event_score(FORK_WEIGHT, created_at, epoch)
+
+    return scores
+
+
+def refresh_scores(resource_ids=None, batch_size=500):
+    """
+    Recompute and store trending scores in batches.
+
+    Each batch locks its resources while reading their events, so votes and
+    forks committed concurrently are neither lost nor counted twice. Rows are
+    rebased to the current epoch first, so resources outside the batches keep
+    sorting consistently with the refreshed ones.
+
+    Args:
+        resource_ids (list, optional): Resources to refresh (default: all live resources)
+        batch_size (int): Resources per batch
+
+    Returns:
+        int: Number of resources updated
+    """
+    from apps.resources.models import Resource
+
+    if resource_ids is None:
+        resource_ids = Resource.objects.filter(
+            deleted_at__isnull=True
+        ).order_by('id').values_list('id', flat=True).iterator(chunk_size=batch_size)
+
+    epoch = current_epoch()
+    rebase(epoch)
+    cache.set(EPOCH_CACHE_KEY, epoch, timeout=None)
+
+    updated = 0
+    batch = []
+    for resource_id in resource_ids:
+        batch.append(resource_id)
+        if len(batch) >= batch_size:
+            updated += _refresh_batch(batch, epoch)
+            batch = []
+    if batch:
+        updated += _refresh_batch(batch, epoch)
+
+    return updated
+
+
+def _refresh_batch(resource_ids, epoch):
+    from apps.resources.models import Resource
+
+    with transaction.atomic():
+        resources = list(
+            Resource.objects.select_for_update()
+            .filter(pk__in=resource_ids)
+            .only('id', 'trending_score', 'trending_epoch')
+        )
+        scores = compute_scores([resource.pk for resource in resources], epoch)
+        for resource in resources:
+            resource.trending_score = scores[resource.pk]
+            resource.trending_epoch = epoch
+        Resource.objects.bulk_update(resources, ['trending_score', 'trending_epoch'])
+    return len(resources)
@@ -3,6 +3,8 @@
 from django.urls import path
 from apps.resources.views import (
     ResourceListView,
+    ResourceListCacheStatsView,
+    ResourceSuggestView,
     ResourceDetailView,
     ResourceCreateView,
     ResourceValidateView,
@@ -14,6 +16,8 @@ from apps.interactions.views import VoteToggleView
 urlpatterns = [
     path('', ResourceListView.as_view(), name='resource-list'),
     path('create/', ResourceCreateView.as_view(), name='resource-create'),
+    path('suggest/', ResourceSuggestView.as_view(), name='resource-suggest'),
+    path('cache-stats/', ResourceListCacheStatsView.as_view(), name='resource-cache-stats'),
     path('<uuid:resource_id>/', ResourceDetailView.as_view(), name='resource-detail'),
     path('<uuid:resource_id>/vote/', VoteToggleView.as_view(), name='vote-toggle'),
     path('<uuid:resource_id>/validate/', ResourceValidateView.as_view(), name='resource-validate'),
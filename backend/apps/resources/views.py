@@ -7,16 +7,27 @@ US-07: Ver Detalle
 US-08: Publicar Recurso
 """
 
+import json
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from django.db.models import Count
 
+from config.conditional import build_etag, not_modified, set_validators, user_etag
+from apps.interactions.services import VoteService
+from apps.resources.cache import (
+    get_cached_detail,
+    set_cached_detail,
+    get_cached_list,
+    set_cached_list,
+    get_list_cache_stats,
+)
 from apps.resources.models import Resource, ResourceVersion
-from apps.resources.services import ResourceService
+from apps.resources.projections import parse_fields
+from apps.resources.services import CURSOR_ORDERINGS, ResourceService
+from apps.resources.suggest import suggest
 from apps.resources.serializers import (
-    ResourceListSerializer,
     ResourceDetailSerializer,
     CreateResourceSerializer,
     ValidateResourceSerializer,
@@ -38,7 +49,19 @@ class ResourceListView(APIView):
         - type (str): Filter by type (Prompt, Workflow, etc.)
         - status (str): Filter by status (Sandbox, Validated, etc.)
         - tags (str): Comma-separated tags
-        - ordering (str): -created_at, created_at, -votes
+        - ordering (str): -created_at, created_at, -votes, -trending, -relevance (with search)
+        - pagination (str): 'cursor' to use keyset pagination instead of page numbers
+        - cursor (str): Opaque cursor from a previous 'next'/'previous' (implies cursor mode)
+        - include_count (bool): Cursor mode only; also return the exact total count
+        - fields (str): Sparse fieldset, e.g. 'id,votes_count,latest_version.title,owner.name'
+    
+    Rows embed a summary of the latest version (no content/example/changelog);
+    the full version is served by the detail endpoint. For authenticated
+    users, user_has_voted comes from one `resource_id IN (<page>)` query.
+    
+    Identical normalized queries are served from a short-lived cache that is
+    dropped on any resource write (X-Cache: HIT/MISS, see apps/resources/cache.py).
+    Supports conditional GET (ETag / Last-Modified -> 304 Not Modified).
     
     US-05: Explorar Recursos
     US-06: Buscar y Filtrar
@@ -49,9 +72,29 @@ class ResourceListView(APIView):
     def get(self, request):
         # Parse query params
         page = int(request.query_params.get('page', 1))
-        page_size = min(int(request.query_params.get('page_size', 20)), 100)
-        search = request.query_params.get('search', '').strip()
+        page_size = max(1, min(int(request.query_params.get('page_size', 20)), 100))
+        search = ' '.join(request.query_params.get('search', '').lower().split())
         ordering = request.query_params.get('ordering', '-created_at')
+        cursor = request.query_params.get('cursor')
+        use_cursor = cursor is not None or request.query_params.get('pagination') == 'cursor'
+        include_count = request.query_params.get('include_count', 'false').lower() == 'true'
+        
+        if use_cursor and ordering not in CURSOR_ORDERINGS:
+            return Response(
+                {
+                    'error': f'Ordering {ordering} is not supported with cursor pagination',
+                    'error_code': 'INVALID_ORDERING'
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            fields = parse_fields(request.query_params.get('fields', ''))
+        except ValueError as e:
+            return Response(
+                {'error': str(e), 'error_code': 'INVALID_FIELDS'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         # Filters
         filters = {}
@@ -60,8 +103,65 @@ class ResourceListView(APIView):
         if request.query_params.get('status'):
             filters['status'] = request.query_params.get('status')
         if request.query_params.get('tags'):
-            filters['tags'] = request.query_params.get('tags').split(',')
+            tags = {tag.strip() for tag in request.query_params.get('tags').split(',')}
+            tags.discard('')
+            if tags:
+                filters['tags'] = sorted(tags)
+        
+        # Serve identical (normalized) queries from the listing cache
+        if use_cursor:
+            cache_params = {'cursor': cursor or None, 'include_count': include_count}
+        else:
+            cache_params = {'page': page}
+        cache_params.update({
+            'filters': filters,
+            'search': search,
+            'ordering': ordering,
+            'page_size': page_size,
+            'fields': fields,
+        })
         
+        # Cached pages are shared by all users; user_has_voted is filled in per request
+        cached, cache_key = get_cached_list(cache_params)
+        if cached is not None:
+            etag = user_etag(request, cached['etag'])
+            unchanged = not_modified(request, etag, cached['last_modified'])
+            if unchanged is not None:
+                return unchanged
+            VoteService.mark_user_votes(request.user, cached['data']['results'])
+            response = Response(cached['data'], headers={'X-Cache': 'HIT'})
+            return set_validators(response, etag, cached['last_modified'])
+        
+        # Validators: normalized query + most recent catalog change (resource, version and owner MAX queries)
+        last_modified = ResourceService.get_catalog_last_modified()
+        etag = build_etag(
+            json.dumps(cache_params, sort_keys=True, default=str),
+            last_modified.isoformat() if last_modified else '',
+        )
+        unchanged = not_modified(request, user_etag(request, etag), last_modified)
+        if unchanged is not None:
+            return unchanged
+        
+        if use_cursor:
+            try:
+                response_data = self._get_cursor_page(
+                    filters, search, ordering, cursor, page_size, include_count, fields
+                )
+            except ValueError as e:
+                return Response(
+                    {'error': str(e), 'error_code': 'INVALID_CURSOR'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        else:
+            response_data = self._get_page(filters, search, ordering, page, page_size, fields)
+        
+        set_cached_list(cache_key, {'data': response_data, 'etag': etag, 'last_modified': last_modified})
+        VoteService.mark_user_votes(request.user, response_data['results'])
+        response = Response(response_data, headers={'X-Cache': 'MISS'})
+        return set_validators(response, user_etag(request, etag), last_modified)
+    
+    def _get_page(self, filters, search, ordering, page, page_size, fields):
+        """Page-number variant of the listing."""
         # Call service
         result = ResourceService.list_resources(
             filters=filters,
@@ -69,52 +169,160 @@ class ResourceListView(APIView):
             ordering=ordering,
             page=page,
             page_size=page_size,
+            as_rows=True,
+            fields=fields,
         )
         
-        # Serialize results
-        # Annotate votes_count for each resource
-        resource_ids = [r.id for r in result['results']]
-        votes_counts = dict(
-            Resource.objects.filter(id__in=resource_ids)
-            .annotate(votes_count_annotated=Count('votes'))
-            .values_list('id', 'votes_count_annotated')
-        )
-        
-        # Attach votes_count to each resource
-        for resource in result['results']:
-            resource.votes_count_annotated = votes_counts.get(resource.id, 0)
-        
-        serializer = ResourceListSerializer(result['results'], many=True)
-        
-        return Response({
-            'results': serializer.data,
+        # Rows are already serialized by the values() fast path
+        return {
+            'results': result['results'],
             'count': result['count'],
             'page': result['page'],
             'page_size': result['page_size'],
             'has_next': result['has_next'],
             'has_previous': result['has_previous'],
+        }
+    
+    def _get_cursor_page(self, filters, search, ordering, cursor, page_size, include_count, fields):
+        """Keyset-paginated variant of the listing (constant cost per page)."""
+        result = ResourceService.list_resources_cursor(
+            filters=filters,
+            search=search if search else None,
+            ordering=ordering,
+            cursor=cursor or None,
+            page_size=page_size,
+            include_count=include_count,
+            as_rows=True,
+            fields=fields,
+        )
+        
+        response_data = {
+            'results': result['results'],
+            'next': result['next'],
+            'previous': result['previous'],
+            'page_size': result['page_size'],
+            'has_next': result['has_next'],
+            'has_previous': result['has_previous'],
+        }
+        if include_count:
+            response_data['count'] = result['count']
+        
+        return response_data
+
+
+class ResourceListCacheStatsView(APIView):
+    """
+    Hit/miss counters of the listing cache (Admin only).
+    
+    GET /api/resources/cache-stats/
+    
+    `scope` is 'shared' when the counters cover every worker (Redis in
+    production) and 'process' when they only cover the worker that answered
+    (locmem).
+    
+    US-05: Explorar Recursos
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        if not request.user.has_admin_access():
+            return Response(
+                {'error': 'Only administrators can view cache statistics', 'error_code': 'PERMISSION_DENIED'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        return Response(get_list_cache_stats(), status=status.HTTP_200_OK)
+
+
+class ResourceSuggestView(APIView):
+    """
+    Autocomplete suggestions for the search box.
+    
+    GET /api/resources/suggest/?q=<partial text>
+    
+    Query params:
+        - q (str): Partial search text (at least 2 characters)
+        - limit (int): Max suggestions per group (default: 8, max: 20)
+    
+    Returns lightweight title/tag matches (typo tolerant), not full resources.
+    
+    US-06: Buscar y Filtrar
+    """
+    
+    permission_classes = [AllowAny]
+    
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 8)), 20))
+        except ValueError:
+            limit = 8
+        
+        if len(query) < 2:
+            return Response({'query': query, 'results': [], 'tags': []})
+        
+        result = suggest(query, limit=limit)
+        
+        return Response({
+            'query': query,
+            'results': result['results'],
+            'tags': result['tags'],
         })
 
 
 class ResourceDetailView(APIView):
     """
-    Get resource detail by ID.
+    Get or soft-delete a resource by ID.
     
     GET /api/resources/{id}/
+    DELETE /api/resources/{id}/ (owner or admin; sets deleted_at)
+    
+    The serialized payload is cached per resource and invalidated by the
+    write paths (create, validate, fork, vote, delete). See apps/resources/cache.py.
+    user_has_voted is added per request (one indexed lookup when authenticated).
+    Supports conditional GET (ETag / Last-Modified -> 304 Not Modified).
     
     US-07: Ver Detalle
     """
     
     permission_classes = [AllowAny]  # Anonymous users can view
     
+    def get_permissions(self):
+        if self.request.method == 'DELETE':
+            return [IsAuthenticated()]
+        return super().get_permissions()
+    
     def get(self, request, resource_id):
+        cached, stamp = get_cached_detail(resource_id)
+        if cached is not None:
+            return self._respond(request, cached)
+        
+        freshness = ResourceService.get_detail_freshness(resource_id)
+        if freshness is None:
+            return Response(
+                {'error': 'Resource not found', 'error_code': 'RESOURCE_NOT_FOUND'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        etag = build_etag(
+            resource_id,
+            freshness['latest_version_id'],
+            freshness['votes_count'],
+            freshness['forks_count'],
+            freshness['owner_updated_at'].isoformat(),
+            freshness['last_modified'].isoformat(),
+        )
+        unchanged = not_modified(request, user_etag(request, etag), freshness['last_modified'])
+        if unchanged is not None:
+            return unchanged
+        
         try:
-            resource = Resource.objects.prefetch_related(
-                'versions',
-                'owner',
+            resource = Resource.objects.select_related(
+                'latest_version',
+                'owner'
+            ).prefetch_related(
                 'owner__roles'
-            ).annotate(
-                votes_count_annotated=Count('votes')
             ).get(id=resource_id, deleted_at__isnull=True)
         except Resource.DoesNotExist:
             return Response(
@@ -123,7 +331,36 @@ class ResourceDetailView(APIView):
             )
         
         serializer = ResourceDetailSerializer(resource)
-        return Response(serializer.data)
+        cached = {'data': serializer.data, 'etag': etag, 'last_modified': freshness['last_modified']}
+        set_cached_detail(resource_id, stamp, cached)
+        return self._respond(request, cached)
+    
+    def _respond(self, request, cached):
+        """Answer from a cached entry: 304 if the client is current, else the payload (+ user_has_voted)."""
+        etag = user_etag(request, cached['etag'])
+        unchanged = not_modified(request, etag, cached['last_modified'])
+        if unchanged is not None:
+            return unchanged
+        
+        VoteService.mark_user_votes(request.user, [cached['data']])
+        return set_validators(Response(cached['data']), etag, cached['last_modified'])
+    
+    def delete(self, request, resource_id):
+        try:
+            ResourceService.soft_delete_resource(request.user, resource_id)
+        except ValueError as e:
+            error_message = str(e)
+            if 'only the owner' in error_message.lower():
+                return Response(
+                    {'error': error_message, 'error_code': 'PERMISSION_DENIED'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            return Response(
+                {'error': error_message, 'error_code': 'RESOURCE_NOT_FOUND'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class ResourceCreateView(APIView):
@@ -157,12 +394,11 @@ class ResourceCreateView(APIView):
             )
             
             # Serialize response
-            resource = Resource.objects.prefetch_related(
-                'versions',
-                'owner',
+            resource = Resource.objects.select_related(
+                'latest_version',
+                'owner'
+            ).prefetch_related(
                 'owner__roles'
-            ).annotate(
-                votes_count_annotated=Count('votes')
             ).get(id=resource.id)
             
             detail_serializer = ResourceDetailSerializer(resource)
@@ -294,6 +530,7 @@ class VersionHistoryView(APIView):
     
     Returns all versions ordered by creation date (newest first).
     Public endpoint (no authentication required).
+    Supports conditional GET (ETag / Last-Modified -> 304 Not Modified).
     
     US-22: Historial de Versiones
     """
@@ -302,16 +539,28 @@ class VersionHistoryView(APIView):
     
     def get(self, request, resource_id):
         try:
+            freshness = ResourceService.get_version_history_freshness(resource_id)
+            last_modified = freshness['last_modified']
+            etag = build_etag(
+                resource_id,
+                freshness['count'],
+                last_modified.isoformat() if last_modified else '',
+            )
+            unchanged = not_modified(request, etag, last_modified)
+            if unchanged is not None:
+                return unchanged
+            
             versions = ResourceService.get_version_history(resource_id)
             
             # Serialize versions
             serializer = VersionHistorySerializer(versions, many=True)
             
-            return Response({
+            response = Response({
                 'resource_id': resource_id,
-                'count': versions.count(),
+                'count': freshness['count'],
                 'versions': serializer.data
             }, status=status.HTTP_200_OK)
+            return set_validators(response, etag, last_modified)
         
         except ValueError as e:
             error_message = str(e)
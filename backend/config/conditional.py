@@ -0,0 +1,54 @@
+"""
+HTTP conditional GET helpers (ETag / Last-Modified) for API views.
+
+Views compute validators from cheap timestamp/counter queries, call
+not_modified() before running the expensive queries, and stamp the final
+response with set_validators().
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+def build_etag(*parts):
+    """Build a strong ETag from the given values."""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'"{digest}"'
+
+
+def user_etag(request, etag):
+    """Scope a shared ETag to the requesting user (for payloads with per-user fields)."""
+    if request.user.is_authenticated:
+        return build_etag(etag, request.user.id)
+    return etag
+
+
+def _timestamp(last_modified):
+    return int(last_modified.timestamp()) if last_modified else None
+
+
+def not_modified(request, etag, last_modified=None):
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+    
+    Returns:
+        HttpResponse or None: A 304 response (with validators set) if the
+        client's copy is current, None if the view must build the body.
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=_timestamp(last_modified))
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    """Attach ETag/Last-Modified and ask clients to revalidate before reuse."""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(_timestamp(last_modified))
+    patch_cache_control(response, no_cache=True)
+    # Bodies may differ per user (JWT in the Authorization header)
+    patch_vary_headers(response, ['Authorization'])
+    return response
@@ -0,0 +1,33 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor is a compact JSON payload (sort key, id, ...) encoded as unpadded
+URL-safe base64. Endpoints validate the decoded payload themselves.
+"""
+
+import base64
+import binascii
+import json
+
+
+def encode_cursor(payload):
+    """Encode a JSON-serializable dict as an opaque cursor string."""
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor().
+    
+    Raises:
+        ValueError: If the cursor is not valid base64-encoded JSON object
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError, binascii.Error):
+        raise ValueError('Invalid cursor')
+    if not isinstance(payload, dict):
+        raise ValueError('Invalid cursor')
+    return payload
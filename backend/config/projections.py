@@ -0,0 +1,81 @@
+"""
+Serializer-free row projection for hot read endpoints.
+
+A Projection declares the output keys, the values_list() lookup feeding each
+key and an optional converter that mirrors the DRF field's
+to_representation(). Rows are fetched as tuples and turned into dicts
+without instantiating models or serializer fields.
+"""
+
+from django.utils import timezone
+
+
+def format_uuid(value):
+    """Same output as serializers.UUIDField."""
+    return None if value is None else str(value)
+
+
+def format_datetime(value):
+    """Same output as serializers.DateTimeField (current timezone, ISO 8601)."""
+    if value is None:
+        return None
+    value = value.astimezone(timezone.get_current_timezone()).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+class Projection:
+    """
+    Precompiled mapping from a values_list() row slice to a dict.
+    
+    Args:
+        fields (list): (key, lookup, converter or None) in output order. The
+            lookup may be a tuple of lookups; the converter then receives one
+            argument per column.
+        prefix (str): Lookup prefix for related models (e.g. 'owner__')
+    """
+    
+    def __init__(self, fields, prefix=''):
+        self.fields = tuple(fields)
+        self.prefix = prefix
+        self.keys = tuple(key for key, _, _ in self.fields)
+        
+        lookups = []
+        positions = []
+        converters = []
+        combined = []
+        for index, (_, lookup, converter) in enumerate(self.fields):
+            columns = lookup if isinstance(lookup, tuple) else (lookup,)
+            first = len(lookups)
+            lookups.extend(f'{prefix}{column}' for column in columns)
+            positions.append(first)
+            if len(columns) > 1:
+                combined.append((index, tuple(range(first, first + len(columns))), converter))
+            elif converter is not None:
+                converters.append((index, converter))
+        
+        self.lookups = tuple(lookups)
+        self._positions = tuple(positions)
+        self._converters = tuple(converters)
+        self._combined = tuple(combined)
+    
+    def __len__(self):
+        """Number of columns this projection reads."""
+        return len(self.lookups)
+    
+    def subset(self, keys):
+        """Return a projection restricted to `keys` (declaration order is kept)."""
+        return Projection([field for field in self.fields if field[0] in keys], prefix=self.prefix)
+    
+    def build(self, row):
+        """Convert one row (or row slice) into a dict."""
+        if len(self._positions) == len(self.lookups):
+            values = list(row)
+        else:
+            values = [row[position] for position in self._positions]
+        for index, converter in self._converters:
+            values[index] = converter(values[index])
+        for index, columns, converter in self._combined:
+            values[index] = converter(*(row[column] for column in columns))
+        return dict(zip(self.keys, values))
@@ -0,0 +1,229 @@
+"""
+In-process publish/subscribe broker for server-push endpoints.
+
+Publishers send JSON-serializable dicts to named channels; each subscriber
+reads its channel through a bounded queue. The backend is selected with
+PUBSUB_BACKEND (dotted path):
+
+- InMemoryBroker delivers within the current process (tests, runserver,
+  single-process deployments).
+- PostgresBroker publishes with NOTIFY and runs one LISTEN connection per
+  process that feeds the local subscribers, so every gunicorn worker sees
+  messages published by any other worker.
+
+Backpressure: a subscriber that falls PUBSUB_QUEUE_SIZE messages behind has
+its backlog dropped and is flagged `overflowed`; the consumer resynchronizes
+from the database instead of the process buffering without bound.
+"""
+
+import json
+import logging
+import queue
+import select
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+def get_queue_size():
+    """Maximum number of undelivered messages per subscriber."""
+    return getattr(settings, 'PUBSUB_QUEUE_SIZE', 100)
+
+
+class Subscription:
+    """
+    One consumer's view of a channel.
+    
+    Args:
+        broker (InMemoryBroker): Broker that feeds this subscription
+        channel (str): Channel name
+        maxsize (int): Queue bound (see module docstring)
+    """
+    
+    def __init__(self, broker, channel, maxsize):
+        self.broker = broker
+        self.channel = channel
+        self.overflowed = False
+        self._queue = queue.Queue(maxsize=maxsize)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def put(self, message):
+        """Enqueue a message without blocking the publisher."""
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.drain()
+            self.overflowed = True
+    
+    def get(self, timeout=None):
+        """Return the next message, or None if none arrived within `timeout` seconds."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def drain(self):
+        """Discard every pending message."""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+    
+    def close(self):
+        """Stop receiving messages."""
+        self.broker.unsubscribe(self)
+
+
+class InMemoryBroker:
+    """Fan messages out to the subscribers of the current process."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+    
+    def subscribe(self, channel):
+        """
+        Start receiving the messages published to `channel`.
+        
+        Returns:
+            Subscription: Close it (or use it as a context manager) when done
+        """
+        subscription = Subscription(self, channel, get_queue_size())
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+    
+    def publish(self, channel, message):
+        """Send `message` (a JSON-serializable dict) to one channel."""
+        self.publish_many([channel], message)
+    
+    def publish_many(self, channels, message):
+        """Send the same message to several channels."""
+        # Round-trip through JSON so messages behave like the Postgres backend's
+        self.deliver(channels, json.loads(json.dumps(message)))
+    
+    def deliver(self, channels, message):
+        """Hand a message to the local subscribers of `channels`."""
+        with self._lock:
+            targets = [
+                subscription
+                for channel in channels
+                for subscription in self._subscriptions.get(channel, ())
+            ]
+        for subscription in targets:
+            subscription.put(message)
+
+
+class PostgresBroker(InMemoryBroker):
+    """
+    Cross-process broker over Postgres LISTEN/NOTIFY.
+    
+    NOTIFY is transactional: a message published inside a transaction is
+    delivered when it commits and dropped if it rolls back. Payloads are
+    limited to 8000 bytes by Postgres, so publish_many() splits long channel
+    lists over several NOTIFYs.
+    """
+    
+    PG_CHANNEL = 'app_pubsub'
+    MAX_PAYLOAD = 7500
+    POLL_SECONDS = 5
+    
+    def __init__(self, using='default'):
+        super().__init__()
+        self.using = using
+        self._listener = None
+    
+    def subscribe(self, channel):
+        self._ensure_listener()
+        return super().subscribe(channel)
+    
+    def publish_many(self, channels, message):
+        data = json.dumps(message, separators=(',', ':'))
+        
+        payloads = []
+        batch = []
+        size = len(data)
+        for channel in channels:
+            if batch and size + len(channel) + 4 > self.MAX_PAYLOAD:
+                payloads.append(self._payload(batch, data))
+                batch = []
+                size = len(data)
+            batch.append(channel)
+            size += len(channel) + 4
+        if batch:
+            payloads.append(self._payload(batch, data))
+        
+        with connections[self.using].cursor() as cursor:
+            for payload in payloads:
+                cursor.execute('SELECT pg_notify(%s, %s)', [self.PG_CHANNEL, payload])
+    
+    @staticmethod
+    def _payload(channels, data):
+        return f'{{"c":{json.dumps(channels, separators=(",", ":"))},"m":{data}}}'
+    
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='pubsub-listener', daemon=True)
+                self._listener.start()
+    
+    def _listen(self):
+        """Receive NOTIFYs on a dedicated connection (reconnecting on errors)."""
+        while True:
+            pg_connection = None
+            try:
+                wrapper = connections[self.using]
+                pg_connection = wrapper.get_new_connection(wrapper.get_connection_params())
+                pg_connection.autocommit = True
+                with pg_connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN {self.PG_CHANNEL}')
+                
+                while True:
+                    if select.select([pg_connection], [], [], self.POLL_SECONDS) == ([], [], []):
+                        continue
+                    pg_connection.poll()
+                    while pg_connection.notifies:
+                        payload = json.loads(pg_connection.notifies.pop(0).payload)
+                        self.deliver(payload['c'], payload['m'])
+            except Exception:
+                logger.exception('Pub/sub listener failed, reconnecting')
+                time.sleep(1)
+            finally:
+                if pg_connection is not None:
+                    try:
+                        pg_connection.close()
+                    except Exception:
+                        pass
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """Return the process-wide broker configured by PUBSUB_BACKEND."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(getattr(settings, 'PUBSUB_BACKEND', 'config.pubsub.InMemoryBroker'))()
+    return _broker
@@ -0,0 +1,42 @@
+"""
+JSON renderer backed by orjson, with the stdlib encoder as fallback.
+
+Output matches rest_framework.renderers.JSONRenderer (compact UTF-8, DRF
+date/time and UUID formats, escaped U+2028/U+2029). orjson is optional:
+without it, or when indented output is requested, DRF's renderer is used.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Date/times go through DRF's encoder ('Z' suffix for UTC) instead of orjson's own format
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+_drf_encoder = JSONEncoder()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Drop-in replacement for DRF's JSONRenderer."""
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        try:
+            ret = orjson.dumps(data, default=_drf_encoder.default, option=ORJSON_OPTIONS)
+        except (orjson.JSONEncodeError, TypeError):
+            # e.g. integers beyond 64 bits: let the stdlib encoder decide
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        # Same as JSONRenderer: keep the output safe to embed in <script> tags
+        if b'\xe2\x80' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -24,6 +24,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Trigram lookups (autocomplete)
     
     # Third party
     'rest_framework',
@@ -35,6 +36,7 @@ INSTALLED_APPS = [
     'apps.authentication',
     'apps.resources',
     'apps.interactions',
+    'apps.outbox',
     'apps.validation',
     'apps.notifications',
 ]
@@ -82,6 +84,57 @@ DATABASES = {
     )
 }
 
+# Cache (locmem by default; set CACHE_BACKEND/CACHE_LOCATION for a shared backend, e.g. Redis)
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='bioai-hub'),
+    }
+}
+
+# Seconds a serialized resource detail response stays cached (invalidated on writes)
+RESOURCE_DETAIL_CACHE_TIMEOUT = config('RESOURCE_DETAIL_CACHE_TIMEOUT', default=300, cast=int)
+
+# Seconds a listing page (GET /api/resources/) stays cached; any resource write also drops it
+RESOURCE_LIST_CACHE_TIMEOUT = config('RESOURCE_LIST_CACHE_TIMEOUT', default=30, cast=int)
+
+# Seconds a user's resolved role names stay cached; role assignment changes also drop them
+ROLE_CACHE_TIMEOUT = config('ROLE_CACHE_TIMEOUT', default=60, cast=int)
+
+# Seconds a user's full set of voted resources stays cached for user_has_voted
+# (0 = disabled: one page-scoped query per request); every toggle drops it
+USER_VOTES_CACHE_TIMEOUT = config('USER_VOTES_CACHE_TIMEOUT', default=0, cast=int)
+
+# Hours during which repeated events (e.g. forks of one resource) merge into one unread notification
+NOTIFICATION_COALESCE_WINDOW_HOURS = config('NOTIFICATION_COALESCE_WINDOW_HOURS', default=24, cast=int)
+
+# `manage.py prune_notifications`: days read notifications stay in the live table and
+# notifications kept per user (0 disables either rule; unread ones are never pruned)
+NOTIFICATION_RETENTION_DAYS = config('NOTIFICATION_RETENTION_DAYS', default=90, cast=int)
+NOTIFICATION_MAX_PER_USER = config('NOTIFICATION_MAX_PER_USER', default=0, cast=int)
+
+# Outbox worker (`manage.py run_outbox_worker`): attempts before a message is marked failed
+# and the first retry delay in seconds (doubles on every attempt, max 1 hour)
+OUTBOX_MAX_ATTEMPTS = config('OUTBOX_MAX_ATTEMPTS', default=5, cast=int)
+OUTBOX_RETRY_BASE_SECONDS = config('OUTBOX_RETRY_BASE_SECONDS', default=30, cast=int)
+
+# Trending ordering: hours for a vote/fork to lose half its weight (run
+# `manage.py refresh_trending_scores` after changing it; the score epoch moves by itself)
+TRENDING_HALF_LIFE_HOURS = config('TRENDING_HALF_LIFE_HOURS', default=48, cast=int)
+
+# Pub/sub broker for server-push endpoints (config.pubsub.PostgresBroker shares events
+# across worker processes) and max undelivered messages per subscriber
+PUBSUB_BACKEND = config('PUBSUB_BACKEND', default='config.pubsub.InMemoryBroker')
+PUBSUB_QUEUE_SIZE = config('PUBSUB_QUEUE_SIZE', default=100, cast=int)
+
+# Notification SSE stream: heartbeat interval and max connection length (seconds)
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = config('NOTIFICATION_STREAM_HEARTBEAT_SECONDS', default=15, cast=int)
+NOTIFICATION_STREAM_MAX_SECONDS = config('NOTIFICATION_STREAM_MAX_SECONDS', default=300, cast=int)
+
+# Open notification streams per worker process; each holds a thread, keep it below
+# gunicorn's --threads so regular requests are still served
+NOTIFICATION_STREAM_MAX_PER_PROCESS = config('NOTIFICATION_STREAM_MAX_PER_PROCESS', default=8, cast=int)
+
 # Custom User Model
 AUTH_USER_MODEL = 'authentication.User'
 
@@ -119,6 +172,9 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Full-text search (PostgreSQL text search configuration for resource search)
+RESOURCE_SEARCH_CONFIG = config('RESOURCE_SEARCH_CONFIG', default='english')
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -137,7 +193,7 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ),
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'config.renderers.FastJSONRenderer',  # orjson when installed, stdlib otherwise
     ),
     'DEFAULT_PARSER_CLASSES': (
         'rest_framework.parsers.JSONParser',
@@ -26,3 +26,15 @@ EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 # Logging: Production level
 LOGGING['root']['level'] = 'WARNING'
 LOGGING['loggers']['apps']['level'] = 'INFO'
+
+# Several gunicorn workers: share notification stream events through Postgres LISTEN/NOTIFY
+PUBSUB_BACKEND = config('PUBSUB_BACKEND', default='config.pubsub.PostgresBroker')
+
+# Several gunicorn workers plus the outbox worker: cache stamps, listing generations
+# and counters must be visible to every process, so production uses a shared cache
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.redis.RedisCache'),
+        'LOCATION': config('CACHE_LOCATION', default=config('REDIS_URL', default='redis://redis:6379/0')),
+    }
+}
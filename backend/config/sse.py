@@ -0,0 +1,117 @@
+"""
+Server-Sent Events (text/event-stream) helpers.
+
+Views return a StreamingHttpResponse built by event_stream_response() from
+a generator of format_event()/format_comment() chunks. EventStreamRenderer
+lets DRF accept `Accept: text/event-stream` during content negotiation (and
+render error payloads as JSON). StreamSlots caps the streams open at once
+in a worker process.
+"""
+
+import json
+import threading
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+
+
+class EventStreamRenderer(JSONRenderer):
+    """Negotiates text/event-stream; non-streamed (error) bodies stay JSON."""
+    
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+
+
+def format_event(event, data, retry=None):
+    """
+    Encode one SSE message.
+    
+    Args:
+        event (str): Event name (the EventSource listener type)
+        data (dict): JSON-serializable payload
+        retry (int, optional): Reconnection delay for the client, in milliseconds
+    
+    Returns:
+        bytes: The encoded message
+    """
+    lines = []
+    if retry is not None:
+        lines.append(f'retry: {retry}')
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data, separators=(",", ":"))}')
+    return ('\n'.join(lines) + '\n\n').encode('utf-8')
+
+
+def format_comment(text):
+    """Encode an SSE comment (ignored by clients; used as a heartbeat)."""
+    return f': {text}\n\n'.encode('utf-8')
+
+
+class StreamSlots:
+    """
+    Per-process count of open streams, capped by the caller.
+    
+    Under gunicorn's gthread worker every open stream holds one of the
+    worker's threads until it ends, so the cap must stay below --threads to
+    leave threads for regular requests.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+    
+    def acquire(self, limit):
+        """Take a slot; returns False (without waiting) when `limit` streams are already open."""
+        with self._lock:
+            if self.open >= limit:
+                return False
+            self.open += 1
+            return True
+    
+    def release(self):
+        with self._lock:
+            self.open -= 1
+
+
+class _ClosingIterator:
+    """Iterator calling on_close() once when the response is closed (finished or disconnected)."""
+    
+    def __init__(self, iterator, on_close):
+        self._iterator = iterator
+        self._on_close = on_close
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        return next(self._iterator)
+    
+    def close(self):
+        if self._on_close is None:
+            return
+        on_close, self._on_close = self._on_close, None
+        try:
+            if hasattr(self._iterator, 'close'):
+                self._iterator.close()
+        finally:
+            on_close()
+
+
+def event_stream_response(events, on_close=None):
+    """
+    Wrap an iterator of encoded chunks in a non-buffered, non-cached response.
+    
+    Args:
+        events (iterator): Encoded chunks
+        on_close (callable, optional): Called once when the server closes the response
+    
+    Returns:
+        StreamingHttpResponse: The response
+    """
+    if on_close is not None:
+        events = _ClosingIterator(iter(events), on_close)
+    response = StreamingHttpResponse(events, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,80 @@
+"""
+Shared pytest fixtures.
+"""
+
+import re
+from collections import Counter
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Database changes are rolled back between tests; drop cached responses too."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+# Literals that differ between otherwise identical statements (strings, UUID hex, numbers)
+_SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b[0-9a-f]{32}\b|\b\d+(?:\.\d+)?\b")
+
+
+def _sql_shape(sql):
+    """Normalize a statement so per-row repetitions of the same query compare equal."""
+    return _SQL_LITERALS.sub('?', sql)
+
+
+def _run_and_capture(request):
+    # Measure cold: response/role caches would otherwise hide per-row queries
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = request()
+    
+    status_code = getattr(response, 'status_code', 200)
+    assert status_code < 400, f'Request failed with {status_code}: {getattr(response, "data", response)}'
+    return [query['sql'] for query in context.captured_queries]
+
+
+@pytest.fixture
+def assert_constant_queries(db):
+    """
+    N+1 guard: check that a request costs the same number of queries for 1 and N rows.
+    
+    Usage:
+        def test_list(assert_constant_queries, client):
+            assert_constant_queries(
+                seed=lambda count: make_resources(count),
+                request=lambda: client.get('/api/resources/'),
+            )
+    
+    `seed(count)` must add `count` more rows to whatever the request returns;
+    it is called with 1, then with n - 1. On failure, the statements whose
+    repetitions grew with N are listed.
+    """
+    def check(seed, request, n=50):
+        seed(1)
+        small = _run_and_capture(request)
+        seed(n - 1)
+        large = _run_and_capture(request)
+        
+        if len(large) <= len(small):
+            return
+        
+        small_shapes = Counter(_sql_shape(sql) for sql in small)
+        large_shapes = Counter(_sql_shape(sql) for sql in large)
+        grown = [
+            f'  x{count} (was x{small_shapes[shape]}): {shape}'
+            for shape, count in large_shapes.most_common()
+            if count > small_shapes[shape]
+        ]
+        pytest.fail(
+            f'Query count grows with the number of rows: {len(small)} for 1 row, '
+            f'{len(large)} for {n} rows. Repeated statements:\n' + '\n'.join(grown),
+            pytrace=False,
+        )
+    
+    return check